@@ -1,15 +1,30 @@
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import FileResponse
+# Imported first so startup timings are measured from process start
+from warmup import startup_report, start_warm_up, PROCESS_START
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+import asyncio
+import json
+import time
 import uvicorn
 import os
 
 # Import our components
-from news_scraper import get_news_articles
-from sentiment_analysis import process_articles
-from comparative_analysis import analyze_articles
-from tts import TextToSpeech
+from sentiment_analysis import model_registry
+from inference_cache import get_inference_cache
+from pipeline import NoArticlesError, budget_deadline, iter_analysis, run_batch_analysis
+from jobs import job_manager
+from result_cache import ResultCache, normalize_company
+from tts import AudioStore
+from audio_tasks import audio_task_manager, PENDING, FAILED
+from comparative_analysis import chart_cache, CHART_FORMATS
+from history_store import get_history_store
+from article_cache import get_article_cache
+from news_scraper import DeadlineExceeded, circuit_breaker, get_parse_pool
+from metrics import registry
+
+startup_report.record("import api modules", time.perf_counter() - PROCESS_START)
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -18,14 +33,92 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Finished analyses per company, shared by concurrent and repeated requests; results with
+# articles cut short by a latency budget are only shared while in flight, never cached
+analysis_cache = ResultCache(cacheable=lambda result: not result.get("partial"))
+
+# Reported with status 504 when a latency budget runs out before there is a result
+BUDGET_EXHAUSTED = "Latency budget exhausted before the analysis finished"
+
+# Largest watchlist accepted by /analyze/batch
+MAX_BATCH_COMPANIES = int(os.environ.get("MAX_BATCH_COMPANIES", 100))
+
+# Content-addressed store of generated audio
+audio_store = AudioStore()
+
 class AnalysisRequest(BaseModel):
     company: str
     generate_audio: bool = True
+    include_timings: bool = False
+    latency_budget_ms: Optional[int] = None
+
+class BatchAnalysisRequest(BaseModel):
+    companies: List[str]
+    generate_audio: bool = False
+
+class BatchAnalysisResponse(BaseModel):
+    companies: Dict[str, Dict]
+    comparison: Dict
+    stats: Dict
 
 class AnalysisResponse(BaseModel):
     articles: List[Dict]
     sentiment_analysis: Dict
     audio_file: Optional[str] = None
+    audio_status: Optional[str] = None
+    timings: Optional[Dict] = None
+    partial: bool = False
+
+def cache_metrics() -> Dict[Tuple[str, str], float]:
+    """Lookup counts of every cache, read when /metrics is scraped"""
+    inference = get_inference_cache().stats()
+    articles = get_article_cache().stats()
+    analyses = analysis_cache.stats()["lookups"]
+    values = {
+        ("inference", "hit"): inference["hits"] + inference["persistent_hits"],
+        ("inference", "miss"): inference["misses"],
+        ("article", "hit"): articles["hits"],
+        ("article", "miss"): articles["misses"]
+    }
+    for status, count in analyses.items():
+        values[("analysis", status.lower())] = count
+    return values
+
+def cache_hit_rates() -> Dict[Tuple[str], float]:
+    """Hit rate of every cache since start"""
+    return {
+        ("inference",): get_inference_cache().stats()["hit_rate"],
+        ("article",): get_article_cache().stats()["hit_rate"],
+        ("analysis",): analysis_cache.stats()["hit_rate"]
+    }
+
+registry.counter_callback(
+    "news_cache_lookups_total", "Cache lookups by cache and result", ["cache", "result"], cache_metrics
+)
+registry.gauge_callback("news_cache_hit_ratio", "Cache hit rate since start", ["cache"], cache_hit_rates)
+registry.gauge_callback(
+    "news_open_circuits", "Publishers skipped after repeated timeouts", ["domain"],
+    lambda: {(domain,): 1 for domain in circuit_breaker.open_domains()}
+)
+
+def check_latency_budget(request: AnalysisRequest) -> None:
+    """Reject a latency budget that is not a positive number of milliseconds"""
+    if request.latency_budget_ms is not None and request.latency_budget_ms <= 0:
+        raise HTTPException(status_code=422, detail="latency_budget_ms must be positive")
+
+@app.on_event("startup")
+def load_models():
+    """Import heavy dependencies and load the sentiment model so requests never pay for it"""
+    start_warm_up(model_registry.load)
+
+@app.on_event("shutdown")
+def stop_jobs():
+    """Cancel queued analysis jobs and audio generation and stop parse workers"""
+    job_manager.shutdown()
+    audio_task_manager.shutdown()
+    parse_pool = get_parse_pool()
+    if parse_pool is not None:
+        parse_pool.shutdown()
 
 @app.get("/")
 async def root():
@@ -34,65 +127,286 @@ async def root():
         "message": "Welcome to News Analysis API",
         "endpoints": {
             "/analyze": "POST - Analyze news for a company",
-            "/audio/{filename}": "GET - Retrieve generated audio file"
+            "/analyze/batch": "POST - Analyze and compare a list of companies together",
+            "/analyze/stream": "POST - Analyze news, streaming each article as NDJSON",
+            "/jobs": "POST - Start an analysis job and return its id",
+            "/jobs/{job_id}": "GET - Job progress and result",
+            "/audio/{filename}": "GET - Retrieve generated audio file",
+            "/audio/{filename}/status": "GET - Whether audio is pending, ready or failed",
+            "/history/{company}": "GET - Rolling sentiment trends from stored history",
+            "/charts/{chart_id}.{fmt}": "GET - Sentiment distribution chart (png or svg)",
+            "/health": "GET - Readiness, startup timings and cache statistics",
+            "/metrics": "GET - Stage timings, fallbacks and cache counters in Prometheus format"
         }
     }
 
+@app.get("/health")
+async def health():
+    """Report readiness, startup timings and cache statistics"""
+    status = model_registry.status()
+    startup = startup_report.to_dict()
+    if not (status["ready"] and startup["ready"]):
+        raise HTTPException(status_code=503, detail={"sentiment_model": status, "startup": startup})
+    return {
+        "status": "ok",
+        "sentiment_model": status,
+        "startup": startup,
+        "inference_cache": get_inference_cache().stats(),
+        "article_cache": get_article_cache().stats(),
+        "analysis_cache": analysis_cache.stats(),
+        "audio_store": audio_store.stats(),
+        "open_circuits": circuit_breaker.open_domains()
+    }
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """Expose stage and publisher latency histograms, fallback and error counters and cache statistics"""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
 @app.post("/analyze", response_model=AnalysisResponse)
-async def analyze_company(request: AnalysisRequest):
+async def analyze_company(request: AnalysisRequest, response: Response):
     """
     Analyze news articles for a company
     
     - Fetches news articles
     - Performs sentiment analysis
     - Generates comparative analysis
-    - Creates Hindi TTS audio (optional)
+    - Schedules Hindi TTS audio in the background (optional)
+    
+    Runs as a job on the worker pool and waits for it without blocking the event loop.
+    Concurrent requests for the same company and latency budget share one job, and
+    finished results are cached for any budget; the X-Cache-Status header reports
+    HIT, STALE, COALESCED or MISS.
+    With include_timings, the response carries the per-stage timing breakdown of
+    the run that produced it. The audio status is always current, and audio evicted
+    since a cached run is generated again.
+    
+    With latency_budget_ms, articles not downloaded in time (or from publishers whose
+    circuit is open after repeated timeouts) are analyzed from their RSS data; they
+    are marked partial, as is the response, which is then not cached. If the budget
+    runs out before the RSS feed arrives or before the analysis finishes, the
+    response is a 504.
     """
+    check_latency_budget(request)
+    # Measured from arrival, so time queued for a job worker counts against the budget
+    deadline = budget_deadline(request.latency_budget_ms)
+    key = (normalize_company(request.company), request.generate_audio)
+    # A complete result serves any budget; runs in flight are only shared within one budget
+    future, cache_status = analysis_cache.get_or_submit(
+        key, lambda: job_manager.submit(request.company, request.generate_audio, deadline).future,
+        variant=request.latency_budget_ms
+    )
+    response.headers["X-Cache-Status"] = cache_status
+    # Shield the shared job so one client disconnecting, or running out of budget,
+    # does not cancel it for others
+    waiting = asyncio.shield(asyncio.wrap_future(future))
     try:
-        # Fetch and analyze articles
-        print(f"\nProcessing request for company: {request.company}")
-        
-        # Get news articles
-        articles = get_news_articles(request.company)
-        if not articles:
-            raise HTTPException(status_code=404, detail="No news articles found")
-            
-        # Process sentiment
-        articles_with_sentiment = process_articles(articles)
-        
-        # Generate comparative analysis
-        analysis = analyze_articles(articles_with_sentiment)
-        
-        # Generate audio if requested
-        audio_file = None
-        if request.generate_audio:
-            tts = TextToSpeech()
-            audio_file = tts.generate_summary_audio(analysis)
-            if audio_file:
-                # Convert to relative path for response
-                audio_file = os.path.basename(audio_file)
-        
-        return {
-            "articles": articles_with_sentiment,
-            "sentiment_analysis": analysis,
-            "audio_file": audio_file
-        }
-        
+        if deadline is None:
+            result = await waiting
+        else:
+            result = await asyncio.wait_for(waiting, timeout=max(0.0, deadline - time.monotonic()))
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail=BUDGET_EXHAUSTED)
+    except NoArticlesError:
+        raise HTTPException(status_code=404, detail="No news articles found")
+    except DeadlineExceeded:
+        raise HTTPException(status_code=504, detail=BUDGET_EXHAUSTED)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    
+    # Cached results carry the audio status from when they were produced
+    if result.get("audio_file"):
+        audio_status = audio_task_manager.status(result["audio_file"])
+        if audio_status is None:
+            # Evicted since; audio is content-addressed, so this regenerates the same file
+            _, audio_status = audio_task_manager.submit_summary(result["sentiment_analysis"])
+        result = {**result, "audio_status": audio_status}
+    return result if request.include_timings else {**result, "timings": None}
+
+@app.post("/analyze/batch", response_model=BatchAnalysisResponse)
+def analyze_companies(request: BatchAnalysisRequest):
+    """
+    Analyze news for a list of companies in one pass
+    
+    Feeds and articles are fetched through one shared pool, articles found for
+    several companies are downloaded once, and sentiment runs over all of them in
+    combined batches. Returns each company's result and a cross-company comparison.
+    """
+    companies = [company for company in request.companies if company.strip()]
+    if not companies:
+        raise HTTPException(status_code=422, detail="No companies given")
+    if len(companies) > MAX_BATCH_COMPANIES:
+        raise HTTPException(status_code=422, detail=f"At most {MAX_BATCH_COMPANIES} companies per batch")
+    
+    # Declared without async so the batch runs on the thread pool, off the event loop
+    try:
+        return run_batch_analysis(companies, request.generate_audio)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/analyze/stream")
+def analyze_company_stream(request: AnalysisRequest):
+    """
+    Analyze news articles for a company, streaming results as NDJSON
+    
+    Emits one JSON object per line: an "article" event for each article as soon
+    as its sentiment is ready, then "analysis", "audio" and finally "done".
+    Failures are reported as an "error" event.
+    """
+    check_latency_budget(request)
+    deadline = budget_deadline(request.latency_budget_ms)
+    
+    def events():
+        try:
+            for event in iter_analysis(request.company, request.generate_audio, deadline=deadline):
+                yield json.dumps(event, default=str) + "\n"
+            yield json.dumps({"event": "done"}) + "\n"
+        except NoArticlesError:
+            yield json.dumps({"event": "error", "status_code": 404, "detail": "No news articles found"}) + "\n"
+        except DeadlineExceeded:
+            yield json.dumps({"event": "error", "status_code": 504, "detail": BUDGET_EXHAUSTED}) + "\n"
+        except Exception as e:
+            yield json.dumps({"event": "error", "status_code": 500, "detail": str(e)}) + "\n"
+    
+    # Starlette iterates sync generators on its thread pool, off the event loop
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+@app.post("/jobs", status_code=202)
+async def create_job(request: AnalysisRequest):
+    """Start an analysis in the background and return its job id"""
+    check_latency_budget(request)
+    job = job_manager.submit(request.company, request.generate_audio, budget_deadline(request.latency_budget_ms))
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "status_url": f"/jobs/{job.id}"
+    }
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Report per-stage progress and, once finished, the analysis result"""
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
+
+@app.get("/history/{company}")
+def get_history(company: str, windows: str = "1,7,30"):
+    """
+    Sentiment trends for a company from previously analyzed articles
+    
+    Returns aggregates for each rolling window (comma-separated days) and the daily
+    series of the longest one. Aggregates are kept up to date as articles are analyzed,
+    so this never re-scrapes or rescans articles.
+    """
+    store = get_history_store()
+    if store is None:
+        raise HTTPException(status_code=404, detail="History is disabled")
+    try:
+        days = [int(value) for value in windows.split(",") if value.strip()]
+    except ValueError:
+        raise HTTPException(status_code=422, detail="windows must be comma-separated day counts")
+    if not days or min(days) < 1 or max(days) > 3650:
+        raise HTTPException(status_code=422, detail="windows must be between 1 and 3650 days")
+    return store.trends(company, days)
+
+@app.get("/charts/{chart_id}.{fmt}")
+def get_chart(chart_id: str, fmt: str):
+    """Retrieve a sentiment distribution chart rendered in memory"""
+    if fmt not in CHART_FORMATS:
+        raise HTTPException(status_code=404, detail="Unsupported chart format")
+    
+    # Declared without async so rendering a missing format runs on the thread pool
+    image = chart_cache.get(chart_id, fmt)
+    if image is None:
+        raise HTTPException(status_code=404, detail="Chart not found")
+    
+    return Response(
+        image,
+        media_type=CHART_FORMATS[fmt],
+        headers={"ETag": f'"{chart_id}-{fmt}"', "Cache-Control": "public, max-age=86400"}
+    )
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range HTTP Range header into inclusive byte offsets.
+    
+    Returns:
+        Optional[Tuple[int, int]]: (start, end), or None if the range is unsatisfiable
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip() != "bytes" or "," in spec:
+        return None
+    start_text, _, end_text = spec.strip().partition("-")
+    try:
+        if start_text:
+            start = int(start_text)
+            end = int(end_text) if end_text else size - 1
+        else:
+            # Suffix range: the last N bytes
+            start = max(size - int(end_text), 0)
+            end = size - 1
+    except ValueError:
+        return None
+    end = min(end, size - 1)
+    if start > end or start >= size:
+        return None
+    return start, end
+
+@app.get("/audio/{filename}/status")
+async def get_audio_status(filename: str):
+    """Report whether an audio file is pending, ready or failed"""
+    status = audio_task_manager.status(filename)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Audio file not found")
+    return {"audio_file": filename, "status": status, "error": audio_task_manager.error(filename)}
 
 @app.get("/audio/{filename}")
-async def get_audio(filename: str):
-    """Retrieve generated audio file"""
-    audio_path = os.path.join("audio_files", filename)
+async def get_audio(filename: str, request: Request):
+    """Retrieve generated audio file, with ETag revalidation and byte-range support"""
+    audio_path = audio_store.lookup(filename) if os.path.basename(filename) == filename else None
     
-    if not os.path.exists(audio_path):
+    if audio_path is None:
+        status = audio_task_manager.status(filename)
+        if status == PENDING:
+            return JSONResponse(
+                {"audio_file": filename, "status": status},
+                status_code=202,
+                headers={"Retry-After": "2"}
+            )
+        if status == FAILED:
+            raise HTTPException(status_code=503, detail=audio_task_manager.error(filename))
         raise HTTPException(status_code=404, detail="Audio file not found")
+    
+    # Files are content-addressed, so the name and size identify the bytes
+    size = os.path.getsize(audio_path)
+    etag = f'"{os.path.splitext(filename)[0]}-{size}"'
+    headers = {"ETag": etag, "Accept-Ranges": "bytes", "Cache-Control": "public, max-age=86400"}
+    
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    
+    range_header = request.headers.get("range")
+    if range_header and request.headers.get("if-range", etag) == etag:
+        byte_range = parse_range(range_header, size)
+        if byte_range is None:
+            return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+        start, end = byte_range
+        with open(audio_path, "rb") as f:
+            f.seek(start)
+            content = f.read(end - start + 1)
+        return Response(
+            content,
+            status_code=206,
+            media_type="audio/mpeg",
+            headers={**headers, "Content-Range": f"bytes {start}-{end}/{size}"}
+        )
         
     return FileResponse(
         audio_path,
         media_type="audio/mpeg",
-        filename=filename
+        filename=filename,
+        headers=headers
     )
 
 if __name__ == "__main__":
@@ -1,8 +1,11 @@
 import gradio as gr
 import requests
+import io
 import json
 import os
-from typing import Tuple, Dict, Any
+import time
+from PIL import Image
+from typing import Tuple, Dict, Any, Iterator, List
 
 class NewsAnalyzer:
     def __init__(self, api_url: str = "http://localhost:8000"):
@@ -10,12 +13,12 @@ class NewsAnalyzer:
         self.api_url = api_url
         self.latest_analysis = None
         
-    def analyze_company(self, company_name: str) -> Tuple[str, str, str]:
+    def analyze_company(self, company_name: str) -> Tuple[str, Any, str]:
         """
         Analyze company news and return results
         
         Returns:
-            Tuple[str, str, str]: Summary text, visualization path, audio path
+            Tuple[str, Any, str]: Summary text, visualization image, audio path
         """
         try:
             # Call API to analyze company
@@ -29,36 +32,115 @@ class NewsAnalyzer:
             result = response.json()
             self.latest_analysis = result
             
-            # Get sentiment distribution
-            distribution = result["sentiment_analysis"]["distribution"]
-            total = sum(distribution.values())
-            distribution_text = "Sentiment Distribution:\n"
-            for sentiment, count in distribution.items():
-                percentage = (count / total) * 100
-                distribution_text += f"- {sentiment}: {percentage:.1f}%\n"
+            # Audio is generated in the background; wait for it before returning
+            self._wait_for_audio(result)
             
-            # Format summary
-            summary = (
-                f"Analysis Results for {company_name}:\n\n"
-                f"{distribution_text}\n"
-                f"Overall Trend: {result['sentiment_analysis']['overall_trend']}\n"
-                f"Average Score: {result['sentiment_analysis']['average_score']:.2f}\n\n"
-                f"Summary:\n{result['sentiment_analysis']['summary']}"
+            return self._format_results(company_name, result)
+            
+        except Exception as e:
+            error_msg = f"Error analyzing company: {str(e)}"
+            return error_msg, None, None
+    
+    def stream_company(self, company_name: str) -> Iterator[Tuple[str, Any, str]]:
+        """
+        Analyze company news, yielding partial results as articles arrive
+        
+        Yields:
+            Tuple[str, Any, str]: Summary text, visualization image, audio path
+        """
+        try:
+            response = requests.post(
+                f"{self.api_url}/analyze/stream",
+                json={"company": company_name, "generate_audio": True},
+                stream=True
             )
+            response.raise_for_status()
             
-            # Get visualization path
-            viz_path = "sentiment_distribution.png"
+            articles: List[Dict[str, Any]] = []
+            self.latest_analysis = {"articles": articles}
+            result: Dict[str, Any] = {}
             
-            # Get audio file if generated
-            audio_path = None
-            if result.get("audio_file"):
-                audio_path = os.path.join("audio_files", result["audio_file"])
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                event = json.loads(line)
+                
+                if event["event"] == "article":
+                    articles.append(event["article"])
+                    yield f"Analyzing news for {company_name}... {len(articles)} articles so far", None, None
+                elif event["event"] == "analysis":
+                    result = {
+                        "articles": event["articles"],
+                        "sentiment_analysis": event["sentiment_analysis"],
+                        "audio_file": None
+                    }
+                    self.latest_analysis = result
+                    yield self._format_results(company_name, result)
+                elif event["event"] == "audio":
+                    result["audio_file"] = event["audio_file"]
+                    result["audio_status"] = event["audio_status"]
+                elif event["event"] == "error":
+                    raise RuntimeError(event["detail"])
             
-            return summary, viz_path, audio_path
+            # Results are already shown; add the audio once it has been generated
+            if result and result.get("audio_file"):
+                self._wait_for_audio(result)
+                yield self._format_results(company_name, result)
             
         except Exception as e:
             error_msg = f"Error analyzing company: {str(e)}"
-            return error_msg, None, None
+            yield error_msg, None, None
+    
+    def _wait_for_audio(self, result: Dict[str, Any], timeout: float = 60.0) -> None:
+        """Poll the API until background audio is ready, updating result["audio_status"]"""
+        deadline = time.monotonic() + timeout
+        while result.get("audio_file") and result.get("audio_status") == "pending":
+            if time.monotonic() > deadline:
+                return
+            time.sleep(1)
+            response = requests.get(f"{self.api_url}/audio/{result['audio_file']}/status")
+            if response.status_code != 200:
+                result["audio_status"] = "failed"
+                return
+            result["audio_status"] = response.json()["status"]
+    
+    def _fetch_chart(self, chart_id: str) -> Any:
+        """Download a rendered chart from the API"""
+        response = requests.get(f"{self.api_url}/charts/{chart_id}.png")
+        response.raise_for_status()
+        return Image.open(io.BytesIO(response.content))
+    
+    def _format_results(self, company_name: str, result: Dict[str, Any]) -> Tuple[str, Any, str]:
+        """Format an analysis result as summary text, visualization image and audio path"""
+        # Get sentiment distribution
+        distribution = result["sentiment_analysis"]["distribution"]
+        total = sum(distribution.values())
+        distribution_text = "Sentiment Distribution:\n"
+        for sentiment, count in distribution.items():
+            percentage = (count / total) * 100
+            distribution_text += f"- {sentiment}: {percentage:.1f}%\n"
+        
+        # Format summary
+        summary = (
+            f"Analysis Results for {company_name}:\n\n"
+            f"{distribution_text}\n"
+            f"Overall Trend: {result['sentiment_analysis']['overall_trend']}\n"
+            f"Average Score: {result['sentiment_analysis']['average_score']:.2f}\n\n"
+            f"Summary:\n{result['sentiment_analysis']['summary']}"
+        )
+        
+        # Get the visualization rendered for this analysis
+        chart = None
+        chart_id = result["sentiment_analysis"].get("chart_id")
+        if chart_id:
+            chart = self._fetch_chart(chart_id)
+        
+        # Get audio file if generated
+        audio_path = None
+        if result.get("audio_file") and result.get("audio_status", "ready") == "ready":
+            audio_path = os.path.join("audio_files", result["audio_file"])
+        
+        return summary, chart, audio_path
     
     def get_detailed_results(self) -> str:
         """Get detailed analysis results as formatted text"""
@@ -84,15 +166,14 @@ def create_interface() -> gr.Interface:
     """Create and configure the Gradio interface"""
     analyzer = NewsAnalyzer()
     
-    def process_request(company: str) -> Tuple[str, str, str, str]:
-        """Handle interface request"""
+    def process_request(company: str) -> Iterator[Tuple[str, str, Any, str]]:
+        """Handle interface request, updating the outputs as results stream in"""
         # Analyze company
-        summary, viz_path, audio_path = analyzer.analyze_company(company)
-        
-        # Get detailed results
-        details = analyzer.get_detailed_results()
-        
-        return summary, details, viz_path, audio_path
+        for summary, chart, audio_path in analyzer.stream_company(company):
+            # Get detailed results
+            details = analyzer.get_detailed_results()
+            
+            yield summary, details, chart, audio_path
     
     # Define interface
     iface = gr.Interface(
@@ -0,0 +1,173 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import urllib.parse
+from typing import Any, Dict, Optional
+
+# Default location and limits for the on-disk article store
+DEFAULT_CACHE_PATH = os.environ.get("ARTICLE_CACHE_PATH", os.path.join("cache", "articles.sqlite3"))
+DEFAULT_TTL = float(os.environ.get("ARTICLE_CACHE_TTL", 6 * 60 * 60))        # Seconds an entry stays fresh
+DEFAULT_MAX_ENTRIES = int(os.environ.get("ARTICLE_CACHE_MAX_ENTRIES", 5000))  # Entries kept before LRU eviction
+
+# Query parameters that only track the click and never change the article
+TRACKING_PARAMS = {"ocid", "cvid", "fbclid", "gclid", "mc_cid", "mc_eid", "ref", "cmpid"}
+
+# Paths of news aggregator redirect links whose url= parameter holds the publisher's URL
+REDIRECT_PATHS = {"/news/apiclick.aspx"}
+
+def unwrap_redirect(url: str) -> str:
+    """
+    Return the publisher URL behind an aggregator redirect link.
+
+    Bing News RSS links point at www.bing.com/news/apiclick.aspx?...&url=<article>;
+    any other URL is returned unchanged.
+    """
+    parts = urllib.parse.urlsplit(url.strip())
+    if parts.path.lower() in REDIRECT_PATHS:
+        for key, value in urllib.parse.parse_qsl(parts.query):
+            if key.lower() == "url" and value.lower().startswith(("http://", "https://")):
+                return value
+    return url
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize an article URL so that the same story maps to one cache key.
+
+    Unwraps aggregator redirect links, lower-cases scheme and host, drops the
+    fragment and tracking parameters, and sorts the remaining query string.
+    """
+    parts = urllib.parse.urlsplit(unwrap_redirect(url))
+    query = [
+        (key, value)
+        for key, value in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith("utm_")
+    ]
+    path = parts.path.rstrip("/") or "/"
+    return urllib.parse.urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        path,
+        urllib.parse.urlencode(sorted(query)),
+        ""
+    ))
+
+class ArticleCache:
+    """SQLite-backed store of extracted articles keyed by normalized URL"""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: float = DEFAULT_TTL,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the cache and create its table if needed.
+
+        Args:
+            path (str): SQLite database file
+            ttl (float): Seconds before an entry is considered expired
+            max_entries (int): Maximum entries kept; least recently used are evicted
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS articles ("
+                " url TEXT PRIMARY KEY,"
+                " data TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_accessed ON articles (accessed_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, url: str) -> Optional[Dict]:
+        """
+        Look up the extracted data for a URL.
+
+        Args:
+            url (str): Article URL
+
+        Returns:
+            Optional[Dict]: Extracted title, text, summary, authors and publish_date,
+            or None if the URL is missing or expired
+        """
+        key = normalize_url(url)
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            row = conn.execute("SELECT data, created_at FROM articles WHERE url = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            if now - row[1] > self.ttl:
+                conn.execute("DELETE FROM articles WHERE url = ?", (key,))
+                self.misses += 1
+                return None
+            conn.execute("UPDATE articles SET accessed_at = ? WHERE url = ?", (now, key))
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, url: str, data: Dict) -> None:
+        """
+        Store extracted data for a URL and evict old entries if over capacity.
+
+        Args:
+            url (str): Article URL
+            data (Dict): Extracted title, text, summary, authors and publish_date
+        """
+        key = normalize_url(url)
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO articles (url, data, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(data), now, now)
+            )
+            self._evict(conn, now)
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries, then the least recently used ones above max_entries"""
+        conn.execute("DELETE FROM articles WHERE created_at < ?", (now - self.ttl,))
+        count = conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+        if count > self.max_entries:
+            conn.execute(
+                "DELETE FROM articles WHERE url IN "
+                "(SELECT url FROM articles ORDER BY accessed_at ASC LIMIT ?)",
+                (count - self.max_entries,)
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit and miss counters and the number of stored articles"""
+        with self._lock, self._connect() as conn:
+            entries = conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": entries
+            }
+
+    def clear(self) -> None:
+        """Remove every cached article"""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM articles")
+
+_default_cache: Optional[ArticleCache] = None
+_default_cache_lock = threading.Lock()
+
+def get_article_cache() -> ArticleCache:
+    """Return the process-wide article cache, creating it on first use"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ArticleCache()
+        return _default_cache
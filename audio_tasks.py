@@ -0,0 +1,133 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+import os
+import threading
+import time
+
+from tts import TextToSpeech
+
+# Background synthesis settings
+AUDIO_WORKERS = int(os.environ.get("AUDIO_WORKERS", 2))        # Summaries synthesized at once
+AUDIO_RETRIES = int(os.environ.get("AUDIO_RETRIES", 3))        # Attempts per summary
+AUDIO_RETRY_DELAY = float(os.environ.get("AUDIO_RETRY_DELAY", 1.0))  # Seconds before the first retry, doubled after
+AUDIO_FAILURES_KEPT = int(os.environ.get("AUDIO_FAILURES_KEPT", 1000))  # Failed summaries remembered for status lookups
+
+# Audio statuses
+PENDING = "pending"
+READY = "ready"
+FAILED = "failed"
+
+class AudioTaskManager:
+    """Generates summary audio in the background so responses never wait on TTS"""
+
+    def __init__(self, max_workers: int = AUDIO_WORKERS, retries: int = AUDIO_RETRIES,
+                 retry_delay: float = AUDIO_RETRY_DELAY, failures_kept: int = AUDIO_FAILURES_KEPT):
+        """
+        Initialize the manager.
+
+        Args:
+            max_workers (int): Summaries synthesized concurrently
+            retries (int): Attempts before a summary is marked failed
+            retry_delay (float): Seconds before the first retry; doubles on each attempt
+            failures_kept (int): Failed summaries remembered before the oldest are forgotten
+        """
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.failures_kept = failures_kept
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="audio")
+        self._lock = threading.Lock()
+        # Only pending and failed files; the store is the source of truth for ready ones
+        self._statuses: Dict[str, str] = {}
+        self._errors: "OrderedDict[str, str]" = OrderedDict()
+        self._tts: Optional[TextToSpeech] = None
+
+    @property
+    def tts(self) -> TextToSpeech:
+        """Shared TTS instance, created on first use"""
+        if self._tts is None:
+            self._tts = TextToSpeech()
+        return self._tts
+
+    def submit_summary(self, analysis_result: dict) -> Tuple[str, str]:
+        """
+        Schedule audio for an analysis summary.
+
+        Args:
+            analysis_result (dict): Analysis results containing summary
+
+        Returns:
+            Tuple[str, str]: Audio file name and its status ("ready" or "pending")
+        """
+        return self.submit_text(self.tts.summary_text(analysis_result))
+
+    def submit_text(self, text: str) -> Tuple[str, str]:
+        """
+        Schedule audio for text unless it is already stored or being generated.
+
+        Args:
+            text (str): Text to convert to speech
+
+        Returns:
+            Tuple[str, str]: Audio file name and its status ("ready" or "pending")
+        """
+        filename = self.tts.generate_filename(text)
+        with self._lock:
+            if self.tts.store.lookup(filename):
+                self._statuses.pop(filename, None)
+                self._errors.pop(filename, None)
+                return filename, READY
+            if self._statuses.get(filename) == PENDING:
+                return filename, PENDING
+            self._statuses[filename] = PENDING
+            self._errors.pop(filename, None)
+        self._executor.submit(self._generate, text, filename)
+        return filename, PENDING
+
+    def _generate(self, text: str, filename: str) -> None:
+        """Synthesize with retries and exponential backoff"""
+        delay = self.retry_delay
+        for attempt in range(1, self.retries + 1):
+            # text_to_speech reports failures by returning an empty path
+            if self.tts.text_to_speech(text):
+                with self._lock:
+                    self._statuses.pop(filename, None)
+                return
+            print(f"✗ Audio attempt {attempt}/{self.retries} failed for {filename}")
+            if attempt < self.retries:
+                time.sleep(delay)
+                delay *= 2
+
+        with self._lock:
+            self._statuses[filename] = FAILED
+            self._errors[filename] = f"Speech synthesis failed after {self.retries} attempts"
+            self._errors.move_to_end(filename)
+            while len(self._errors) > self.failures_kept:
+                forgotten, _ = self._errors.popitem(last=False)
+                if self._statuses.get(forgotten) == FAILED:
+                    del self._statuses[forgotten]
+
+    def status(self, filename: str) -> Optional[str]:
+        """
+        Return the status of an audio file.
+
+        Returns:
+            Optional[str]: "ready", "pending", "failed", or None if unknown
+        """
+        if self.tts.store.lookup(filename):
+            return READY
+        with self._lock:
+            # A file that was ready may since have been evicted, leaving no entry
+            return self._statuses.get(filename)
+
+    def error(self, filename: str) -> Optional[str]:
+        """Return the last error for a failed audio file"""
+        with self._lock:
+            return self._errors.get(filename)
+
+    def shutdown(self) -> None:
+        """Stop accepting work and cancel queued syntheses"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+# Shared manager used by the pipeline and the API
+audio_task_manager = AudioTaskManager()
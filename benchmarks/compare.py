@@ -0,0 +1,85 @@
+from typing import Any, Dict, List, Optional
+import argparse
+import json
+import sys
+
+# Metrics compared between runs and whether a higher value is better
+METRICS = [
+    ("p50", False),
+    ("p95", False),
+    ("throughput_per_s", True),
+    ("rss_delta_mb", False)
+]
+
+def metric(stage: Dict[str, Any], name: str) -> Optional[float]:
+    """Read a metric from a stage result, or None if the stage did not run"""
+    if "skipped" in stage or not stage.get("ok", 1):
+        return None
+    if name in stage:
+        return stage[name]
+    return stage.get("latency_ms", {}).get(name)
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """
+    Compare two benchmark results stage by stage.
+
+    Args:
+        baseline (Dict): Results from benchmarks.run for the reference build
+        current (Dict): Results from benchmarks.run for the build under test
+        threshold (float): Relative change counted as a regression, e.g. 0.1 for 10%
+
+    Returns:
+        List[Dict]: One row per stage and metric with both values, the change and a regression flag
+    """
+    rows = []
+    for stage_name, stage in current["stages"].items():
+        reference = baseline["stages"].get(stage_name)
+        if not isinstance(stage, dict) or not isinstance(reference, dict):
+            continue
+        for name, higher_is_better in METRICS:
+            before, after = metric(reference, name), metric(stage, name)
+            if before is None or after is None or before == 0:
+                continue
+            change = (after - before) / before
+            worse = -change if higher_is_better else change
+            rows.append({
+                "stage": stage_name,
+                "metric": name,
+                "baseline": before,
+                "current": after,
+                "change": round(change, 4),
+                "regression": worse > threshold
+            })
+    return rows
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    parser.add_argument("baseline", help="JSON results of the reference build")
+    parser.add_argument("current", help="JSON results of the build under test")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="Relative slowdown reported as a regression (default 0.1)")
+    args = parser.parse_args(argv)
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    if baseline.get("settings") != current.get("settings"):
+        print("Warning: runs used different settings; differences may not be comparable")
+
+    rows = compare(baseline, current, args.threshold)
+    for row in rows:
+        marker = "✗" if row["regression"] else "✓"
+        print(f"{marker} {row['stage']:<12} {row['metric']:<17} "
+              f"{row['baseline']:>12.3f} -> {row['current']:>12.3f} ({row['change']:+.1%})")
+
+    regressions = [row for row in rows if row["regression"]]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+        return 1
+    print("\nNo regressions")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+from typing import Any, Callable, Dict, List, Optional, Set
+import argparse
+import difflib
+import glob
+import json
+import os
+import re
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ARTICLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "articles")
+
+WORD = re.compile(r"\w+")
+
+def words(text: str) -> List[str]:
+    return WORD.findall(text.lower())
+
+def word_f1(reference: str, candidate: str) -> float:
+    """F1 of the word multisets of two texts (1.0 when both are empty)"""
+    ref, cand = words(reference), words(candidate)
+    if not ref and not cand:
+        return 1.0
+    counts: Dict[str, int] = {}
+    for word in ref:
+        counts[word] = counts.get(word, 0) + 1
+    overlap = 0
+    for word in cand:
+        if counts.get(word, 0) > 0:
+            counts[word] -= 1
+            overlap += 1
+    if not overlap:
+        return 0.0
+    precision, recall = overlap / len(cand), overlap / len(ref)
+    return 2 * precision * recall / (precision + recall)
+
+def author_overlap(reference: List[str], candidate: List[str]) -> float:
+    """Jaccard similarity of two author lists, ignoring case (1.0 when both are empty)"""
+    ref: Set[str] = {author.lower() for author in reference}
+    cand: Set[str] = {author.lower() for author in candidate}
+    if not ref and not cand:
+        return 1.0
+    return len(ref & cand) / len(ref | cand)
+
+def newspaper_extract(html: bytes, url: str) -> Dict[str, Any]:
+    """Parse and summarize a page the way EXTRACTION_MODE=newspaper does, without downloading"""
+    from news_scraper import parse_page
+    return parse_page(html, url, "newspaper")[0]
+
+def lean_extract(html: bytes, url: str) -> Dict[str, Any]:
+    """Parse a page the way EXTRACTION_MODE=lean does; summaries are only made without an RSS description"""
+    from news_scraper import parse_page
+    return parse_page(html, url, "lean")[0]
+
+def cpu_time(extract: Callable[[bytes, str], Dict], pages: Dict[str, bytes], repeat: int) -> Dict[str, Any]:
+    """
+    Extract every page repeat times and report CPU time per page.
+
+    Returns:
+        Dict with mean CPU ms per page and the last extraction of each page
+    """
+    outputs: Dict[str, Dict] = {}
+    started = time.process_time()
+    for _ in range(repeat):
+        for name, html in pages.items():
+            outputs[name] = extract(html, f"http://fixtures.local/articles/{name}")
+    elapsed = time.process_time() - started
+    return {
+        "cpu_ms_per_page": round(elapsed * 1000 / (repeat * len(pages)), 3),
+        "outputs": outputs
+    }
+
+def quality(reference: Dict[str, Any], candidate: Dict[str, Any]) -> Dict[str, Any]:
+    """Agreement of a lean extraction with newspaper's output for the same page"""
+    return {
+        "title_match": reference["title"].strip() == candidate["title"].strip(),
+        "date_match": (reference["publish_date"] or "")[:10] == (candidate["publish_date"] or "")[:10],
+        "author_overlap": round(author_overlap(reference["authors"], candidate["authors"]), 3),
+        "text_f1": round(word_f1(reference["text"], candidate["text"]), 3),
+        "text_similarity": round(difflib.SequenceMatcher(None, reference["text"], candidate["text"]).ratio(), 3),
+        "words": {"newspaper": len(words(reference["text"])), "lean": len(words(candidate["text"]))}
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare CPU time and output of the newspaper and lean article extractors on recorded pages."
+    )
+    parser.add_argument("--articles", default=ARTICLES_DIR, help="Directory of recorded article pages")
+    parser.add_argument("--repeat", type=int, default=20, help="Times each page is extracted")
+    parser.add_argument("--output", default=None, help="Write JSON results to this file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+    os.environ.setdefault("NLTK_OFFLINE", "1")
+
+    pages = {}
+    for path in sorted(glob.glob(os.path.join(args.articles, "*.html"))):
+        with open(path, "rb") as f:
+            pages[os.path.basename(path)] = f.read()
+    if not pages:
+        parser.error(f"no .html pages in {args.articles}")
+
+    print(f"\n=== Extracting {len(pages)} pages x {args.repeat} ===")
+    modes = {"newspaper": newspaper_extract, "lean": lean_extract}
+    runs = {}
+    for mode, extract in modes.items():
+        try:
+            runs[mode] = cpu_time(extract, pages, args.repeat)
+            print(f"✓ {mode}: {runs[mode]['cpu_ms_per_page']} CPU ms per page")
+        except Exception as e:
+            runs[mode] = {"skipped": f"{type(e).__name__}: {e}"}
+            print(f"✗ {mode}: skipped ({runs[mode]['skipped']})")
+
+    results: Dict[str, Any] = {
+        "settings": {"pages": len(pages), "repeat": args.repeat},
+        "modes": {mode: {key: value for key, value in run.items() if key != "outputs"} for mode, run in runs.items()}
+    }
+    if all("outputs" in run for run in runs.values()):
+        pages_quality = {
+            name: quality(runs["newspaper"]["outputs"][name], runs["lean"]["outputs"][name]) for name in pages
+        }
+        count = len(pages_quality)
+        results["speedup"] = round(
+            runs["newspaper"]["cpu_ms_per_page"] / runs["lean"]["cpu_ms_per_page"], 2
+        ) if runs["lean"]["cpu_ms_per_page"] else None
+        results["quality"] = {
+            "title_match_rate": round(sum(q["title_match"] for q in pages_quality.values()) / count, 3),
+            "date_match_rate": round(sum(q["date_match"] for q in pages_quality.values()) / count, 3),
+            "mean_author_overlap": round(sum(q["author_overlap"] for q in pages_quality.values()) / count, 3),
+            "mean_text_f1": round(sum(q["text_f1"] for q in pages_quality.values()) / count, 3),
+            "mean_text_similarity": round(sum(q["text_similarity"] for q in pages_quality.values()) / count, 3),
+            "pages": pages_quality
+        }
+        print(f"✓ lean is {results['speedup']}x faster; mean text F1 {results['quality']['mean_text_f1']}, "
+              f"titles {results['quality']['title_match_rate']:.0%}, dates {results['quality']['date_match_rate']:.0%}")
+
+    payload = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(payload + "\n")
+        print(f"\n✓ Results written to {args.output}")
+    else:
+        print(payload)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,365 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from benchmarks.server import FixtureServer
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Stages that can be benchmarked, in pipeline order
+STAGES = ("scrape", "sentiment", "comparative", "tts", "api")
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Linearly interpolated percentile of a list of values, or None if empty"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far, in MiB (None where unsupported)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and kilobytes elsewhere
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+
+def current_rss_mb() -> Optional[float]:
+    """Resident set size of this process right now, in MiB (None where /proc is unavailable)"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return round(pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024), 1)
+
+class RssTracker:
+    """
+    Sample this process's resident memory while a stage runs.
+
+    The process-wide peak only ever grows, so later stages would inherit earlier
+    peaks such as the model load; growth over the RSS at the start of a stage
+    is comparable across stages and builds.
+    """
+
+    def __init__(self, interval: float = 0.02):
+        """
+        Initialize the tracker.
+
+        Args:
+            interval (float): Seconds between samples
+        """
+        self.interval = interval
+        self.start: Optional[float] = None
+        self.peak: Optional[float] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self) -> None:
+        rss = current_rss_mb()
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> "RssTracker":
+        self.start = self.peak = current_rss_mb()
+        if self.start is not None:
+            self._thread = threading.Thread(target=self._run, name="bench-rss", daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._sample()
+
+    @property
+    def delta_mb(self) -> Optional[float]:
+        """Highest RSS seen while tracking minus the RSS at the start, in MiB"""
+        if self.start is None or self.peak is None:
+            return None
+        return round(self.peak - self.start, 1)
+
+def measure(func: Callable[[], Any], iterations: int, concurrency: int,
+            reset: Optional[Callable[[], None]] = None) -> Dict[str, Any]:
+    """
+    Call func repeatedly on a thread pool and summarize latency and throughput.
+
+    Args:
+        func (Callable[[], Any]): Operation to measure
+        iterations (int): Total calls
+        concurrency (int): Calls in flight at once
+        reset (Optional[Callable[[], None]]): Run before each batch of concurrent calls,
+            e.g. to clear caches
+
+    Returns:
+        Dict with call counts, latency percentiles in ms, throughput and RSS growth
+    """
+    latencies: List[float] = []
+    errors: List[str] = []
+    lock = threading.Lock()
+
+    def call(_):
+        started = time.perf_counter()
+        try:
+            func()
+        except Exception as e:
+            with lock:
+                errors.append(f"{type(e).__name__}: {e}")
+            return
+        elapsed = (time.perf_counter() - started) * 1000
+        with lock:
+            latencies.append(elapsed)
+
+    reset_seconds = 0.0
+    wall_started = time.perf_counter()
+    with RssTracker() as rss, ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="bench") as pool:
+        if reset is None:
+            list(pool.map(call, range(iterations)))
+        else:
+            # Reset between batches, never while another call of the stage is running
+            for batch_start in range(0, iterations, concurrency):
+                reset_started = time.perf_counter()
+                reset()
+                reset_seconds += time.perf_counter() - reset_started
+                list(pool.map(call, range(batch_start, min(batch_start + concurrency, iterations))))
+    wall = time.perf_counter() - wall_started - reset_seconds
+
+    def rounded(value):
+        return round(value, 3) if value is not None else None
+
+    return {
+        "calls": iterations,
+        "ok": len(latencies),
+        "errors": len(errors),
+        "first_error": errors[0] if errors else None,
+        "latency_ms": {
+            "mean": rounded(sum(latencies) / len(latencies) if latencies else None),
+            "p50": rounded(percentile(latencies, 50)),
+            "p90": rounded(percentile(latencies, 90)),
+            "p95": rounded(percentile(latencies, 95)),
+            "p99": rounded(percentile(latencies, 99)),
+            "max": rounded(max(latencies) if latencies else None)
+        },
+        "throughput_per_s": round(len(latencies) / wall, 3) if wall else None,
+        "wall_s": round(wall, 3),
+        "rss_delta_mb": rss.delta_mb
+    }
+
+def skipped(reason: str) -> Dict[str, Any]:
+    """Result for a stage that could not run"""
+    return {"skipped": reason}
+
+def git_commit() -> Optional[str]:
+    """Commit of the code being measured, if available"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def configure_environment(server: FixtureServer, args: argparse.Namespace) -> str:
+    """
+    Point the app at the fixture server and isolate its on-disk state.
+
+    Must run before any repository module is imported, since they read their
+    settings from the environment at import time.
+
+    Returns:
+        str: Temporary working directory holding caches, history and audio
+    """
+    workdir = tempfile.mkdtemp(prefix="news-bench-")
+    os.chdir(workdir)
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+
+    os.environ["NEWS_RSS_URL"] = server.rss_url
+    os.environ["TTS_BACKEND"] = "offline"
+    os.environ["NLTK_OFFLINE"] = "1"
+    os.environ["WARMUP_MODE"] = "background"
+    os.environ["FETCH_DOMAIN_MIN_INTERVAL"] = str(args.domain_interval)
+    os.environ["PARSE_WORKERS"] = str(args.parse_workers)
+    os.environ.setdefault("SENTIMENT_CACHE_PATH", "")
+    if not args.warm:
+        # Every /analyze call should do the work rather than hit the result cache
+        os.environ["ANALYSIS_CACHE_TTL"] = "0"
+        os.environ["ANALYSIS_CACHE_STALE_TTL"] = "0"
+    return workdir
+
+def run_benchmarks(args: argparse.Namespace, server: FixtureServer) -> Dict[str, Any]:
+    """Run the selected stages in pipeline order, feeding each the previous stage's output"""
+    from news_scraper import get_news_articles
+    from article_cache import get_article_cache
+    from inference_cache import get_inference_cache
+    from sentiment_analysis import model_registry, process_articles
+    from comparative_analysis import analyze_articles, chart_cache
+    from tts import TextToSpeech
+
+    cold = not args.warm
+    stages: Dict[str, Any] = {}
+    selected = set(args.stages)
+
+    def log(name: str, result: Dict[str, Any]) -> None:
+        if "skipped" in result:
+            print(f"✗ {name}: skipped ({result['skipped']})")
+        else:
+            latency = result["latency_ms"]
+            print(f"✓ {name}: p50 {latency['p50']} ms, p95 {latency['p95']} ms, "
+                  f"{result['throughput_per_s']}/s, {result['errors']} errors")
+
+    # Inputs for later stages come from one untimed run of the earlier ones
+    articles = get_news_articles(args.company, use_cache=False)
+    if "scrape" in selected:
+        stages["scrape"] = measure(
+            lambda: get_news_articles(args.company, use_cache=not cold), args.iterations, args.concurrency
+        )
+        stages["scrape"]["articles"] = len(articles)
+        log("scrape", stages["scrape"])
+
+    with_sentiment = None
+    try:
+        started = time.perf_counter()
+        with RssTracker() as rss:
+            model_registry.load()
+        stages["model_load"] = {"seconds": round(time.perf_counter() - started, 3), "rss_delta_mb": rss.delta_mb}
+        with_sentiment = process_articles([dict(article) for article in articles])
+    except Exception as e:
+        stages["model_load"] = skipped(f"{type(e).__name__}: {e}")
+
+    if "sentiment" in selected:
+        if with_sentiment is None:
+            stages["sentiment"] = skipped(stages["model_load"]["skipped"])
+        else:
+            stages["sentiment"] = measure(
+                lambda: process_articles([dict(article) for article in articles]),
+                args.iterations, args.concurrency,
+                reset=get_inference_cache().clear if cold else None
+            )
+        log("sentiment", stages["sentiment"])
+
+    analysis = analyze_articles(with_sentiment) if with_sentiment else None
+    if "comparative" in selected:
+        if analysis is None:
+            stages["comparative"] = skipped("no sentiment results")
+        else:
+            stages["comparative"] = measure(
+                lambda: analyze_articles(with_sentiment), args.iterations, args.concurrency,
+                reset=chart_cache.clear if cold else None
+            )
+        log("comparative", stages["comparative"])
+
+    if "tts" in selected:
+        tts = TextToSpeech()
+        # Without a real analysis, speak a summary of the same length class
+        summary = analysis or {"summary": " ".join(article["title"] for article in articles)}
+        def synthesize():
+            if not tts.generate_summary_audio(summary):
+                raise RuntimeError("no audio generated")
+
+        stages["tts"] = measure(synthesize, args.iterations, args.concurrency,
+                                reset=tts.store.clear if cold else None)
+        stages["tts"]["backend"] = tts.backend.name
+        log("tts", stages["tts"])
+
+    if "api" in selected:
+        from fastapi.testclient import TestClient
+        import api
+
+        def reset_api():
+            get_article_cache().clear()
+            get_inference_cache().clear()
+
+        def post_analyze():
+            response = client.post("/analyze", json={"company": args.company, "generate_audio": False})
+            if response.status_code != 200:
+                raise RuntimeError(f"HTTP {response.status_code}: {response.text[:200]}")
+
+        with TestClient(api.app) as client:
+            stages["api"] = measure(post_analyze, args.iterations, args.concurrency,
+                                    reset=reset_api if cold else None)
+            stages["api"]["analysis_cache"] = api.analysis_cache.stats()
+        log("api", stages["api"])
+
+    stages["fixture_requests"] = server.requests
+    return stages
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the news pipeline offline against recorded fixtures."
+    )
+    parser.add_argument("--company", default="Tesla", help="Company whose recorded feed is used")
+    parser.add_argument("--iterations", type=int, default=10, help="Calls per stage")
+    parser.add_argument("--concurrency", type=int, default=1, help="Calls in flight at once")
+    parser.add_argument("--stages", default=",".join(STAGES),
+                        help=f"Comma-separated stages to measure ({', '.join(STAGES)})")
+    parser.add_argument("--warm", action="store_true",
+                        help="Keep caches between calls instead of measuring cold work")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Seconds the fixture server waits before each response")
+    parser.add_argument("--domain-interval", type=float, default=0.0,
+                        help="Per-publisher request interval (the app's default is 1.0)")
+    parser.add_argument("--parse-workers", type=int, default=0,
+                        help="Processes parsing downloaded pages (0 parses on the download threads)")
+    parser.add_argument("--label", default=None, help="Name for this run, e.g. a branch or build id")
+    parser.add_argument("--output", default=None, help="Write JSON results to this file (default: stdout)")
+    args = parser.parse_args(argv)
+    args.stages = [stage.strip() for stage in args.stages.split(",") if stage.strip()]
+    unknown = set(args.stages) - set(STAGES)
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(sorted(unknown))}")
+
+    output = os.path.abspath(args.output) if args.output else None
+    with FixtureServer(latency=args.latency) as server:
+        workdir = configure_environment(server, args)
+        print(f"\n=== Benchmarking against fixtures at {server.base_url} (state in {workdir}) ===")
+        stages = run_benchmarks(args, server)
+
+    results = {
+        "label": args.label,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {
+            "company": args.company,
+            "iterations": args.iterations,
+            "concurrency": args.concurrency,
+            "mode": "warm" if args.warm else "cold",
+            "latency": args.latency,
+            "domain_interval": args.domain_interval,
+            "parse_workers": args.parse_workers
+        },
+        "stages": stages,
+        # Whole-process peak, including the model load; per-stage memory is rss_delta_mb
+        "peak_rss_mb": peak_rss_mb()
+    }
+    payload = json.dumps(results, indent=2)
+    if output:
+        with open(output, "w") as f:
+            f.write(payload + "\n")
+        print(f"\n✓ Results written to {output}")
+    else:
+        print(payload)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+import os
+import threading
+import time
+import urllib.parse
+
+# Recorded feeds (feeds/<company>.xml) and article pages (articles/<name>.html)
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# Feed served for companies without a recorded one
+DEFAULT_FEED = "tesla"
+
+class FixtureServer:
+    """
+    Local stand-in for Bing News and publishers, serving recorded fixtures.
+
+    GET /rss?q=<company> returns the company's recorded feed with article links
+    pointing back at this server; GET /articles/<name>.html returns a recorded
+    page, or 404 if there is none (exercising the RSS fallback); and
+    GET /news/apiclick.aspx?url=<article> redirects like Bing's RSS links.
+    """
+
+    def __init__(self, fixtures_dir: str = FIXTURES_DIR, latency: float = 0.0):
+        """
+        Initialize the server on a free local port.
+
+        Args:
+            fixtures_dir (str): Directory holding feeds/ and articles/
+            latency (float): Seconds added to every response to mimic network delay
+        """
+        self.fixtures_dir = fixtures_dir
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._httpd.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        """URL of the running server"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def rss_url(self) -> str:
+        """Feed URL template for NEWS_RSS_URL"""
+        return f"{self.base_url}/rss?q={{query}}"
+
+    def _read(self, *parts: str) -> Optional[bytes]:
+        path = os.path.join(self.fixtures_dir, *parts)
+        if not os.path.isfile(path):
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+
+                url = urllib.parse.urlsplit(self.path)
+                if url.path == "/rss":
+                    query = urllib.parse.parse_qs(url.query).get("q", [""])[0]
+                    slug = "-".join(query.lower().split())
+                    body = server._read("feeds", f"{slug}.xml") or server._read("feeds", f"{DEFAULT_FEED}.xml")
+                    quoted = urllib.parse.quote(server.base_url, safe="")
+                    body = body.replace(b"{base_url_quoted}", quoted.encode()).replace(b"{base_url}", server.base_url.encode())
+                    self._send(200, "application/rss+xml; charset=utf-8", body)
+                elif url.path == "/news/apiclick.aspx":
+                    target = urllib.parse.parse_qs(url.query).get("url", [""])[0]
+                    self.send_response(302)
+                    self.send_header("Location", target)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                elif url.path.startswith("/articles/"):
+                    body = server._read("articles", os.path.basename(url.path))
+                    if body is None:
+                        self._send(404, "text/plain", b"Not found")
+                    else:
+                        self._send(200, "text/html; charset=utf-8", body)
+                else:
+                    self._send(404, "text/plain", b"Not found")
+
+            def _send(self, status: int, content_type: str, body: bytes):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # Keep benchmark output readable
+                pass
+
+        return Handler
+
+    def start(self) -> "FixtureServer":
+        """Serve requests on a background thread"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fixture-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FixtureServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+if __name__ == "__main__":
+    # Serve the fixtures for manual runs, e.g. NEWS_RSS_URL=<printed template> python news_scraper.py
+    with FixtureServer() as fixture_server:
+        print(f"Serving fixtures at {fixture_server.base_url}")
+        print(f"NEWS_RSS_URL={fixture_server.rss_url}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
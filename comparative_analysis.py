@@ -1,7 +1,152 @@
-from typing import List, Dict, Any
-import matplotlib.pyplot as plt
-from collections import Counter
+from typing import List, Dict, Any, Optional, Sequence
+from collections import Counter, OrderedDict
+import datetime
+import hashlib
+import io
 import json
+import threading
+
+# Colors used for each sentiment in charts
+SENTIMENT_COLORS = {
+    "POSITIVE": "#2ecc71",
+    "NEUTRAL": "#f1c40f",
+    "NEGATIVE": "#e74c3c"
+}
+
+# Columns of the multi-company comparison table
+COMPARISON_METRICS = [
+    "articles",
+    "positive",
+    "neutral",
+    "negative",
+    "positive_pct",
+    "neutral_pct",
+    "negative_pct",
+    "average_score",
+    "overall_trend",
+    "score_slope_per_day"
+]
+
+# Chart formats that can be rendered and their media types
+CHART_FORMATS = {
+    "png": "image/png",
+    "svg": "image/svg+xml"
+}
+
+def get_chart_id(distribution: Dict[str, int]) -> str:
+    """Hash a sentiment distribution (including label order) into a chart id"""
+    payload = json.dumps(list(distribution.items()))
+    return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+def render_chart(distribution: Dict[str, int], fmt: str = "png") -> bytes:
+    """
+    Render a sentiment distribution pie chart into memory.
+    
+    Uses a standalone Figure rather than pyplot's global state, so charts can
+    be rendered on several threads at once.
+    
+    Args:
+        distribution (Dict[str, int]): Article count per sentiment label
+        fmt (str): Output format, "png" or "svg"
+        
+    Returns:
+        bytes: The encoded image
+    """
+    # Imported on first use to keep process start fast
+    import matplotlib
+    matplotlib.use("Agg")  # Non-interactive backend; safe to use from worker threads
+    from matplotlib.figure import Figure
+    
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    
+    # Data for pie chart
+    labels = list(distribution.keys())
+    sizes = list(distribution.values())
+    pie_colors = [SENTIMENT_COLORS.get(label, "#95a5a6") for label in labels]
+    
+    # Plot pie chart
+    ax.pie(sizes, labels=labels, colors=pie_colors, autopct='%1.1f%%', startangle=90)
+    ax.axis('equal')
+    ax.set_title("Sentiment Distribution Across Articles")
+    
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=fmt)
+    return buffer.getvalue()
+
+class ChartCache:
+    """In-memory LRU of rendered charts keyed by chart id and format"""
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries (int): Maximum rendered charts and distributions kept
+        """
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._distributions: "OrderedDict[str, Dict[str, int]]" = OrderedDict()
+        self._images: "OrderedDict[tuple, bytes]" = OrderedDict()
+
+    def _remember(self, store: OrderedDict, key, value) -> None:
+        store[key] = value
+        store.move_to_end(key)
+        while len(store) > self.max_entries:
+            store.popitem(last=False)
+
+    def register(self, distribution: Dict[str, int], fmt: Optional[str] = "png") -> str:
+        """
+        Record a distribution and optionally render it right away.
+        
+        Args:
+            distribution (Dict[str, int]): Article count per sentiment label
+            fmt (Optional[str]): Format to pre-render on the calling thread, or None
+            
+        Returns:
+            str: Chart id for later retrieval
+        """
+        chart_id = get_chart_id(distribution)
+        with self._lock:
+            self._remember(self._distributions, chart_id, dict(distribution))
+        if fmt:
+            self.get(chart_id, fmt)
+        return chart_id
+
+    def get(self, chart_id: str, fmt: str = "png") -> Optional[bytes]:
+        """
+        Return a rendered chart, rendering it if needed.
+        
+        Args:
+            chart_id (str): Id returned by register
+            fmt (str): Output format, "png" or "svg"
+            
+        Returns:
+            Optional[bytes]: The image, or None if the chart id is unknown
+        """
+        with self._lock:
+            image = self._images.get((chart_id, fmt))
+            if image is not None:
+                self._images.move_to_end((chart_id, fmt))
+                return image
+            distribution = self._distributions.get(chart_id)
+        if distribution is None:
+            return None
+        
+        # Render outside the lock so different charts render in parallel
+        image = render_chart(distribution, fmt)
+        with self._lock:
+            self._remember(self._images, (chart_id, fmt), image)
+        return image
+
+    def clear(self) -> None:
+        """Drop every distribution and rendered chart"""
+        with self._lock:
+            self._distributions.clear()
+            self._images.clear()
+
+# Shared cache used by analyze_articles and the API
+chart_cache = ChartCache()
 
 class ComparativeAnalyzer:
     def __init__(self):
@@ -54,6 +199,147 @@ class ComparativeAnalyzer:
             "summary": summary
         }
     
+    def analyze_groups(self, groups: Sequence[str], labels: Sequence[str], scores: Sequence[float],
+                       dates: Optional[Sequence[Optional[str]]] = None) -> Dict[str, Any]:
+        """
+        Analyze sentiment for many groups at once from columnar data.
+        
+        All counts, percentages and means are computed with NumPy in a single
+        pass over the columns. Each group's analysis matches what
+        analyze_distribution returns for that group's articles.
+        
+        Args:
+            groups (Sequence[str]): Group (e.g. company) of each article
+            labels (Sequence[str]): Sentiment label of each article
+            scores (Sequence[float]): Sentiment score of each article
+            dates (Optional[Sequence[Optional[str]]]): Publish date of each article, used for
+                the score trend over time; None or unparseable values are ignored
+            
+        Returns:
+            Dict with "analyses" (group -> analysis) and "table" (group -> COMPARISON_METRICS)
+        """
+        import numpy as np
+        
+        if len(groups) == 0:
+            return {"metrics": COMPARISON_METRICS, "analyses": {}, "table": {}}
+        
+        group_names, group_codes = self._encode(np, groups)
+        return self._aggregate(np, group_names, group_codes, labels, scores, dates)
+
+    def _encode(self, np, values: Sequence[str]):
+        """Encode values as integer codes numbered in order of first appearance"""
+        index: Dict[str, int] = {}
+        codes = np.fromiter((index.setdefault(value, len(index)) for value in values),
+                            dtype=np.int64, count=len(values))
+        return list(index), codes
+
+    def _aggregate(self, np, group_names: List[str], group_codes, labels: Sequence[str],
+                   scores: Sequence[float], dates: Optional[Sequence[Optional[str]]]) -> Dict[str, Any]:
+        """Compute analyses and the comparison table for encoded groups"""
+        label_names, label_codes = self._encode(np, labels)
+        score_values = np.asarray(scores, dtype=np.float64)
+        num_groups, num_labels, num_articles = len(group_names), len(label_names), len(score_values)
+        
+        counts = np.bincount(group_codes * num_labels + label_codes, minlength=num_groups * num_labels)
+        counts = counts.reshape(num_groups, num_labels)
+        first_seen = np.full((num_groups, num_labels), num_articles)
+        np.minimum.at(first_seen, (group_codes, label_codes), np.arange(num_articles))
+        # Labels of each group in order of first appearance, as Counter would produce
+        label_order = np.argsort(first_seen, axis=1, kind="stable")
+        
+        totals = np.bincount(group_codes, minlength=num_groups)
+        averages = np.bincount(group_codes, weights=score_values, minlength=num_groups) / totals
+        percentages = counts / totals[:, None] * 100
+        trends = np.where(averages >= 0.6, "POSITIVE", np.where(averages <= 0.4, "NEGATIVE", "NEUTRAL"))
+        slopes = self._score_slopes(np, group_codes, num_groups, score_values, dates)
+        
+        # Build the per-group dicts from plain Python values
+        rows = zip(group_names, counts.tolist(), percentages.tolist(), label_order.tolist(),
+                   totals.tolist(), averages.tolist(), trends.tolist(), slopes.tolist())
+        analyses = {}
+        table = {}
+        for name, group_counts, group_pcts, order, total, average, trend, slope in rows:
+            present = [label for label in order if group_counts[label]]
+            distribution = {label_names[label]: group_counts[label] for label in present}
+            group_percentages = {label_names[label]: group_pcts[label] for label in present}
+            
+            analyses[name] = {
+                "distribution": distribution,
+                "percentages": group_percentages,
+                "average_score": average,
+                "overall_trend": trend,
+                "summary": self._generate_summary(distribution, group_percentages, average)
+            }
+            table[name] = {
+                "articles": total,
+                "positive": distribution.get("POSITIVE", 0),
+                "neutral": distribution.get("NEUTRAL", 0),
+                "negative": distribution.get("NEGATIVE", 0),
+                "positive_pct": group_percentages.get("POSITIVE", 0.0),
+                "neutral_pct": group_percentages.get("NEUTRAL", 0.0),
+                "negative_pct": group_percentages.get("NEGATIVE", 0.0),
+                "average_score": average,
+                "overall_trend": trend,
+                "score_slope_per_day": None if slope != slope else slope  # NaN when undefined
+            }
+        
+        return {"metrics": COMPARISON_METRICS, "analyses": analyses, "table": table}
+
+    def _score_slopes(self, np, group_codes, num_groups: int, scores, dates) -> Any:
+        """Least-squares slope of score against publish day for every group (NaN if undefined)"""
+        if dates is None:
+            return np.full(num_groups, np.nan)
+        
+        # Parse each distinct date once into a day number; anything unparseable becomes NaN
+        day_numbers = {}
+        for date in set(dates):
+            try:
+                day_numbers[date] = float(datetime.date.fromisoformat(date[:10]).toordinal())
+            except (TypeError, ValueError):
+                day_numbers[date] = np.nan
+        days = np.fromiter((day_numbers[date] for date in dates), dtype=np.float64, count=len(dates))
+        valid = ~np.isnan(days)
+        if not valid.any():
+            return np.full(num_groups, np.nan)
+        
+        x = days[valid] - days[valid].min()
+        y = scores[valid]
+        codes = group_codes[valid]
+        n = np.bincount(codes, minlength=num_groups).astype(np.float64)
+        sum_x = np.bincount(codes, weights=x, minlength=num_groups)
+        sum_y = np.bincount(codes, weights=y, minlength=num_groups)
+        sum_xy = np.bincount(codes, weights=x * y, minlength=num_groups)
+        sum_xx = np.bincount(codes, weights=x * x, minlength=num_groups)
+        
+        denominator = n * sum_xx - sum_x ** 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(denominator > 0, (n * sum_xy - sum_x * sum_y) / denominator, np.nan)
+
+    def compare_companies(self, articles_by_company: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Compare sentiment across companies.
+        
+        Args:
+            articles_by_company (Dict[str, List[Dict]]): Articles with sentiment analysis per company
+            
+        Returns:
+            Dict with per-company "analyses" and a company x metric "table"
+        """
+        import numpy as np
+        
+        # Companies with no articles have nothing to compare
+        companies = [company for company, articles in articles_by_company.items() if articles]
+        if not companies:
+            return {"metrics": COMPARISON_METRICS, "analyses": {}, "table": {}}
+        
+        # Articles are already grouped, so group codes follow from the list lengths
+        group_codes = np.repeat(np.arange(len(companies)), [len(articles_by_company[company]) for company in companies])
+        flat = [article for company in companies for article in articles_by_company[company]]
+        labels = [article["sentiment"]["label"] for article in flat]
+        scores = [article["sentiment"]["score"] for article in flat]
+        dates = [article.get("publish_date") for article in flat]
+        return self._aggregate(np, companies, group_codes, labels, scores, dates)
+
     def _generate_summary(self, counts: Dict[str, int], percentages: Dict[str, float], avg_score: float) -> str:
         """Generate a human-readable summary of the sentiment analysis"""
         # Sort sentiments by count
@@ -90,27 +376,9 @@ class ComparativeAnalyzer:
             analysis (Dict): Analysis results from analyze_distribution
             save_path (str): Path to save the visualization
         """
-        # Create pie chart
-        plt.figure(figsize=(10, 6))
-        
-        # Data for pie chart
-        labels = analysis["distribution"].keys()
-        sizes = analysis["distribution"].values()
-        colors = {
-            "POSITIVE": "#2ecc71",
-            "NEUTRAL": "#f1c40f",
-            "NEGATIVE": "#e74c3c"
-        }
-        pie_colors = [colors.get(label, "#95a5a6") for label in labels]
-        
-        # Plot pie chart
-        plt.pie(sizes, labels=labels, colors=pie_colors, autopct='%1.1f%%', startangle=90)
-        plt.axis('equal')
-        plt.title("Sentiment Distribution Across Articles")
-        
-        # Save plot
-        plt.savefig(save_path)
-        plt.close()
+        fmt = save_path.rsplit(".", 1)[-1].lower()
+        with open(save_path, "wb") as f:
+            f.write(render_chart(analysis["distribution"], fmt if fmt in CHART_FORMATS else "png"))
 
 def analyze_articles(articles: List[Dict[str, Any]], save_visualization: bool = True) -> Dict[str, Any]:
     """
@@ -118,7 +386,8 @@ def analyze_articles(articles: List[Dict[str, Any]], save_visualization: bool =
     
     Args:
         articles (List[Dict]): List of articles with sentiment analysis
-        save_visualization (bool): Whether to save visualization
+        save_visualization (bool): Whether to render the distribution chart into the
+            in-memory chart cache; its id is returned as "chart_id"
         
     Returns:
         Dict containing analysis results
@@ -127,10 +396,22 @@ def analyze_articles(articles: List[Dict[str, Any]], save_visualization: bool =
     analysis = analyzer.analyze_distribution(articles)
     
     if save_visualization:
-        analyzer.generate_visualization(analysis)
+        analysis["chart_id"] = chart_cache.register(analysis["distribution"])
     
     return analysis
 
+def compare_companies(articles_by_company: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Perform comparative analysis across several companies at once.
+    
+    Args:
+        articles_by_company (Dict[str, List[Dict]]): Articles with sentiment analysis per company
+        
+    Returns:
+        Dict with per-company analyses and a company x metric comparison table
+    """
+    return ComparativeAnalyzer().compare_companies(articles_by_company)
+
 if __name__ == "__main__":
     # Example usage
     from news_scraper import get_news_articles
@@ -145,6 +426,7 @@ if __name__ == "__main__":
     
     # Perform comparative analysis
     analysis = analyze_articles(articles_with_sentiment)
+    ComparativeAnalyzer().generate_visualization(analysis)
     
     # Print results
     print("\nAnalysis Results:")
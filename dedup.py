@@ -0,0 +1,155 @@
+import hashlib
+import os
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from metrics import span
+
+# Set DEDUP_ENABLED=0 to run sentiment on every copy of a syndicated story
+DEDUP_ENABLED = os.environ.get("DEDUP_ENABLED", "1") != "0"
+
+# Fingerprints differing in at most this many of their 64 bits are near-duplicates
+DEDUP_MAX_DISTANCE = int(os.environ.get("DEDUP_MAX_DISTANCE", 8))
+
+# Bodies shorter than this many words are never treated as duplicates
+DEDUP_MIN_WORDS = int(os.environ.get("DEDUP_MIN_WORDS", 30))
+
+# Words per shingle
+SHINGLE_SIZE = 3
+
+WORD = re.compile(r"\w+")
+
+def article_body(article: Dict) -> str:
+    """Text used to fingerprint an article: the full content, else the summary"""
+    return article.get("content") or article.get("summary") or ""
+
+def simhash(text: str, shingle_size: int = SHINGLE_SIZE) -> Optional[int]:
+    """
+    Compute a 64-bit SimHash fingerprint of a text from its word shingles.
+
+    Similar texts get fingerprints that differ in few bits.
+
+    Args:
+        text (str): Text to fingerprint
+        shingle_size (int): Words per shingle
+
+    Returns:
+        Optional[int]: The fingerprint, or None if the text is shorter than DEDUP_MIN_WORDS
+    """
+    import numpy as np
+
+    words = WORD.findall(text.lower())
+    if len(words) < max(DEDUP_MIN_WORDS, shingle_size):
+        return None
+
+    digests = b"".join(
+        hashlib.blake2b(" ".join(words[i:i + shingle_size]).encode("utf-8"), digest_size=8).digest()
+        for i in range(len(words) - shingle_size + 1)
+    )
+    # Each shingle votes +1/-1 on every bit; the fingerprint keeps the majority
+    bits = np.unpackbits(np.frombuffer(digests, dtype=np.uint8).reshape(-1, 8), axis=1)
+    majority = bits.sum(axis=0) * 2 > bits.shape[0]
+    return int.from_bytes(np.packbits(majority).tobytes(), "big")
+
+class Deduplicator:
+    """
+    Cluster near-duplicate articles by SimHash as they arrive.
+
+    Fingerprints are split into max_distance + 1 bands; two fingerprints within
+    max_distance bits must agree exactly on at least one band, so each lookup
+    only compares against articles sharing a band and clustering stays linear.
+    """
+
+    def __init__(self, max_distance: int = DEDUP_MAX_DISTANCE,
+                 fingerprints: Optional[Dict[str, Optional[int]]] = None):
+        """
+        Initialize an empty set of clusters.
+
+        Args:
+            max_distance (int): Maximum differing bits for two articles to be near-duplicates
+            fingerprints (Optional[Dict[str, Optional[int]]]): Fingerprints by URL, shared
+                between deduplicators so each article is hashed once
+        """
+        self.max_distance = max_distance
+        self.fingerprints = fingerprints if fingerprints is not None else {}
+        self.bands = max_distance + 1
+        self._band_bits = 64 // self.bands
+        self._buckets: Dict[Tuple[int, int], List[Tuple[int, Dict]]] = {}
+        self.duplicates: List[Tuple[int, Dict, Dict]] = []
+
+    def _band_keys(self, fingerprint: int) -> List[Tuple[int, int]]:
+        mask = (1 << self._band_bits) - 1
+        return [(band, (fingerprint >> (band * self._band_bits)) & mask) for band in range(self.bands)]
+
+    def add(self, article: Dict) -> Optional[Dict]:
+        """
+        Add an article, returning the representative it duplicates.
+
+        New representatives get a cluster_size of 1; duplicates increment their
+        representative's cluster_size and are marked with duplicate_of.
+
+        Args:
+            article (Dict): Scraped article
+
+        Returns:
+            Optional[Dict]: The representative article, or None if the article starts a new cluster
+        """
+        url = article["url"]
+        if url not in self.fingerprints:
+            with span("dedup_fingerprint"):
+                self.fingerprints[url] = simhash(article_body(article))
+        fingerprint = self.fingerprints[url]
+        article["cluster_size"] = 1
+        if fingerprint is None:
+            return None
+
+        keys = self._band_keys(fingerprint)
+        for key in keys:
+            for candidate, representative in self._buckets.get(key, ()):
+                if bin(candidate ^ fingerprint).count("1") <= self.max_distance:
+                    representative["cluster_size"] += 1
+                    article["duplicate_of"] = representative["url"]
+                    return representative
+
+        for key in keys:
+            self._buckets.setdefault(key, []).append((fingerprint, article))
+        return None
+
+    def filter(self, stream: Iterable[Tuple[int, Dict]]) -> Iterator[Tuple[int, Dict]]:
+        """
+        Pass through only cluster representatives from a (position, article) stream.
+
+        Duplicates are held back until resolve() is called.
+
+        Args:
+            stream (Iterable[Tuple[int, Dict]]): (position, article) pairs, e.g. from iter_news_articles
+
+        Yields:
+            Tuple[int, Dict]: Position and representative article
+        """
+        for position, article in stream:
+            representative = self.add(article)
+            if representative is None:
+                yield position, article
+            else:
+                self.duplicates.append((position, article, representative))
+
+    def resolve(self) -> List[Tuple[int, Dict]]:
+        """
+        Give held-back duplicates their representative's sentiment.
+
+        Call once the representatives have been analyzed.
+
+        Returns:
+            List[Tuple[int, Dict]]: Position and duplicate article with sentiment added
+        """
+        resolved = []
+        for position, article, representative in self.duplicates:
+            article["sentiment"] = dict(representative["sentiment"])
+            resolved.append((position, article))
+        self.duplicates = []
+        return resolved
+
+def unique_articles(articles: Iterable[Dict]) -> List[Dict]:
+    """Return the articles that are not near-duplicates of another one"""
+    return [article for article in articles if not article.get("duplicate_of")]
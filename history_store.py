@@ -0,0 +1,251 @@
+import datetime
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from article_cache import normalize_url
+from result_cache import normalize_company
+
+# SQLite file holding analyzed articles and their daily aggregates; empty disables history
+DEFAULT_HISTORY_PATH = os.environ.get("HISTORY_PATH", os.path.join("cache", "history.sqlite3"))
+
+# Rolling windows, in days, reported by trends()
+DEFAULT_WINDOWS = (1, 7, 30)
+
+# Sentiment labels with their own aggregate columns
+LABEL_COLUMNS = {
+    "POSITIVE": "positive",
+    "NEUTRAL": "neutral",
+    "NEGATIVE": "negative"
+}
+
+def article_day(article: Dict[str, Any], recorded_at: float) -> str:
+    """Day an article counts towards: its publish date, or the day it was recorded"""
+    try:
+        return datetime.date.fromisoformat(str(article.get("publish_date"))[:10]).isoformat()
+    except ValueError:
+        return datetime.datetime.fromtimestamp(recorded_at, datetime.timezone.utc).date().isoformat()
+
+def _trend(average: float) -> str:
+    """Overall trend for an average score, using the thresholds of analyze_distribution"""
+    if average >= 0.6:
+        return "POSITIVE"
+    if average <= 0.4:
+        return "NEGATIVE"
+    return "NEUTRAL"
+
+class HistoryStore:
+    """
+    SQLite store of analyzed articles with per-company daily aggregates.
+
+    Aggregates are updated incrementally as each article is recorded, so a
+    rolling window is answered by summing at most one row per day rather than
+    rescanning the articles.
+    """
+
+    def __init__(self, path: str = DEFAULT_HISTORY_PATH):
+        """
+        Initialize the store and create its tables if needed.
+
+        Args:
+            path (str): SQLite database file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS articles ("
+                " company TEXT NOT NULL,"
+                " url TEXT NOT NULL,"
+                " title TEXT,"
+                " day TEXT NOT NULL,"
+                " label TEXT NOT NULL,"
+                " score REAL NOT NULL,"
+                " recorded_at REAL NOT NULL,"
+                " PRIMARY KEY (company, url))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS daily ("
+                " company TEXT NOT NULL,"
+                " day TEXT NOT NULL,"
+                " articles INTEGER NOT NULL DEFAULT 0,"
+                " positive INTEGER NOT NULL DEFAULT 0,"
+                " neutral INTEGER NOT NULL DEFAULT 0,"
+                " negative INTEGER NOT NULL DEFAULT 0,"
+                " score_sum REAL NOT NULL DEFAULT 0,"
+                " PRIMARY KEY (company, day))"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _adjust(self, conn: sqlite3.Connection, company: str, day: str, label: str,
+                score: float, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) one article's contribution to a daily row"""
+        column = LABEL_COLUMNS.get(label)
+        label_update = f", {column} = {column} + excluded.{column}" if column else ""
+        columns = ["positive", "neutral", "negative"]
+        values = [sign if column == name else 0 for name in columns]
+        conn.execute(
+            "INSERT INTO daily (company, day, articles, positive, neutral, negative, score_sum)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT (company, day) DO UPDATE SET"
+            " articles = articles + excluded.articles,"
+            f" score_sum = score_sum + excluded.score_sum{label_update}",
+            (company, day, sign, *values, sign * score)
+        )
+
+    def record(self, company: str, articles: Sequence[Dict[str, Any]],
+               recorded_at: Optional[float] = None) -> int:
+        """
+        Store articles with their sentiment and update the daily aggregates.
+
+        Articles already stored for the company are updated in place; their old
+        contribution is removed from the aggregates before the new one is added.
+        Articles built from RSS data only are stored when new but never replace
+        a stored article.
+
+        Args:
+            company (str): Company the articles were found for
+            articles (Sequence[Dict]): Articles with sentiment analysis
+            recorded_at (Optional[float]): Timestamp of the analysis, defaults to now
+
+        Returns:
+            int: Number of articles that were new or changed
+        """
+        company = normalize_company(company)
+        recorded_at = time.time() if recorded_at is None else recorded_at
+        changed = 0
+
+        with self._lock, self._connect() as conn:
+            for article in articles:
+                url = article.get("url")
+                sentiment = article.get("sentiment")
+                if not url or not sentiment:
+                    continue
+                key = normalize_url(url)
+                day = article_day(article, recorded_at)
+                label, score = sentiment["label"], float(sentiment["score"])
+
+                previous = conn.execute(
+                    "SELECT day, label, score FROM articles WHERE company = ? AND url = ?",
+                    (company, key)
+                ).fetchone()
+                if previous == (day, label, score) or (previous is not None and article.get("rss_only")):
+                    continue
+                if previous is not None:
+                    self._adjust(conn, company, previous[0], previous[1], previous[2], -1)
+
+                conn.execute(
+                    "INSERT OR REPLACE INTO articles (company, url, title, day, label, score, recorded_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (company, key, article.get("title"), day, label, score, recorded_at)
+                )
+                self._adjust(conn, company, day, label, score, 1)
+                changed += 1
+
+        return changed
+
+    def daily(self, company: str, days: int = 30, today: Optional[datetime.date] = None) -> List[Dict[str, Any]]:
+        """
+        Return the daily aggregates of a company for the last `days` days.
+
+        Args:
+            company (str): Company name
+            days (int): Number of days, ending today
+            today (Optional[datetime.date]): Last day of the range, defaults to today (UTC)
+
+        Returns:
+            List[Dict]: One entry per day that has articles, oldest first
+        """
+        today = today or datetime.datetime.now(datetime.timezone.utc).date()
+        start = (today - datetime.timedelta(days=days - 1)).isoformat()
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT day, articles, positive, neutral, negative, score_sum FROM daily"
+                " WHERE company = ? AND day BETWEEN ? AND ? AND articles > 0 ORDER BY day",
+                (normalize_company(company), start, today.isoformat())
+            ).fetchall()
+        return [self._summarize(row[1:], day=row[0]) for row in rows]
+
+    def window(self, company: str, days: int, today: Optional[datetime.date] = None) -> Dict[str, Any]:
+        """
+        Aggregate a company's sentiment over the last `days` days.
+
+        Args:
+            company (str): Company name
+            days (int): Window length in days, ending today
+            today (Optional[datetime.date]): Last day of the window, defaults to today (UTC)
+
+        Returns:
+            Dict with article count, distribution, average_score and overall_trend
+        """
+        today = today or datetime.datetime.now(datetime.timezone.utc).date()
+        start = (today - datetime.timedelta(days=days - 1)).isoformat()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT COALESCE(SUM(articles), 0), COALESCE(SUM(positive), 0), COALESCE(SUM(neutral), 0),"
+                " COALESCE(SUM(negative), 0), COALESCE(SUM(score_sum), 0) FROM daily"
+                " WHERE company = ? AND day BETWEEN ? AND ?",
+                (normalize_company(company), start, today.isoformat())
+            ).fetchone()
+        return self._summarize(row, days=days)
+
+    def trends(self, company: str, windows: Sequence[int] = DEFAULT_WINDOWS,
+               today: Optional[datetime.date] = None) -> Dict[str, Any]:
+        """
+        Return rolling aggregates for several windows and the daily series of the longest.
+
+        Args:
+            company (str): Company name
+            windows (Sequence[int]): Window lengths in days
+            today (Optional[datetime.date]): Last day of every window, defaults to today (UTC)
+
+        Returns:
+            Dict with "windows" (one aggregate per window) and "daily"
+        """
+        today = today or datetime.datetime.now(datetime.timezone.utc).date()
+        return {
+            "company": normalize_company(company),
+            "as_of": today.isoformat(),
+            "windows": [self.window(company, days, today) for days in windows],
+            "daily": self.daily(company, max(windows), today)
+        }
+
+    def _summarize(self, row: Sequence[Any], **fields) -> Dict[str, Any]:
+        """Turn summed aggregate columns into a result dict"""
+        articles, positive, neutral, negative, score_sum = row
+        average = score_sum / articles if articles else None
+        return {
+            **fields,
+            "articles": articles,
+            "distribution": {"POSITIVE": positive, "NEUTRAL": neutral, "NEGATIVE": negative},
+            "average_score": average,
+            "overall_trend": _trend(average) if average is not None else None
+        }
+
+    def clear(self) -> None:
+        """Remove all stored history"""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM articles")
+            conn.execute("DELETE FROM daily")
+
+_default_store: Optional[HistoryStore] = None
+_default_store_lock = threading.Lock()
+
+def get_history_store() -> Optional[HistoryStore]:
+    """Return the process-wide history store, or None if HISTORY_PATH is empty"""
+    global _default_store
+    if not DEFAULT_HISTORY_PATH:
+        return None
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = HistoryStore()
+        return _default_store
@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# In-memory entries kept before least recently used results are dropped
+DEFAULT_MAX_ENTRIES = int(os.environ.get("SENTIMENT_CACHE_SIZE", 10000))
+
+# SQLite file for the persistent tier; empty disables it
+DEFAULT_PERSISTENT_PATH = os.environ.get("SENTIMENT_CACHE_PATH", "")
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so trivially different copies share a cache entry"""
+    return " ".join(text.split())
+
+def make_key(text: str, model_id: str) -> str:
+    """Hash the normalized text together with the model identifier"""
+    payload = f"{model_id}\0{normalize_text(text)}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+class InferenceCache:
+    """Two-tier cache of sentiment results: an in-memory LRU and optional SQLite"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, persistent_path: Optional[str] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int): Maximum results held in memory
+            persistent_path (Optional[str]): SQLite file for the persistent tier, or None
+        """
+        self.max_entries = max_entries
+        self.persistent_path = persistent_path or None
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+
+        if self.persistent_path:
+            directory = os.path.dirname(self.persistent_path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, data TEXT NOT NULL)")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.persistent_path, timeout=30)
+
+    def _remember(self, key: str, result: Dict[str, Any]) -> None:
+        """Insert into the memory tier, evicting the least recently used entry if full"""
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, text: str, model_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result.
+
+        Args:
+            text (str): Text that was analyzed
+            model_id (str): Identifier of the model that produced the result
+
+        Returns:
+            Optional[Dict]: A copy of the cached result, or None on a miss
+        """
+        key = make_key(text, model_id)
+        with self._lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return dict(result)
+
+        if self.persistent_path:
+            with self._connect() as conn:
+                row = conn.execute("SELECT data FROM results WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                result = json.loads(row[0])
+                with self._lock:
+                    self._remember(key, result)
+                    self.persistent_hits += 1
+                return dict(result)
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, text: str, model_id: str, result: Dict[str, Any]) -> None:
+        """
+        Store a result in both tiers.
+
+        Args:
+            text (str): Text that was analyzed
+            model_id (str): Identifier of the model that produced the result
+            result (Dict): Sentiment result to cache
+        """
+        key = make_key(text, model_id)
+        with self._lock:
+            self._remember(key, dict(result))
+
+        if self.persistent_path:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO results (key, data) VALUES (?, ?)",
+                    (key, json.dumps(result))
+                )
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit and miss counters and the current memory size"""
+        with self._lock:
+            lookups = self.hits + self.persistent_hits + self.misses
+            return {
+                "hits": self.hits,
+                "persistent_hits": self.persistent_hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits + self.persistent_hits) / lookups if lookups else 0.0,
+                "entries": len(self._memory)
+            }
+
+    def clear(self) -> None:
+        """Drop every cached result and reset the counters"""
+        with self._lock:
+            self._memory.clear()
+            self.hits = self.persistent_hits = self.misses = 0
+        if self.persistent_path:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM results")
+
+_default_cache: Optional[InferenceCache] = None
+_default_cache_lock = threading.Lock()
+
+def get_inference_cache() -> InferenceCache:
+    """Return the process-wide inference cache, creating it on first use"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = InferenceCache(persistent_path=DEFAULT_PERSISTENT_PATH)
+        return _default_cache
@@ -0,0 +1,146 @@
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Optional
+import os
+import threading
+import time
+import uuid
+
+from pipeline import STAGES, NoArticlesError, run_analysis
+
+# Analyses allowed to run at the same time
+JOB_WORKERS = int(os.environ.get("JOB_WORKERS", 4))
+
+# Finished jobs kept for status lookups before the oldest are forgotten
+JOB_HISTORY = int(os.environ.get("JOB_HISTORY", 500))
+
+class Job:
+    """A single analysis run and its progress"""
+
+    def __init__(self, company: str, generate_audio: bool = True, deadline: Optional[float] = None):
+        """
+        Initialize a queued job.
+
+        Args:
+            company (str): Name of the company to analyze
+            generate_audio (bool): Whether to synthesize the Hindi summary
+            deadline (Optional[float]): time.monotonic() value to finish by, including time queued
+        """
+        self.id = uuid.uuid4().hex
+        self.company = company
+        self.generate_audio = generate_audio
+        self.deadline = deadline
+        self.status = "queued"
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.stages: Dict[str, Dict[str, Any]] = {stage: {"status": "pending"} for stage in STAGES}
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.future: Optional[Future] = None
+        self._lock = threading.Lock()
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has completed or failed"""
+        return self.status in ("completed", "failed", "not_found")
+
+    def update_stage(self, stage: str, fields: Dict[str, Any]) -> None:
+        """Merge progress fields into a stage"""
+        with self._lock:
+            self.stages[stage].update(fields)
+
+    def run(self) -> Dict[str, Any]:
+        """Run the analysis pipeline, recording progress and outcome"""
+        self.status = "running"
+        self.started_at = time.time()
+        try:
+            self.result = run_analysis(
+                self.company, self.generate_audio, progress=self.update_stage,
+                deadline=self.deadline
+            )
+            self.status = "completed"
+            return self.result
+        except NoArticlesError as e:
+            self.error = str(e)
+            self.status = "not_found"
+            raise
+        except Exception as e:
+            self.error = str(e)
+            self.status = "failed"
+            raise
+        finally:
+            self.finished_at = time.time()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the job's status, progress and result"""
+        with self._lock:
+            stages = {stage: dict(info) for stage, info in self.stages.items()}
+        return {
+            "job_id": self.id,
+            "company": self.company,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "stages": stages,
+            "result": self.result,
+            "error": self.error
+        }
+
+class JobManager:
+    """Runs analysis jobs on a bounded worker pool"""
+
+    def __init__(self, max_workers: int = JOB_WORKERS, history: int = JOB_HISTORY):
+        """
+        Initialize the manager.
+
+        Args:
+            max_workers (int): Maximum analyses running concurrently
+            history (int): Number of jobs remembered for status lookups
+        """
+        self.history = history
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, company: str, generate_audio: bool = True, deadline: Optional[float] = None) -> Job:
+        """
+        Queue an analysis and return its job immediately.
+
+        Args:
+            company (str): Name of the company to analyze
+            generate_audio (bool): Whether to synthesize the Hindi summary
+            deadline (Optional[float]): time.monotonic() value to finish by, including time queued
+
+        Returns:
+            Job: The queued job; job.future resolves to the result
+        """
+        job = Job(company, generate_audio, deadline)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune()
+        job.future = self._executor.submit(job.run)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Look up a job by id"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _prune(self) -> None:
+        """Forget the oldest finished jobs beyond the history limit"""
+        excess = len(self._jobs) - self.history
+        for job_id in list(self._jobs):
+            if excess <= 0:
+                break
+            if self._jobs[job_id].finished:
+                del self._jobs[job_id]
+                excess -= 1
+
+    def shutdown(self) -> None:
+        """Stop accepting jobs and cancel those still queued"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+# Shared manager used by the API
+job_manager = JobManager()
@@ -0,0 +1,294 @@
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+import contextvars
+import threading
+import time
+
+# Upper bounds in seconds of the latency histogram buckets
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    """Render a Prometheus label set, e.g. {stage="scrape"}"""
+    pairs = [
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in zip(names, values)
+    ]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+class Counter:
+    """Monotonically increasing count, optionally split by labels"""
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        """
+        Initialize the counter.
+
+        Args:
+            name (str): Metric name
+            help (str): Description shown in the exposition
+            labels (Sequence[str]): Label names
+        """
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+        # Unlabeled counters are reported as 0 before their first increment
+        self._values: Dict[Tuple[str, ...], float] = {} if self.labels else {(): 0}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """Add to the count for a label set"""
+        key = tuple(str(labels.get(name, "")) for name in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Current count for a label set"""
+        key = tuple(str(labels.get(name, "")) for name in self.labels)
+        with self._lock:
+            return self._values.get(key, 0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}" for key, value in values]
+
+class Histogram:
+    """Distribution of observed values in cumulative buckets, optionally split by labels"""
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Initialize the histogram.
+
+        Args:
+            name (str): Metric name
+            help (str): Description shown in the exposition
+            labels (Sequence[str]): Label names
+            buckets (Sequence[float]): Bucket upper bounds, ascending
+        """
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # label values -> [per-bucket counts..., +Inf count], sum
+        self._series: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one value for a label set"""
+        key = tuple(str(labels.get(name, "")) for name in self.labels)
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        with self._lock:
+            counts, total = self._series.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[index] += 1
+            total[0] += value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            series = sorted((key, list(counts), total[0]) for key, (counts, total) in self._series.items())
+        lines = []
+        for key, counts, total in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = 'le="{}"'.format("+Inf" if bound == float("inf") else _format_value(bound))
+                lines.append(f"{self.name}_bucket{_format_labels(self.labels, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, key)} {cumulative}")
+        return lines
+
+class CallbackGauge:
+    """Gauge whose values are read from a callback at scrape time"""
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str],
+                 read: Callable[[], Dict[Tuple[str, ...], float]]):
+        """
+        Initialize the gauge.
+
+        Args:
+            name (str): Metric name
+            help (str): Description shown in the exposition
+            labels (Sequence[str]): Label names
+            read (Callable): Returns a value per tuple of label values
+        """
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.read = read
+
+    def render(self) -> List[str]:
+        try:
+            values = sorted(self.read().items())
+        except Exception as e:
+            print(f"✗ Error reading metric {self.name}: {str(e)}")
+            return []
+        return [f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}" for key, value in values]
+
+class CallbackCounter(CallbackGauge):
+    """Counter whose values are read from a callback at scrape time, for totals kept elsewhere"""
+    kind = "counter"
+
+class Registry:
+    """Collection of metrics rendered together in the Prometheus text format"""
+
+    def __init__(self):
+        """Initialize an empty registry"""
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, Any] = {}
+
+    def _add(self, metric):
+        with self._lock:
+            # Re-registering (e.g. on module reload) keeps the existing metric
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        """Create and register a counter"""
+        return self._add(Counter(name, help, labels))
+
+    def histogram(self, name: str, help: str, labels: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Create and register a histogram"""
+        return self._add(Histogram(name, help, labels, buckets))
+
+    def gauge_callback(self, name: str, help: str, labels: Sequence[str],
+                       read: Callable[[], Dict[Tuple[str, ...], float]]) -> CallbackGauge:
+        """Register a gauge read from a callback whenever metrics are rendered"""
+        with self._lock:
+            self._metrics[name] = CallbackGauge(name, help, labels, read)
+            return self._metrics[name]
+
+    def counter_callback(self, name: str, help: str, labels: Sequence[str],
+                         read: Callable[[], Dict[Tuple[str, ...], float]]) -> CallbackCounter:
+        """Register a counter read from a callback whenever metrics are rendered; values must only increase"""
+        with self._lock:
+            self._metrics[name] = CallbackCounter(name, help, labels, read)
+            return self._metrics[name]
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+# Shared registry exposed on /metrics
+registry = Registry()
+
+STAGE_SECONDS = registry.histogram(
+    "news_stage_duration_seconds", "Time spent in each pipeline stage", ["stage"]
+)
+DOMAIN_SECONDS = registry.histogram(
+    "news_publisher_duration_seconds", "Article download and parse time by publisher domain", ["stage", "domain"]
+)
+RSS_FALLBACKS = registry.counter(
+    "news_rss_fallbacks_total",
+    "Articles that used RSS data because extraction failed, was skipped or ran out of time", ["reason"]
+)
+HEDGED_DOWNLOADS = registry.counter(
+    "news_hedged_downloads_total", "Slow article downloads raced by a second request"
+)
+SENTIMENT_ERRORS = registry.counter(
+    "news_sentiment_errors_total", "Inference failures answered with a NEUTRAL result", ["kind"]
+)
+TTS_FAILURES = registry.counter(
+    "news_tts_failures_total", "Speech synthesis attempts that failed"
+)
+
+class Timings:
+    """Per-request breakdown of span durations by stage and publisher domain"""
+
+    def __init__(self):
+        """Initialize an empty breakdown"""
+        self._lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.domains: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+    @staticmethod
+    def _add(entry: Dict[str, float], seconds: float) -> None:
+        milliseconds = seconds * 1000
+        entry["count"] = entry.get("count", 0) + 1
+        entry["total_ms"] = entry.get("total_ms", 0.0) + milliseconds
+        entry["max_ms"] = max(entry.get("max_ms", 0.0), milliseconds)
+
+    def record(self, stage: str, seconds: float, domain: Optional[str] = None) -> None:
+        """Add a span to the breakdown"""
+        with self._lock:
+            self._add(self.stages.setdefault(stage, {}), seconds)
+            if domain:
+                self._add(self.domains.setdefault(domain, {}).setdefault(stage, {}), seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the breakdown with millisecond values rounded"""
+        def rounded(entry):
+            return {key: round(value, 3) if isinstance(value, float) else value for key, value in entry.items()}
+
+        with self._lock:
+            return {
+                "total_ms": round((time.perf_counter() - self.started) * 1000, 3),
+                "stages": {stage: rounded(entry) for stage, entry in self.stages.items()},
+                "domains": {
+                    domain: {stage: rounded(entry) for stage, entry in stages.items()}
+                    for domain, stages in self.domains.items()
+                }
+            }
+
+_current_timings: contextvars.ContextVar = contextvars.ContextVar("timings", default=None)
+
+@contextmanager
+def collect_timings() -> Iterator[Timings]:
+    """Collect every span recorded in this context (and contexts bound from it) into a Timings"""
+    timings = Timings()
+    token = _current_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _current_timings.reset(token)
+
+def observe(stage: str, seconds: float, domain: Optional[str] = None) -> None:
+    """Record a measured duration in the stage histograms and the current request's timings"""
+    STAGE_SECONDS.observe(seconds, stage=stage)
+    if domain:
+        DOMAIN_SECONDS.observe(seconds, stage=stage, domain=domain)
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.record(stage, seconds, domain)
+
+@contextmanager
+def span(stage: str, domain: Optional[str] = None):
+    """Time the enclosed block as a stage, whether or not it raises"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(stage, time.perf_counter() - started, domain)
+
+def bind(func: Callable) -> Callable:
+    """
+    Wrap a function so it runs in a copy of the caller's context.
+
+    Use when handing work to another thread, so its spans still reach the
+    request's timings.
+    """
+    context = contextvars.copy_context()
+
+    def run(*args, **kwargs):
+        # Each call gets its own copy; one context cannot be entered by two threads at once
+        return context.copy().run(func, *args, **kwargs)
+
+    return run
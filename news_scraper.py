@@ -1,26 +1,62 @@
 import requests
-from bs4 import BeautifulSoup
-from newspaper import Article
-import nltk
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager, nullcontext
+import datetime
+import email.utils
+import multiprocessing
+import os
+import queue
+import re
+import threading
 import time
 import urllib.parse
 
-# Download all required NLTK data
-def download_nltk_resources():
-    """Download required NLTK resources"""
-    try:
-        # Download the punkt tokenizer data
-        print("Downloading NLTK resources...")
-        nltk.download('punkt', quiet=True)
-        nltk.download('averaged_perceptron_tagger', quiet=True)
-        print("✓ Successfully downloaded NLTK resources")
-    except Exception as e:
-        print(f"✗ Error downloading NLTK resources: {str(e)}")
-        raise
+from article_cache import ArticleCache, get_article_cache, normalize_url, unwrap_redirect
+from metrics import HEDGED_DOWNLOADS, RSS_FALLBACKS, bind, observe, span
+
+# NLTK data used by newspaper's nlp(), as (resource path, download id)
+NLTK_RESOURCES = [
+    ("tokenizers/punkt", "punkt"),
+    ("taggers/averaged_perceptron_tagger", "averaged_perceptron_tagger")
+]
 
-# Download NLTK resources before processing
-download_nltk_resources()
+# Set NLTK_OFFLINE=1 to never download NLTK data; missing data then falls back to RSS summaries
+NLTK_OFFLINE = os.environ.get("NLTK_OFFLINE") == "1"
+
+_nltk_checked = False
+_nltk_lock = threading.Lock()
+
+def ensure_nltk_resources() -> List[str]:
+    """
+    Check for NLTK data locally and download only what is missing.
+    
+    Runs once per process. Nothing is downloaded when NLTK_OFFLINE is set.
+    
+    Returns:
+        List[str]: Resources still missing afterwards
+    """
+    global _nltk_checked
+    import nltk
+    
+    with _nltk_lock:
+        missing = []
+        for path, resource in NLTK_RESOURCES:
+            try:
+                nltk.data.find(path)
+            except LookupError:
+                missing.append(resource)
+        
+        if missing and not NLTK_OFFLINE and not _nltk_checked:
+            print(f"Downloading missing NLTK resources: {', '.join(missing)}")
+            missing = [resource for resource in missing if not nltk.download(resource, quiet=True)]
+        
+        if missing:
+            print(f"✗ NLTK resources unavailable, summaries will use RSS data: {', '.join(missing)}")
+        _nltk_checked = True
+        return missing
 
 def clean_url(url: str) -> str:
     """Clean and decode URL if needed"""
@@ -29,88 +65,891 @@ def clean_url(url: str) -> str:
     except:
         return url
 
-def get_news_articles(company_name: str) -> List[Dict[str, str]]:
+# Concurrency settings for article fetching
+MAX_FETCH_WORKERS = int(os.environ.get("FETCH_WORKERS", 8))                    # Total articles downloaded at once
+MAX_PER_DOMAIN = int(os.environ.get("FETCH_MAX_PER_DOMAIN", 2))                # Concurrent downloads against a single publisher
+DOMAIN_MIN_INTERVAL = float(os.environ.get("FETCH_DOMAIN_MIN_INTERVAL", 1.0))  # Seconds between request starts to the same publisher
+PARSE_WORKERS = int(os.environ.get("PARSE_WORKERS", 0))                        # Processes parsing downloaded pages; 0 parses on the download threads
+FETCH_TIMEOUT = float(os.environ.get("FETCH_TIMEOUT", 20))                      # Seconds an article download may take
+RSS_TIMEOUT = float(os.environ.get("RSS_TIMEOUT", 10))                          # Seconds the RSS feed request may take
+FETCH_HEDGE_AFTER = float(os.environ.get("FETCH_HEDGE_AFTER", 0))               # Seconds before a slow download is raced by a second request; 0 disables
+
+# A publisher is skipped for CIRCUIT_RESET_AFTER seconds after this many consecutive
+# timeouts or connection errors; 0 disables the circuit breaker
+CIRCUIT_FAILURES = int(os.environ.get("CIRCUIT_FAILURES", 3))
+CIRCUIT_RESET_AFTER = float(os.environ.get("CIRCUIT_RESET_AFTER", 60))
+
+# "newspaper" parses and summarizes every article with newspaper; "lean" parses with lxml
+# and summarizes only articles whose RSS item has no description
+EXTRACTION_MODE = os.environ.get("EXTRACTION_MODE", "newspaper")
+SUMMARY_SENTENCES = 5      # Sentences in a generated summary
+MIN_PARAGRAPH_WORDS = 5    # Shorter paragraphs (bylines, captions) are left out of lean extraction
+BOILERPLATE_TAGS = ("script", "style", "noscript", "nav", "header", "footer", "aside", "form", "iframe", "figcaption")
+REQUEST_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; NewsAnalyzer/1.0)"}
+
+# News search feed; {query} is replaced with the URL-encoded company name
+NEWS_RSS_URL = os.environ.get("NEWS_RSS_URL", "https://www.bing.com/news/search?q={query}&format=rss")
+
+def get_domain(url: str) -> str:
+    """Return the lower-cased host name of a URL's publisher, looking through redirect links"""
+    return urllib.parse.urlparse(unwrap_redirect(url)).netloc.lower()
+
+class DomainLimiter:
+    """Per-domain concurrency and rate limiting for article downloads"""
+
+    def __init__(self, max_concurrent: int = MAX_PER_DOMAIN, min_interval: float = DOMAIN_MIN_INTERVAL):
+        """
+        Initialize the limiter.
+        
+        Args:
+            max_concurrent (int): Maximum simultaneous requests per domain
+            min_interval (float): Minimum seconds between request starts per domain
+        """
+        self.max_concurrent = max_concurrent
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._next_slot: Dict[str, float] = {}
+
+    def _semaphore(self, domain: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if domain not in self._semaphores:
+                self._semaphores[domain] = threading.BoundedSemaphore(self.max_concurrent)
+            return self._semaphores[domain]
+
+    @contextmanager
+    def limit(self, url: str):
+        """Hold a slot for the URL's domain, waiting for the rate limit if needed"""
+        domain = get_domain(url)
+        with self._semaphore(domain):
+            # Reserve the next free start time for this domain
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_slot.get(domain, now))
+                self._next_slot[domain] = start + self.min_interval
+            if start > now:
+                time.sleep(start - now)
+            yield
+
+# Shared limiter, so concurrent analyses and batches stay polite to each publisher together
+domain_limiter = DomainLimiter()
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a request's latency budget runs out before a download starts or the RSS feed arrives"""
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a publisher is skipped because its circuit is open"""
+
+def remaining_timeout(deadline: Optional[float], timeout: float) -> float:
     """
-    Fetch top 10 news articles about a company from Bing News RSS feed.
+    Shorten a request timeout to the time left before a deadline.
+    
+    Args:
+        deadline (Optional[float]): time.monotonic() value to finish by, or None
+        timeout (float): Timeout used without a deadline
+        
+    Returns:
+        float: Seconds the request may take
+        
+    Raises:
+        DeadlineExceeded: If the deadline has already passed
+    """
+    if deadline is None:
+        return timeout
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceeded("Latency budget exhausted")
+    return min(timeout, remaining)
+
+class CircuitBreaker:
+    """
+    Per-domain circuit breaker for article downloads.
+    
+    After failure_threshold consecutive timeouts or connection errors a
+    domain's circuit opens and its articles use RSS data without a download.
+    Every reset_after seconds one trial download is let through; success
+    closes the circuit, otherwise it stays open for another period.
+    """
+    
+    def __init__(self, failure_threshold: int = CIRCUIT_FAILURES, reset_after: float = CIRCUIT_RESET_AFTER):
+        """
+        Initialize the breaker with every circuit closed.
+        
+        Args:
+            failure_threshold (int): Consecutive failures that open a circuit; 0 never opens
+            reset_after (float): Seconds a circuit stays open before a trial download
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+        self._lock = threading.Lock()
+        self._failures: Dict[str, int] = {}
+        self._opened_at: Dict[str, float] = {}
+    
+    def allow(self, domain: str) -> bool:
+        """Whether a download from the domain may start"""
+        with self._lock:
+            opened_at = self._opened_at.get(domain)
+            if opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - opened_at < self.reset_after:
+                return False
+            # Half-open: one trial download per period finds out whether the publisher recovered
+            self._opened_at[domain] = now
+            return True
+    
+    def record_success(self, domain: str) -> None:
+        """Close the domain's circuit"""
+        with self._lock:
+            self._failures.pop(domain, None)
+            if self._opened_at.pop(domain, None) is not None:
+                print(f"✓ Circuit closed for {domain}")
+    
+    def record_failure(self, domain: str) -> None:
+        """Count a timeout or connection error, opening the circuit at the threshold"""
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            self._failures[domain] = self._failures.get(domain, 0) + 1
+            if self._failures[domain] >= self.failure_threshold:
+                if domain not in self._opened_at:
+                    print(f"✗ Circuit opened for {domain} after {self._failures[domain]} failures")
+                self._opened_at[domain] = time.monotonic()
+    
+    def open_domains(self) -> List[str]:
+        """Domains whose circuits are open"""
+        with self._lock:
+            return sorted(self._opened_at)
+
+# Shared breaker, so every analysis learns from failures seen by the others
+circuit_breaker = CircuitBreaker()
+
+def fetch_rss_items(company_name: str, limit: int = 10, deadline: Optional[float] = None) -> List[Dict[str, str]]:
+    """
+    Fetch the Bing News RSS feed (or the feed at NEWS_RSS_URL) for a company.
     
     Args:
         company_name (str): Name of the company to search for
+        limit (int): Maximum number of items to return
+        deadline (Optional[float]): time.monotonic() value to finish by, shortening the timeout
         
     Returns:
-        List[Dict[str, str]]: List of dictionaries containing article information
+        List[Dict[str, str]]: RSS items with title, description, url and published
+            (the item's pubDate in publish_date format, or None)
+        
+    Raises:
+        requests.RequestException: If the feed cannot be fetched
+        DeadlineExceeded: If the deadline passes before the feed arrives
     """
     # Encode company name for URL
-    search_url = f"https://www.bing.com/news/search?q={urllib.parse.quote(company_name)}&format=rss"
+    search_url = NEWS_RSS_URL.format(query=urllib.parse.quote(company_name))
     
-    try:
-        # Fetch RSS feed
-        print(f"\nFetching news about {company_name}...")
-        response = requests.get(search_url, timeout=10)
+    print(f"\nFetching news about {company_name}...")
+    with span("rss_fetch"):
+        timeout = remaining_timeout(deadline, RSS_TIMEOUT)
+        try:
+            response = requests.get(search_url, timeout=timeout)
+        except requests.Timeout:
+            if timeout < RSS_TIMEOUT:
+                # Cut short by the deadline rather than a slow feed
+                raise DeadlineExceeded("Latency budget exhausted while fetching the RSS feed")
+            raise
         response.raise_for_status()
-        
-        # Parse RSS feed
+    
+    # Parse RSS feed
+    from bs4 import BeautifulSoup
+    with span("rss_parse"):
         soup = BeautifulSoup(response.content, features='xml')
+    
+    items = []
+    for item in soup.find_all('item')[:limit]:
+        # Extract title and description from RSS feed
+        items.append({
+            "title": item.title.text if item.title else "",
+            "description": item.description.text if item.description else "",
+            "url": clean_url(item.link.text if item.link else item.link.string),
+            "published": _normalize_date(item.pubDate.text) if item.pubDate else None
+        })
+    return items
+
+def rss_fallback(item: Dict[str, str], partial: bool = False) -> Optional[Dict]:
+    """
+    Build an article from RSS data alone, or None if the item is too sparse.
+    
+    Args:
+        item (Dict[str, str]): RSS item from fetch_rss_items
+        partial (bool): Whether the download was cut short by a deadline, so a
+            later request may still get the full article
+        
+    Returns:
+        Optional[Dict]: Article marked rss_only, or None
+    """
+    if not (item["title"] and item["description"]):
+        return None
+    return {
+        "title": item["title"],
+        "url": item["url"],
+        "summary": item["description"],
+        "content": item["description"],
+        "publish_date": item.get("published"),
+        "authors": [],
+        "rss_only": True,
+        "partial": partial
+    }
+
+def _get(url: str, timeout: float) -> bytes:
+    response = requests.get(url, headers=REQUEST_HEADERS, timeout=timeout)
+    response.raise_for_status()
+    return response.content
+
+def hedged_get(url: str, timeout: float, hedge_after: float = FETCH_HEDGE_AFTER) -> bytes:
+    """
+    Download a page, racing a second request if the first one is slow.
+    
+    If nothing has arrived after hedge_after seconds an identical request is
+    started and the first success wins; the slower request finishes on its
+    own daemon thread and is discarded.
+    
+    Args:
+        url (str): Page URL
+        timeout (float): Seconds the download may take in total
+        hedge_after (float): Seconds before hedging; 0 never hedges
+        
+    Returns:
+        bytes: The raw HTML
+        
+    Raises:
+        requests.RequestException: If every attempt fails
+    """
+    if hedge_after <= 0 or hedge_after >= timeout:
+        return _get(url, timeout)
+    
+    outcomes: queue.Queue = queue.Queue()
+    
+    def attempt(attempt_timeout: float):
+        try:
+            outcomes.put((True, _get(url, attempt_timeout)))
+        except Exception as e:
+            outcomes.put((False, e))
+    
+    threading.Thread(target=attempt, args=(timeout,), name="download", daemon=True).start()
+    try:
+        ok, value = outcomes.get(timeout=hedge_after)
+    except queue.Empty:
+        HEDGED_DOWNLOADS.inc()
+        threading.Thread(target=attempt, args=(timeout - hedge_after,), name="download-hedge", daemon=True).start()
+        ok, value = outcomes.get()
+        if not ok:
+            # The other attempt may still succeed
+            ok, value = outcomes.get()
+    if not ok:
+        raise value
+    return value
+
+def download_html(url: str, limiter: Optional[DomainLimiter] = None, deadline: Optional[float] = None) -> bytes:
+    """
+    Download an article page.
+    
+    Timeouts and connection errors count towards opening the domain's
+    circuit, and slow downloads are hedged when FETCH_HEDGE_AFTER is set.
+    
+    Args:
+        url (str): Article URL
+        limiter (Optional[DomainLimiter]): Limiter applied around the download
+        deadline (Optional[float]): time.monotonic() value to finish by, shortening the timeout
+        
+    Returns:
+        bytes: The raw HTML
         
-        articles = []
-        items = soup.find_all('item')[:10]
-        print(f"Found {len(items)} news items to process")
+    Raises:
+        requests.RequestException: If the page cannot be downloaded
+        CircuitOpenError: If the domain's circuit is open
+        DeadlineExceeded: If the deadline passed before the download started
+    """
+    domain = get_domain(url)
+    if not circuit_breaker.allow(domain):
+        raise CircuitOpenError(f"Skipping {domain} after repeated timeouts")
+    shortened = False
+    try:
+        with limiter.limit(url) if limiter is not None else nullcontext(), span("article_download", domain):
+            timeout = remaining_timeout(deadline, FETCH_TIMEOUT)
+            shortened = timeout < FETCH_TIMEOUT
+            html = hedged_get(url, timeout)
+    except requests.Timeout:
+        # Running out of a request's latency budget says little about the publisher
+        if not shortened:
+            circuit_breaker.record_failure(domain)
+        raise
+    except requests.ConnectionError:
+        circuit_breaker.record_failure(domain)
+        raise
+    except requests.RequestException:
+        # The publisher answered, so it is reachable
+        circuit_breaker.record_success(domain)
+        raise
+    circuit_breaker.record_success(domain)
+    return html
+
+def _normalize_date(value: str) -> Optional[str]:
+    """Format an ISO 8601 or RFC 822 date like newspaper does, or None if unparseable"""
+    value = value.strip()
+    try:
+        return str(datetime.datetime.fromisoformat(value.replace("Z", "+00:00")))
+    except ValueError:
+        pass
+    try:
+        return str(email.utils.parsedate_to_datetime(value))
+    except (TypeError, ValueError):
+        return None
+
+def parse_html(html: bytes, url: str = "") -> Dict:
+    """
+    Extract the title, body text, authors and publish date from an article page with lxml.
+    
+    The body is the <article> element, or otherwise the element whose direct
+    paragraphs hold the most text, after dropping navigation and other boilerplate.
+    No summary is generated; see summarize().
+    
+    Args:
+        html (bytes): Raw HTML
+        url (str): Page URL, used to resolve relative links
         
-        for item in items:
-            # Extract title and description from RSS feed
-            rss_title = item.title.text if item.title else ""
-            rss_description = item.description.text if item.description else ""
-            url = clean_url(item.link.text if item.link else item.link.string)
+    Returns:
+        Dict: Extracted title, text, summary (empty), authors and publish_date
+    """
+    import lxml.html
+    
+    doc = lxml.html.fromstring(html, base_url=url or None)
+    
+    def meta(*names: str) -> List[str]:
+        values = []
+        for name in names:
+            values.extend(
+                value.strip()
+                for value in doc.xpath("//meta[@property=$n or @name=$n or @itemprop=$n]/@content", n=name)
+                if value.strip()
+            )
+        return values
+    
+    title = next(iter(meta("og:title", "twitter:title")), "") or (doc.findtext(".//title") or "").strip()
+    if not title:
+        title = next((h1.text_content().strip() for h1 in doc.iter("h1")), "")
+    
+    dates = meta("article:published_time", "datePublished", "pubdate", "publishdate", "date") + doc.xpath("//time/@datetime")
+    publish_date = next((date for date in map(_normalize_date, dates) if date), None)
+    
+    authors = []
+    names = meta("author", "article:author") + [
+        element.text_content() for element in doc.xpath("//*[@rel='author' or @itemprop='author']")
+    ]
+    for name in names:
+        for author in re.split(r",|\band\b", name):
+            author = " ".join(author.split())
+            if author and not author.startswith("http") and author not in authors:
+                authors.append(author)
+    
+    for element in doc.xpath("|".join(f"//{tag}" for tag in BOILERPLATE_TAGS)):
+        element.drop_tree()
+    
+    def paragraphs(root) -> List[str]:
+        texts = (" ".join(p.text_content().split()) for p in root.iter("p"))
+        return [text for text in texts if len(text.split()) >= MIN_PARAGRAPH_WORDS]
+    
+    candidates = doc.xpath("//article")
+    if not candidates:
+        # Parents of paragraphs, scored by the paragraph text they directly contain
+        scores: Dict = {}
+        for p in doc.iter("p"):
+            parent = p.getparent()
+            if parent is not None:
+                scores[parent] = scores.get(parent, 0) + len(p.text_content())
+        candidates = [max(scores, key=scores.get)] if scores else [doc]
+    body = max(candidates, key=lambda element: sum(map(len, paragraphs(element))))
+    
+    return {
+        "title": title,
+        "text": "\n\n".join(paragraphs(body)),
+        "summary": "",
+        "authors": authors,
+        "publish_date": publish_date
+    }
+
+def summarize(title: str, text: str, max_sentences: int = SUMMARY_SENTENCES) -> str:
+    """
+    Summarize an article body.
+    
+    Uses newspaper's NLTK-based summarizer, falling back to the leading
+    sentences when NLTK data is unavailable.
+    
+    Args:
+        title (str): Article title, used to score sentences
+        text (str): Article body
+        max_sentences (int): Sentences in the summary
+        
+    Returns:
+        str: Summary sentences separated by newlines
+    """
+    with span("article_nlp"):
+        try:
+            from newspaper import nlp
+            if not _nltk_checked:
+                ensure_nltk_resources()
+            nlp.load_stopwords("en")
+            return "\n".join(nlp.summarize(title=title, text=text, max_sents=max_sentences))
+        except Exception as e:
+            print(f"  → Using leading sentences as summary ({type(e).__name__})")
+            sentences = re.split(r"(?<=[.!?])\s+", " ".join(text.split()))
+            return "\n".join(sentence for sentence in sentences[:max_sentences] if sentence)
+
+def decode_html(html: bytes) -> str:
+    """Decode a page using its declared or detected encoding"""
+    from bs4 import UnicodeDammit
+    return UnicodeDammit(html, is_html=True).unicode_markup or html.decode("utf-8", errors="replace")
+
+def parse_page(html: bytes, url: str, mode: str = EXTRACTION_MODE) -> Tuple[Dict, Dict[str, float], Optional[str]]:
+    """
+    Parse a downloaded article page.
+    
+    Runs in ParsePool worker processes, where spans would not reach this
+    process's metrics, so stage durations are returned for the caller to observe.
+    
+    Args:
+        html (bytes): Raw HTML
+        url (str): Page URL
+        mode (str): "newspaper" to parse and summarize with newspaper, "lean" for parse_html
+        
+    Returns:
+        Tuple: Extracted title, text, summary, authors and publish_date; seconds per
+        stage; and the nlp() error if newspaper could not summarize
+        
+    Raises:
+        Exception: If the page cannot be parsed
+    """
+    durations: Dict[str, float] = {}
+    started = time.perf_counter()
+    if mode == "lean":
+        extracted = parse_html(html, url)
+        durations["article_parse"] = time.perf_counter() - started
+        return extracted, durations, None
+    
+    from newspaper import Article
+    article = Article(url)
+    article.download(input_html=decode_html(html))
+    article.parse()
+    durations["article_parse"] = time.perf_counter() - started
+    
+    nlp_error = None
+    started = time.perf_counter()
+    try:
+        article.nlp()  # This generates summary
+    except Exception as e:
+        nlp_error = str(e)
+        # Leave the summary empty so the RSS description is used
+        article.summary = ""
+    durations["article_nlp"] = time.perf_counter() - started
+    
+    return {
+        "title": article.title,
+        "text": article.text,
+        "summary": article.summary,
+        "authors": article.authors if article.authors else [],
+        "publish_date": str(article.publish_date) if article.publish_date else None
+    }, durations, nlp_error
+
+def _init_parse_worker() -> None:
+    """Parse worker initializer; NLTK data is checked by the parent before pages are sent"""
+    global _nltk_checked
+    _nltk_checked = True
+
+class ParsePool:
+    """
+    Process pool that parses downloaded pages off the download threads.
+    
+    Parsing is CPU-bound and holds the GIL, so on the download threads it
+    uses about one core. Download threads instead send the raw HTML bytes
+    here and wait for the extracted fields, letting parsing use PARSE_WORKERS
+    cores while the threads keep downloading.
+    """
+    
+    def __init__(self, workers: int = PARSE_WORKERS):
+        """
+        Initialize the pool; worker processes start on first use.
+        
+        Args:
+            workers (int): Number of parse processes
+        """
+        self.workers = workers
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn rather than fork: the parent may hold model threads and locks
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_parse_worker
+                )
+            return self._executor
+    
+    def start(self) -> None:
+        """Start every worker process now instead of on the first pages"""
+        executor = self._get_executor()
+        for future in [executor.submit(_init_parse_worker) for _ in range(self.workers)]:
+            future.result()
+    
+    def parse(self, html: bytes, url: str) -> Tuple[Dict, Dict[str, float], Optional[str]]:
+        """
+        Parse a page in a worker process; see parse_page.
+        
+        If a worker dies, the pool is replaced and this page is parsed in the calling thread.
+        """
+        executor = self._get_executor()
+        try:
+            return executor.submit(parse_page, html, url, EXTRACTION_MODE).result()
+        except BrokenProcessPool as e:
+            print(f"✗ Parse worker failed, parsing in-thread: {str(e)}")
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+            return parse_page(html, url)
+    
+    def shutdown(self) -> None:
+        """Stop the worker processes; the next parse starts new ones"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+_parse_pool: Optional[ParsePool] = None
+_parse_pool_lock = threading.Lock()
+
+def get_parse_pool() -> Optional[ParsePool]:
+    """Return the shared parse pool, or None when PARSE_WORKERS is 0"""
+    global _parse_pool
+    if PARSE_WORKERS <= 0:
+        return None
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ParsePool(PARSE_WORKERS)
+        return _parse_pool
+
+def extract_article(url: str, limiter: Optional[DomainLimiter] = None,
+                    parse_pool: Optional[ParsePool] = None, deadline: Optional[float] = None) -> Dict:
+    """
+    Download an article and parse it using the configured EXTRACTION_MODE.
+    
+    Args:
+        url (str): Article URL
+        limiter (Optional[DomainLimiter]): Limiter applied around the download
+        parse_pool (Optional[ParsePool]): Processes to parse in; None parses in this thread
+        deadline (Optional[float]): time.monotonic() value to finish the download by
+        
+    Returns:
+        Dict: Extracted title, text, summary, authors and publish_date; the
+        summary is empty in lean mode
+        
+    Raises:
+        Exception: If the article cannot be downloaded or parsed
+    """
+    if EXTRACTION_MODE != "lean" and not _nltk_checked:
+        ensure_nltk_resources()
+    
+    html = download_html(url, limiter, deadline)
+    if parse_pool is not None:
+        extracted, durations, nlp_error = parse_pool.parse(html, url)
+    else:
+        extracted, durations, nlp_error = parse_page(html, url)
+    
+    domain = get_domain(url)
+    for stage, seconds in durations.items():
+        observe(stage, seconds, domain if stage == "article_parse" else None)
+    if nlp_error is not None:
+        print(f"  → Using RSS data due to NLP error: {nlp_error}")
+        RSS_FALLBACKS.inc(reason="nlp_error")
+    return extracted
+
+def build_article(item: Dict[str, str], extracted: Dict) -> Dict:
+    """Combine extracted article data with the RSS item it came from"""
+    return {
+        "title": extracted["title"] or item["title"],  # Fallback to RSS title if needed
+        "url": item["url"],
+        "summary": extracted["summary"] or item["description"],  # Fallback to RSS description
+        "content": extracted["text"],
+        "publish_date": extracted["publish_date"] or item.get("published"),  # Fallback to RSS pubDate
+        "authors": extracted["authors"],
+        "rss_only": False,
+        "partial": False
+    }
+
+def needs_summary(item: Dict[str, str], extracted: Dict) -> bool:
+    """Whether an article has neither an extracted summary nor an RSS description to use instead"""
+    return not extracted["summary"] and not item["description"] and bool(extracted["text"])
+
+def fetch_article(item: Dict[str, str], limiter: Optional[DomainLimiter] = None,
+                  cache: Optional[ArticleCache] = None, parse_pool: Optional[ParsePool] = None,
+                  deadline: Optional[float] = None) -> Optional[Dict]:
+    """
+    Fetch a single article, falling back to RSS data on failure.
+    
+    Articles built from RSS data alone are marked rss_only, and also partial
+    when the deadline cut the download short.
+    
+    Args:
+        item (Dict[str, str]): RSS item from fetch_rss_items
+        limiter (Optional[DomainLimiter]): Limiter applied around the download
+        cache (Optional[ArticleCache]): Store consulted before downloading
+        parse_pool (Optional[ParsePool]): Processes to parse in; None parses in this thread
+        deadline (Optional[float]): time.monotonic() value to finish the download by
+        
+    Returns:
+        Optional[Dict]: Article dictionary, or None if nothing usable was found
+    """
+    url = item["url"]
+    
+    if cache is not None:
+        extracted = cache.get(url)
+        if extracted is not None:
+            print(f"\n✓ Cached: {item['title']}")
+            if needs_summary(item, extracted):
+                extracted["summary"] = summarize(extracted["title"], extracted["text"])
+                cache.put(url, extracted)
+            return build_article(item, extracted)
+    
+    try:
+        print(f"\nProcessing: {item['title']}")
+        with span("article_fetch", get_domain(url)):
+            extracted = extract_article(url, limiter, parse_pool, deadline)
+        # Lean extraction leaves the summary to the RSS description unless there is none
+        if needs_summary(item, extracted):
+            extracted["summary"] = summarize(extracted["title"], extracted["text"])
+        if cache is not None:
+            cache.put(url, extracted)
+        print(f"✓ Successfully processed article")
+        return build_article(item, extracted)
+        
+    except Exception as e:
+        print(f"✗ Error processing article: {str(e)}")
+        # Try to add article with RSS data if article processing fails
+        past_deadline = isinstance(e, DeadlineExceeded) or (deadline is not None and time.monotonic() >= deadline)
+        article_data = rss_fallback(item, partial=past_deadline)
+        if article_data:
+            print(f"  → Added article using RSS data")
+            if isinstance(e, CircuitOpenError):
+                RSS_FALLBACKS.inc(reason="circuit_open")
+            elif not past_deadline:
+                RSS_FALLBACKS.inc(reason="extract_error")
+            # Past the deadline the fetcher has already used RSS data and counted it
+        return article_data
+
+class ArticleFetcher:
+    """Fetch articles concurrently while staying polite to each publisher"""
+
+    def __init__(self, max_workers: int = MAX_FETCH_WORKERS, limiter: Optional[DomainLimiter] = None,
+                 cache: Optional[ArticleCache] = None, parse_pool: Optional[ParsePool] = None):
+        """
+        Initialize the fetcher.
+        
+        Args:
+            max_workers (int): Size of the download worker pool
+            limiter (Optional[DomainLimiter]): Per-domain limiter, the shared one if not given
+            cache (Optional[ArticleCache]): Article store; None disables caching
+            parse_pool (Optional[ParsePool]): Parse processes, the shared pool if not given
+        """
+        self.max_workers = max_workers
+        self.limiter = limiter or domain_limiter
+        self.cache = cache
+        self.parse_pool = parse_pool or get_parse_pool()
+
+    def fetch_all(self, items: List[Dict[str, str]], deadline: Optional[float] = None) -> List[Dict]:
+        """
+        Fetch every RSS item and return the articles in RSS order.
+        
+        Args:
+            items (List[Dict[str, str]]): RSS items from fetch_rss_items
+            deadline (Optional[float]): time.monotonic() value after which unfinished
+                articles use RSS data; see iter_completed
             
+        Returns:
+            List[Dict]: Articles, skipping items with no usable data
+        """
+        if not items:
+            return []
+        
+        if deadline is not None:
+            return [article for _, article in sorted(self.iter_completed(items, deadline), key=lambda pair: pair[0])]
+        
+        workers = min(self.max_workers, len(items))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fetch") as pool:
+            fetch = bind(fetch_article)
+            results = list(pool.map(lambda item: fetch(item, self.limiter, self.cache, self.parse_pool), items))
+        
+        return [article for article in results if article]
+
+    def iter_completed(self, items: List[Dict[str, str]],
+                       deadline: Optional[float] = None) -> Iterator[Tuple[int, Dict]]:
+        """
+        Fetch every RSS item, yielding each article as soon as it is ready.
+        
+        Args:
+            items (List[Dict[str, str]]): RSS items from fetch_rss_items
+            deadline (Optional[float]): time.monotonic() value to stop waiting at; articles
+                still downloading then are yielded from RSS data, marked partial
+            
+        Yields:
+            Tuple[int, Dict]: RSS position and article, in completion order
+        """
+        if not items:
+            return
+        
+        workers = min(self.max_workers, len(items))
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fetch")
+        try:
+            # Bound so per-article spans reach the caller's request timings
+            fetch = bind(fetch_article)
+            futures = {
+                pool.submit(fetch, item, self.limiter, self.cache, self.parse_pool, deadline): index
+                for index, item in enumerate(items)
+            }
+            pending = set(futures)
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
             try:
-                print(f"\nProcessing: {rss_title}")
-                
-                # Initialize Article object with longer timeout
-                article = Article(url, timeout=20)
-                article.download()
-                time.sleep(1)  # Add small delay to avoid overwhelming servers
-                article.parse()
-                
-                try:
-                    article.nlp()  # This generates summary
-                except Exception as nlp_error:
-                    print(f"  → Using RSS data due to NLP error: {str(nlp_error)}")
-                    # Continue with RSS data if NLP fails
-                    article.summary = rss_description
-                
-                # Create article dictionary with extracted information
-                article_data = {
-                    "title": article.title or rss_title,  # Fallback to RSS title if needed
-                    "url": url,
-                    "summary": article.summary or rss_description,  # Fallback to RSS description
-                    "content": article.text,
-                    "publish_date": str(article.publish_date) if article.publish_date else None,
-                    "authors": article.authors if article.authors else []
-                }
-                
-                articles.append(article_data)
-                print(f"✓ Successfully processed article")
-                
-            except Exception as e:
-                print(f"✗ Error processing article: {str(e)}")
-                # Try to add article with RSS data if article processing fails
-                if rss_title and rss_description:
-                    article_data = {
-                        "title": rss_title,
-                        "url": url,
-                        "summary": rss_description,
-                        "content": rss_description,
-                        "publish_date": None,
-                        "authors": []
-                    }
-                    articles.append(article_data)
-                    print(f"  → Added article using RSS data")
-                continue
-                
-        return articles
+                for future in as_completed(futures, timeout=timeout):
+                    pending.discard(future)
+                    article = future.result()
+                    if article:
+                        yield futures[future], article
+            except FuturesTimeoutError:
+                late = [future for future in pending if not future.done()]
+                print(f"✗ Latency budget reached with {len(late)} articles still downloading, using RSS data")
+                for future in sorted(pending, key=futures.get):
+                    if future.done():
+                        # Finished between the timeout and now
+                        article = future.result()
+                    else:
+                        article = rss_fallback(items[futures[future]], partial=True)
+                        if article:
+                            RSS_FALLBACKS.inc(reason="deadline")
+                    if article:
+                        yield futures[future], article
+        finally:
+            # Stop queued downloads if the consumer gives up early
+            pool.shutdown(wait=False, cancel_futures=True)
+
+def get_news_articles(company_name: str, max_workers: int = MAX_FETCH_WORKERS,
+                      use_cache: bool = True, deadline: Optional[float] = None) -> List[Dict[str, str]]:
+    """
+    Fetch top 10 news articles about a company from Bing News RSS feed.
+    
+    Args:
+        company_name (str): Name of the company to search for
+        max_workers (int): Number of articles downloaded concurrently
+        use_cache (bool): Reuse previously extracted articles from the on-disk cache
+        deadline (Optional[float]): time.monotonic() value after which unfinished
+            articles use RSS data
+        
+    Returns:
+        List[Dict[str, str]]: List of dictionaries containing article information
         
+    Raises:
+        DeadlineExceeded: If the deadline passes before the RSS feed arrives
+    """
+    try:
+        items = fetch_rss_items(company_name, deadline=deadline)
     except requests.RequestException as e:
         print(f"Error fetching news: {str(e)}")
         return []
+    
+    print(f"Found {len(items)} news items to process")
+    cache = get_article_cache() if use_cache else None
+    return ArticleFetcher(max_workers=max_workers, cache=cache).fetch_all(items, deadline)
+
+def iter_news_articles(company_name: str, max_workers: int = MAX_FETCH_WORKERS,
+                       use_cache: bool = True, deadline: Optional[float] = None) -> Iterator[Tuple[int, Dict]]:
+    """
+    Streaming variant of get_news_articles that yields articles as they finish.
+    
+    Args:
+        company_name (str): Name of the company to search for
+        max_workers (int): Number of articles downloaded concurrently
+        use_cache (bool): Reuse previously extracted articles from the on-disk cache
+        deadline (Optional[float]): time.monotonic() value after which unfinished
+            articles use RSS data
+        
+    Yields:
+        Tuple[int, Dict]: RSS position and article, in completion order
+        
+    Raises:
+        DeadlineExceeded: If the deadline passes before the RSS feed arrives
+    """
+    try:
+        items = fetch_rss_items(company_name, deadline=deadline)
+    except requests.RequestException as e:
+        print(f"Error fetching news: {str(e)}")
+        return
+    
+    print(f"Found {len(items)} news items to process")
+    cache = get_article_cache() if use_cache else None
+    yield from ArticleFetcher(max_workers=max_workers, cache=cache).iter_completed(items, deadline)
+
+def get_news_for_companies(companies: List[str], max_workers: int = MAX_FETCH_WORKERS,
+                           use_cache: bool = True) -> Dict[str, List[Dict]]:
+    """
+    Fetch news for several companies through one shared pool.
+    
+    RSS feeds are fetched concurrently, and an article found for several
+    companies is downloaded only once.
+    
+    Args:
+        companies (List[str]): Company names to search for
+        max_workers (int): Number of feeds or articles downloaded concurrently
+        use_cache (bool): Reuse previously extracted articles from the on-disk cache
+        
+    Returns:
+        Dict[str, List[Dict]]: Each company's articles in RSS order; shared articles are
+        separate copies so they can be annotated per company
+    """
+    if not companies:
+        return {}
+    
+    def feed(company: str) -> List[Dict[str, str]]:
+        try:
+            return fetch_rss_items(company)
+        except requests.RequestException as e:
+            print(f"Error fetching news for {company}: {str(e)}")
+            return []
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(companies)), thread_name_prefix="rss") as pool:
+        feeds = list(pool.map(bind(feed), companies))
+    
+    # Download each distinct URL once, whichever feeds it appeared in
+    items: Dict[str, Dict[str, str]] = {}
+    keys_by_company: Dict[str, List[str]] = {}
+    for company, company_items in zip(companies, feeds):
+        keys = keys_by_company.setdefault(company, [])
+        for item in company_items:
+            key = normalize_url(item["url"])
+            items.setdefault(key, item)
+            if key not in keys:
+                keys.append(key)
+    
+    print(f"Found {sum(len(keys) for keys in keys_by_company.values())} news items "
+          f"({len(items)} distinct) for {len(companies)} companies")
+    cache = get_article_cache() if use_cache else None
+    unique_keys = list(items)
+    fetched = {
+        unique_keys[index]: article
+        for index, article in ArticleFetcher(max_workers=max_workers, cache=cache).iter_completed(
+            [items[key] for key in unique_keys]
+        )
+    }
+    
+    return {
+        company: [dict(fetched[key]) for key in keys if key in fetched]
+        for company, keys in keys_by_company.items()
+    }
 
 if __name__ == "__main__":
     # Example usage
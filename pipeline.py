@@ -0,0 +1,270 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional
+import os
+import time
+
+from news_scraper import get_news_for_companies, iter_news_articles
+from sentiment_analysis import get_analyzer, process_article_stream
+from comparative_analysis import ComparativeAnalyzer, analyze_articles
+from article_cache import normalize_url
+from result_cache import normalize_company
+from audio_tasks import audio_task_manager
+from history_store import get_history_store
+from dedup import DEDUP_ENABLED, Deduplicator, unique_articles
+from metrics import collect_timings, observe, span
+
+# Stages reported by run_analysis, in execution order
+STAGES = ("scrape", "sentiment", "comparative", "audio")
+
+# Downloads running at once for a batch of companies; per-publisher limits still apply
+BATCH_FETCH_WORKERS = int(os.environ.get("BATCH_FETCH_WORKERS", 32))
+
+# Share of a latency budget spent fetching; the rest covers inference on late
+# RSS fallbacks and the comparative analysis
+SCRAPE_BUDGET_SHARE = float(os.environ.get("SCRAPE_BUDGET_SHARE", 0.75))
+
+# Callback receiving a stage name and a dict of progress fields
+ProgressCallback = Callable[[str, Dict[str, Any]], None]
+
+class NoArticlesError(LookupError):
+    """Raised when no news articles could be found for a company"""
+
+def budget_deadline(latency_budget_ms: Optional[int]) -> Optional[float]:
+    """
+    Turn a latency budget starting now into a deadline.
+
+    Compute it when the request arrives, so time spent queued counts against the budget.
+
+    Args:
+        latency_budget_ms (Optional[int]): Milliseconds the request should take, or None
+
+    Returns:
+        Optional[float]: time.monotonic() value to finish by, or None without a budget
+    """
+    return None if latency_budget_ms is None else time.monotonic() + latency_budget_ms / 1000
+
+def record_history(company: str, articles) -> None:
+    """Add analyzed articles to the history store; failures never fail the analysis"""
+    store = get_history_store()
+    if store is None:
+        return
+    try:
+        with span("history"):
+            changed = store.record(company, articles)
+        print(f"✓ Recorded {changed} new or updated articles in history")
+    except Exception as e:
+        print(f"✗ Error recording history: {str(e)}")
+
+def iter_analysis(company: str, generate_audio: bool = True,
+                  progress: Optional[ProgressCallback] = None,
+                  deadline: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Run the full analysis pipeline for a company, yielding results as they are ready.
+
+    - Fetches news articles and analyzes sentiment as they arrive,
+      once per cluster of near-duplicate articles
+    - Generates comparative analysis
+    - Schedules Hindi TTS audio in the background (optional)
+
+    Events are dicts with an "event" key:
+    "article" (position and article with sentiment, in completion order;
+    near-duplicates follow their cluster representatives and carry duplicate_of),
+    "analysis" (comparative analysis, articles in RSS order and whether any is partial) and
+    "audio" (audio file name and status, or None). Audio is generated
+    in the background, so the file may still be pending.
+
+    With a deadline, articles still downloading once SCRAPE_BUDGET_SHARE of the
+    time left has passed are analyzed from their RSS data and marked partial.
+
+    Args:
+        company (str): Name of the company to analyze
+        generate_audio (bool): Whether to synthesize the Hindi summary
+        progress (Optional[ProgressCallback]): Called as each stage advances
+        deadline (Optional[float]): time.monotonic() value to finish by; see budget_deadline
+
+    Yields:
+        Dict[str, Any]: Pipeline events
+
+    Raises:
+        NoArticlesError: If no articles were found
+        DeadlineExceeded: If the deadline passed before the RSS feed arrived
+    """
+    def report(stage: str, **fields):
+        if progress is not None:
+            progress(stage, fields)
+
+    print(f"\nProcessing request for company: {company}")
+    scrape_deadline = None
+    if deadline is not None:
+        now = time.monotonic()
+        scrape_deadline = now + max(0.0, deadline - now) * SCRAPE_BUDGET_SHARE
+
+    # Fetch articles and analyze sentiment as each one arrives
+    report("scrape", status="running")
+    report("sentiment", status="running")
+    # Only one article per cluster of near-duplicates goes through the model
+    deduplicator = Deduplicator() if DEDUP_ENABLED else None
+    stream = iter_news_articles(company, deadline=scrape_deadline)
+    if deduplicator is not None:
+        stream = deduplicator.filter(stream)
+    
+    def analyzed():
+        yield from process_article_stream(stream)
+        if deduplicator is not None:
+            # Duplicates share their representative's sentiment
+            yield from deduplicator.resolve()
+    
+    collected = []
+    started = time.perf_counter()
+    for position, article in analyzed():
+        collected.append((position, article))
+        report("scrape", completed=len(collected))
+        report("sentiment", completed=len(collected))
+        yield {"event": "article", "position": position, "article": article}
+    # Fetching and inference overlap, so they are timed together here
+    observe("fetch_and_sentiment", time.perf_counter() - started)
+    report("scrape", status="done")
+    report("sentiment", status="done")
+
+    # Restore RSS order
+    articles_with_sentiment = [article for _, article in sorted(collected, key=lambda pair: pair[0])]
+    if not articles_with_sentiment:
+        raise NoArticlesError(f"No news articles found for {company}")
+
+    # Generate comparative analysis
+    report("comparative", status="running")
+    # Syndicated copies count once so they do not skew the distribution
+    with span("comparative"):
+        analysis = analyze_articles(unique_articles(articles_with_sentiment))
+    report("comparative", status="done")
+    record_history(company, unique_articles(articles_with_sentiment))
+    yield {
+        "event": "analysis",
+        "articles": articles_with_sentiment,
+        "sentiment_analysis": analysis,
+        "partial": any(article.get("partial") for article in articles_with_sentiment)
+    }
+
+    # Schedule audio if requested; the result never waits on speech synthesis
+    audio_file = None
+    audio_status = None
+    if generate_audio:
+        audio_file, audio_status = audio_task_manager.submit_summary(analysis)
+        report("audio", status=audio_status, audio_file=audio_file)
+    else:
+        report("audio", status="skipped")
+    yield {"event": "audio", "audio_file": audio_file, "audio_status": audio_status}
+
+def run_analysis(company: str, generate_audio: bool = True,
+                 progress: Optional[ProgressCallback] = None,
+                 deadline: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Run the full analysis pipeline for a company and return the complete result.
+
+    Args:
+        company (str): Name of the company to analyze
+        generate_audio (bool): Whether to synthesize the Hindi summary
+        progress (Optional[ProgressCallback]): Called as each stage advances
+        deadline (Optional[float]): time.monotonic() value to finish by; see iter_analysis
+
+    Returns:
+        Dict with articles, sentiment_analysis, partial (whether any article only has
+        RSS data), audio_file, audio_status and timings (per-stage and per-publisher
+        breakdown of this run)
+
+    Raises:
+        NoArticlesError: If no articles were found
+        DeadlineExceeded: If the deadline passed before the RSS feed arrived
+    """
+    result: Dict[str, Any] = {}
+    with collect_timings() as timings, span("analysis"):
+        for event in iter_analysis(company, generate_audio, progress, deadline):
+            if event["event"] == "analysis":
+                result["articles"] = event["articles"]
+                result["sentiment_analysis"] = event["sentiment_analysis"]
+                result["partial"] = event["partial"]
+            elif event["event"] == "audio":
+                result["audio_file"] = event["audio_file"]
+                result["audio_status"] = event["audio_status"]
+    result["timings"] = timings.to_dict()
+    return result
+
+def run_batch_analysis(companies: List[str], generate_audio: bool = False) -> Dict[str, Any]:
+    """
+    Analyze several companies together and compare them.
+
+    - Fetches every RSS feed and article through one shared pool, downloading
+      an article found for several companies only once
+    - Analyzes sentiment for all companies in combined model batches, once per
+      distinct article and cluster of near-duplicates
+    - Generates each company's comparative analysis and a cross-company comparison
+    - Schedules Hindi TTS audio for each company in the background (optional)
+
+    Args:
+        companies (List[str]): Names of the companies to analyze; repeats are ignored
+        generate_audio (bool): Whether to synthesize each company's Hindi summary
+
+    Returns:
+        Dict with "companies" (name -> result like run_analysis, or an "error"),
+        "comparison" from ComparativeAnalyzer.compare_companies and fetch/inference "stats"
+    """
+    # Keep the first spelling of each company
+    names: Dict[str, str] = {}
+    for company in companies:
+        names.setdefault(normalize_company(company), company.strip())
+    companies = list(names.values())
+    print(f"\nProcessing batch request for {len(companies)} companies")
+
+    articles_by_company = get_news_for_companies(companies, max_workers=BATCH_FETCH_WORKERS)
+
+    # Mark near-duplicates within each company, hashing each article once
+    if DEDUP_ENABLED:
+        fingerprints: Dict[str, Optional[int]] = {}
+        for articles in articles_by_company.values():
+            deduplicator = Deduplicator(fingerprints=fingerprints)
+            for article in articles:
+                deduplicator.add(article)
+
+    # Score every distinct representative in one combined pass
+    distinct: Dict[str, Dict] = {}
+    for articles in articles_by_company.values():
+        for article in unique_articles(articles):
+            distinct.setdefault(normalize_url(article["url"]), article)
+    sentiments = dict(zip(distinct, get_analyzer().analyze_batch(list(distinct.values()))))
+    print(f"✓ Analyzed {len(distinct)} distinct articles for {len(companies)} companies")
+
+    results: Dict[str, Any] = {}
+    unique_by_company: Dict[str, List[Dict]] = {}
+    for company, articles in articles_by_company.items():
+        if not articles:
+            results[company] = {"error": f"No news articles found for {company}"}
+            continue
+        for article in articles:
+            # Duplicates share their representative's sentiment
+            source = article.get("duplicate_of") or article["url"]
+            article["sentiment"] = dict(sentiments[normalize_url(source)])
+
+        unique = unique_by_company[company] = unique_articles(articles)
+        analysis = analyze_articles(unique)
+        record_history(company, unique)
+
+        audio_file = None
+        audio_status = None
+        if generate_audio:
+            audio_file, audio_status = audio_task_manager.submit_summary(analysis)
+        results[company] = {
+            "articles": articles,
+            "sentiment_analysis": analysis,
+            "partial": any(article.get("partial") for article in articles),
+            "audio_file": audio_file,
+            "audio_status": audio_status
+        }
+
+    return {
+        "companies": results,
+        "comparison": ComparativeAnalyzer().compare_companies(unique_by_company),
+        "stats": {
+            "companies": len(companies),
+            "articles": sum(len(articles) for articles in articles_by_company.values()),
+            "analyzed": len(distinct)
+        }
+    }
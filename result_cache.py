@@ -0,0 +1,132 @@
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
+import os
+import threading
+import time
+
+# Seconds a finished analysis is served as fresh
+DEFAULT_TTL = float(os.environ.get("ANALYSIS_CACHE_TTL", 300))
+
+# Further seconds a stale analysis is served while a refresh runs in the background
+DEFAULT_STALE_TTL = float(os.environ.get("ANALYSIS_CACHE_STALE_TTL", 900))
+
+# Finished analyses kept before the least recently used are dropped
+DEFAULT_MAX_ENTRIES = int(os.environ.get("ANALYSIS_CACHE_MAX_ENTRIES", 256))
+
+# Cache statuses reported to clients
+HIT = "HIT"              # Fresh cached result
+STALE = "STALE"          # Stale result served while revalidating
+COALESCED = "COALESCED"  # Joined a computation already in flight
+MISS = "MISS"            # Started a new computation
+
+def normalize_company(company: str) -> str:
+    """Normalize a company name so equivalent requests share a cache key"""
+    return " ".join(company.lower().split())
+
+def _resolved(value: Any) -> Future:
+    future: Future = Future()
+    future.set_result(value)
+    return future
+
+class ResultCache:
+    """Single-flight cache of finished results with stale-while-revalidate"""
+
+    def __init__(self, ttl: float = DEFAULT_TTL, stale_ttl: float = DEFAULT_STALE_TTL,
+                 max_entries: int = DEFAULT_MAX_ENTRIES, cacheable: Optional[Callable[[Any], bool]] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl (float): Seconds a result is fresh
+            stale_ttl (float): Seconds after ttl a result may be served while refreshing
+            max_entries (int): Maximum finished results kept
+            cacheable (Optional[Callable[[Any], bool]]): Whether a finished result may be
+                kept; others are only shared with requests that joined while in flight
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.cacheable = cacheable
+        # Re-entrant because done callbacks can run immediately inside _start
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Any, Future] = {}
+        self.counts = {HIT: 0, STALE: 0, COALESCED: 0, MISS: 0}
+
+    def get_or_submit(self, key: Any, submit: Callable[[], Future], variant: Any = None) -> Tuple[Future, str]:
+        """
+        Return a future for the key's result, starting a computation only if needed.
+
+        A finished result is stored under the key alone and served to every variant,
+        but requests only join computations in flight for their own variant.
+
+        Args:
+            key: Cache key
+            submit (Callable[[], Future]): Starts the computation and returns its future
+            variant: Request options that may change this run's result without changing
+                what is cached, such as a latency budget
+
+        Returns:
+            Tuple[Future, str]: Future resolving to the result, and the cache status
+        """
+        with self._lock:
+            now = time.time()
+            entry = self._entries.get(key)
+            inflight = self._inflight.get((key, variant))
+            age = now - entry[0] if entry else None
+
+            if entry and age <= self.ttl:
+                status, future = HIT, _resolved(entry[1])
+                self._entries.move_to_end(key)
+            elif entry and age <= self.ttl + self.stale_ttl:
+                # Serve the stale copy and refresh it in the background
+                if inflight is None:
+                    self._start(key, variant, submit)
+                status, future = STALE, _resolved(entry[1])
+                self._entries.move_to_end(key)
+            elif inflight is not None:
+                status, future = COALESCED, inflight
+            else:
+                status, future = MISS, self._start(key, variant, submit)
+
+            self.counts[status] += 1
+            return future, status
+
+    def _start(self, key: Any, variant: Any, submit: Callable[[], Future]) -> Future:
+        future = submit()
+        self._inflight[(key, variant)] = future
+        future.add_done_callback(lambda done: self._finish(key, variant, done))
+        return future
+
+    def _finish(self, key: Any, variant: Any, future: Future) -> None:
+        """Store a successful result; failures and uncacheable results are not cached"""
+        with self._lock:
+            if self._inflight.get((key, variant)) is future:
+                del self._inflight[(key, variant)]
+            if future.cancelled() or future.exception() is not None:
+                return
+            if self.cacheable is not None and not self.cacheable(future.result()):
+                # A stale entry, if any, keeps being served until it expires
+                return
+            self._entries[key] = (time.time(), future.result())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Any) -> None:
+        """Drop a cached result"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return lookup counts by status and the hit rate"""
+        with self._lock:
+            lookups = sum(self.counts.values())
+            served = self.counts[HIT] + self.counts[STALE] + self.counts[COALESCED]
+            return {
+                "lookups": dict(self.counts),
+                "hit_rate": served / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "in_flight": len(self._inflight)
+            }
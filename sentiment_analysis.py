@@ -1,15 +1,137 @@
-from transformers import pipeline
-from typing import List, Dict, Union
+from typing import List, Dict, Union, Optional, Any, Iterable, Iterator, Tuple
+import os
+import queue
+import threading
 import time
 
+from inference_cache import InferenceCache, get_inference_cache
+from metrics import SENTIMENT_ERRORS, bind, span
+
+# Number of texts sent through the model in one forward pass
+DEFAULT_BATCH_SIZE = int(os.environ.get("SENTIMENT_BATCH_SIZE", 16))
+
+# Texts are cut to this many characters before inference
+MAX_TEXT_LENGTH = 512
+
+# Where the article body sentiment comes from: "summary" scores the summary text,
+# "windows" scores the full article content with overlapping token windows
+DEFAULT_CONTENT_MODE = os.environ.get("SENTIMENT_CONTENT_MODE", "summary")
+
+# Model used by every backend (the transformers sentiment-analysis default)
+MODEL_NAME = "distilbert/distilbert-base-uncased-finetuned-sst-2-english"
+
+# Inference backend: "torch" (reference), "quantized" (dynamic int8 torch) or "onnx" (ONNX Runtime)
+BACKENDS = ("torch", "quantized", "onnx")
+DEFAULT_BACKEND = os.environ.get("SENTIMENT_BACKEND", "torch")
+
+# Directory holding the exported ONNX model; exported on first use if missing
+ONNX_MODEL_PATH = os.environ.get("SENTIMENT_ONNX_PATH", os.path.join("models", "sentiment-onnx"))
+
+# Headlines used to compare a backend against the torch reference
+PARITY_SAMPLES = [
+    "Company shares surge after record quarterly earnings",
+    "Regulators open investigation into accounting practices",
+    "CEO announces plans to step down at the end of the year",
+    "New product launch receives glowing reviews from analysts",
+    "Layoffs hit thousands of employees amid restructuring",
+    "Partnership expected to expand the firm's cloud business",
+    "Outage disrupts services for millions of customers",
+    "Quarterly revenue in line with market expectations"
+]
+
+# Sliding-window settings for full-article sentiment
+WINDOW_TOKENS = 510   # Tokens per window, leaving room for the special tokens
+WINDOW_STRIDE = 384   # Tokens between window starts, so neighbours overlap
+MAX_WINDOWS = int(os.environ.get("SENTIMENT_MAX_WINDOWS", 8))  # Cap on windows per document
+
+def load_sentiment_pipeline(backend: str = DEFAULT_BACKEND):
+    """
+    Build the sentiment-analysis pipeline for an inference backend.
+    
+    Args:
+        backend (str): "torch", "quantized" or "onnx"
+        
+    Returns:
+        A transformers text-classification pipeline
+    """
+    # Imported here so that importing this module stays cheap until the model is needed
+    from transformers import pipeline
+    
+    if backend == "torch":
+        return pipeline("sentiment-analysis", model=MODEL_NAME)
+    
+    from transformers import AutoTokenizer
+    tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME)
+    
+    if backend == "quantized":
+        import torch
+        from transformers import AutoModelForSequenceClassification
+        model = AutoModelForSequenceClassification.from_pretrained(MODEL_NAME)
+        # Quantize the linear layers' weights to int8; activations are quantized on the fly
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        return pipeline("sentiment-analysis", model=model, tokenizer=tokenizer)
+    
+    if backend == "onnx":
+        try:
+            from optimum.onnxruntime import ORTModelForSequenceClassification
+        except ImportError as e:
+            raise ImportError("The onnx backend requires `pip install optimum[onnxruntime]`") from e
+        if os.path.exists(ONNX_MODEL_PATH):
+            model = ORTModelForSequenceClassification.from_pretrained(ONNX_MODEL_PATH)
+        else:
+            print(f"Exporting {MODEL_NAME} to ONNX at {ONNX_MODEL_PATH}...")
+            model = ORTModelForSequenceClassification.from_pretrained(MODEL_NAME, export=True)
+            model.save_pretrained(ONNX_MODEL_PATH)
+        return pipeline("sentiment-analysis", model=model, tokenizer=tokenizer)
+    
+    raise ValueError(f"Unknown sentiment backend: {backend}")
+
 class SentimentAnalyzer:
-    def __init__(self):
-        """Initialize the sentiment analysis pipeline"""
-        print("Loading sentiment analysis model...")
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE, content_mode: str = DEFAULT_CONTENT_MODE,
+                 max_windows: int = MAX_WINDOWS, cache: Optional[InferenceCache] = None,
+                 backend: str = DEFAULT_BACKEND):
+        """
+        Initialize the sentiment analysis pipeline.
+        
+        Args:
+            batch_size (int): Maximum number of texts per forward pass in batch calls
+            content_mode (str): "summary" or "windows" (score the full article content)
+            max_windows (int): Maximum token windows scored per document
+            cache (Optional[InferenceCache]): Result cache consulted before inference
+            backend (str): Inference backend, one of BACKENDS
+        """
+        if content_mode not in ("summary", "windows"):
+            raise ValueError(f"Unknown content mode: {content_mode}")
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown sentiment backend: {backend}")
+        self.batch_size = batch_size
+        self.content_mode = content_mode
+        self.max_windows = max_windows
+        self.cache = cache
+        self.backend = backend
+        print(f"Loading sentiment analysis model ({backend} backend)...")
         # Use the default sentiment analysis model (distilbert-base-uncased-finetuned-sst-2-english)
-        self.sentiment_pipeline = pipeline("sentiment-analysis")
+        self.sentiment_pipeline = load_sentiment_pipeline(backend)
+        # Pipelines share a tokenizer and model, so serialize inference across threads
+        self._inference_lock = threading.Lock()
+        # Backends can disagree slightly, so their results are cached separately
+        self.model_id = f"{MODEL_NAME}|{backend}"
         print("✓ Sentiment analysis model loaded")
 
+    @property
+    def document_model_id(self) -> str:
+        """Cache identifier for window-based document results"""
+        return f"{self.model_id}|windows:{WINDOW_TOKENS}/{WINDOW_STRIDE}/{self.max_windows}"
+
+    def _infer_uncached(self, text: str) -> Dict[str, Union[str, float]]:
+        """Run the model on one text, bypassing the cache and error handling"""
+        with self._inference_lock, span("sentiment_inference"):
+            result = self.sentiment_pipeline(text[:MAX_TEXT_LENGTH])[0]
+        return {
+            "label": result["label"],
+            "score": float(result["score"])
+        }
+
     def analyze_text(self, text: str) -> Dict[str, Union[str, float]]:
         """
         Analyze the sentiment of a given text.
@@ -21,37 +143,214 @@ class SentimentAnalyzer:
             Dict with sentiment label and score
         """
         # Truncate text if it's too long (model has max token limit)
-        max_length = 512
-        if len(text) > max_length:
-            text = text[:max_length]
+        if len(text) > MAX_TEXT_LENGTH:
+            text = text[:MAX_TEXT_LENGTH]
+        
+        if self.cache is not None:
+            cached = self.cache.get(text, self.model_id)
+            if cached is not None:
+                return cached
         
         try:
-            result = self.sentiment_pipeline(text)[0]
-            return {
-                "label": result["label"],
-                "score": float(result["score"])
-            }
+            sentiment = self._infer_uncached(text)
         except Exception as e:
             print(f"Error analyzing sentiment: {str(e)}")
+            SENTIMENT_ERRORS.inc(kind="text")
             return {
                 "label": "NEUTRAL",
                 "score": 0.5
             }
+        
+        if self.cache is not None:
+            self.cache.put(text, self.model_id, sentiment)
+        return sentiment
 
-    def analyze_article(self, article: Dict[str, str]) -> Dict[str, Union[str, float]]:
+    def analyze_texts(self, texts: List[str]) -> List[Dict[str, Union[str, float]]]:
         """
-        Analyze sentiment for a news article.
+        Analyze the sentiment of many texts using padded mini-batches.
+        
+        Texts are sorted by length so each batch pads to a similar size, then
+        results are returned in the original order.
         
         Args:
-            article (Dict): Article dictionary containing title, summary, and content
+            texts (List[str]): The texts to analyze
             
         Returns:
-            Dict with overall sentiment analysis
+            List of dicts with sentiment label and score, one per text
         """
-        # Analyze both title and summary for better accuracy
-        title_sentiment = self.analyze_text(article["title"])
-        summary_sentiment = self.analyze_text(article["summary"]) if article["summary"] else None
+        truncated = [text[:MAX_TEXT_LENGTH] for text in texts]
+        results: List[Optional[Dict[str, Union[str, float]]]] = [None] * len(truncated)
+        
+        # Resolve cache hits first; only distinct misses go through the model
+        pending: Dict[str, List[int]] = {}
+        for i, text in enumerate(truncated):
+            cached = self.cache.get(text, self.model_id) if self.cache is not None else None
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.setdefault(text, []).append(i)
+        
+        misses = sorted(pending, key=len)
+        for start in range(0, len(misses), self.batch_size):
+            batch = misses[start:start + self.batch_size]
+            try:
+                with self._inference_lock, span("sentiment_inference"):
+                    outputs = self.sentiment_pipeline(batch, batch_size=len(batch))
+            except Exception as e:
+                # Fall back to one text at a time so a single bad input only affects itself
+                print(f"Error analyzing batch, retrying individually: {str(e)}")
+                outputs = [None] * len(batch)
+            
+            for text, output in zip(batch, outputs):
+                if output is None:
+                    sentiment = self.analyze_text(text)
+                else:
+                    sentiment = {
+                        "label": output["label"],
+                        "score": float(output["score"])
+                    }
+                    if self.cache is not None:
+                        self.cache.put(text, self.model_id, sentiment)
+                for i in pending[text]:
+                    results[i] = dict(sentiment)
+        
+        return results
+
+    def _split_windows(self, token_ids: List[int]) -> List[List[int]]:
+        """Split token ids into overlapping windows, evenly sampled down to max_windows"""
+        if len(token_ids) <= WINDOW_TOKENS:
+            return [token_ids]
+        
+        starts = list(range(0, len(token_ids) - WINDOW_TOKENS + 1, WINDOW_STRIDE))
+        # Make sure the tail of the document is covered
+        if starts[-1] + WINDOW_TOKENS < len(token_ids):
+            starts.append(len(token_ids) - WINDOW_TOKENS)
+        
+        if len(starts) > self.max_windows:
+            step = (len(starts) - 1) / max(self.max_windows - 1, 1)
+            starts = [starts[round(i * step)] for i in range(self.max_windows)]
+        
+        return [token_ids[start:start + WINDOW_TOKENS] for start in starts]
+
+    def analyze_documents(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Analyze the sentiment of long documents with overlapping token windows.
+        
+        Each document is tokenized once and split into windows of up to
+        WINDOW_TOKENS tokens. Windows from all documents are scored together in
+        batches, and each document's class probabilities are averaged weighted
+        by window length.
+        
+        Args:
+            texts (List[str]): The documents to analyze
+            
+        Returns:
+            List of dicts with sentiment label, score, and window and token counts
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        pending: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            cached = self.cache.get(text, self.document_model_id) if self.cache is not None else None
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.setdefault(text, []).append(i)
+        
+        if pending:
+            misses = list(pending)
+            for text, sentiment in zip(misses, self._score_documents(misses)):
+                # Failed documents come back without any scored windows
+                if self.cache is not None and sentiment["windows"]:
+                    self.cache.put(text, self.document_model_id, sentiment)
+                for i in pending[text]:
+                    results[i] = dict(sentiment)
+        
+        return results
+
+    def _score_documents(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Run the sliding-window model pass for documents not found in the cache"""
+        import torch
+        
+        tokenizer = self.sentiment_pipeline.tokenizer
+        model = self.sentiment_pipeline.model
+        
+        try:
+            with self._inference_lock:
+                encoded = tokenizer(texts, add_special_tokens=False, truncation=False, verbose=False)["input_ids"]
+            
+            # (document index, window token ids) for every window of every document
+            windows = [
+                (doc, window)
+                for doc, token_ids in enumerate(encoded)
+                for window in self._split_windows(token_ids)
+            ]
+            windows.sort(key=lambda item: len(item[1]))
+            
+            num_labels = model.config.num_labels
+            totals = [[0.0] * num_labels for _ in texts]
+            weights = [0 for _ in texts]
+            window_counts = [0 for _ in texts]
+            
+            for start in range(0, len(windows), self.batch_size):
+                chunk = windows[start:start + self.batch_size]
+                with self._inference_lock, span("sentiment_document_inference"):
+                    batch = tokenizer.pad(
+                        {"input_ids": [tokenizer.build_inputs_with_special_tokens(ids) for _, ids in chunk]},
+                        return_tensors="pt"
+                    )
+                    with torch.no_grad():
+                        probabilities = torch.softmax(model(**batch).logits, dim=-1).tolist()
+                
+                for (doc, ids), probs in zip(chunk, probabilities):
+                    weight = max(len(ids), 1)
+                    weights[doc] += weight
+                    window_counts[doc] += 1
+                    for label_id, prob in enumerate(probs):
+                        totals[doc][label_id] += prob * weight
+            
+            results = []
+            for doc, token_ids in enumerate(encoded):
+                probs = [total / weights[doc] for total in totals[doc]]
+                best = max(range(num_labels), key=lambda label_id: probs[label_id])
+                results.append({
+                    "label": model.config.id2label[best],
+                    "score": float(probs[best]),
+                    "windows": window_counts[doc],
+                    "tokens": len(token_ids)
+                })
+            return results
+            
+        except Exception as e:
+            print(f"Error analyzing document sentiment: {str(e)}")
+            SENTIMENT_ERRORS.inc(len(texts), kind="document")
+            return [{"label": "NEUTRAL", "score": 0.5, "windows": 0, "tokens": 0} for _ in texts]
+
+    def analyze_document(self, text: str) -> Dict[str, Any]:
+        """
+        Analyze the sentiment of a single long document.
+        
+        Args:
+            text (str): The document to analyze
+            
+        Returns:
+            Dict with sentiment label, score, and window and token counts
+        """
+        return self.analyze_documents([text])[0]
+
+    def combine_sentiments(self, title_sentiment: Dict[str, Union[str, float]],
+                           summary_sentiment: Optional[Dict[str, Union[str, float]]],
+                           body_key: str = "summary_sentiment") -> Dict[str, Any]:
+        """
+        Combine title and summary sentiment into an article sentiment.
         
+        Args:
+            title_sentiment (Dict): Sentiment of the title
+            summary_sentiment (Optional[Dict]): Sentiment of the summary or content, if any
+            body_key (str): Result key under which the body sentiment is reported
+            
+        Returns:
+            Dict with overall sentiment analysis
+        """
         # If we have both title and summary sentiments, combine them
         if summary_sentiment:
             # Use weighted average (title: 0.4, summary: 0.6)
@@ -68,7 +367,7 @@ class SentimentAnalyzer:
                 "label": label,
                 "score": combined_score,
                 "title_sentiment": title_sentiment,
-                "summary_sentiment": summary_sentiment
+                body_key: summary_sentiment
             }
         else:
             # If no summary, use just title sentiment
@@ -76,30 +375,259 @@ class SentimentAnalyzer:
                 "label": title_sentiment["label"],
                 "score": title_sentiment["score"],
                 "title_sentiment": title_sentiment,
-                "summary_sentiment": None
+                body_key: None
             }
 
-def process_articles(articles: List[Dict[str, str]]) -> List[Dict]:
+    def analyze_article(self, article: Dict[str, str]) -> Dict[str, Union[str, float]]:
+        """
+        Analyze sentiment for a news article.
+        
+        Args:
+            article (Dict): Article dictionary containing title, summary, and content
+            
+        Returns:
+            Dict with overall sentiment analysis
+        """
+        # Score the full content instead of the summary when requested
+        if self._uses_content(article):
+            title_sentiment = self.analyze_text(article["title"])
+            content_sentiment = self.analyze_document(article["content"])
+            return self.combine_sentiments(title_sentiment, content_sentiment, "content_sentiment")
+        
+        # Analyze both title and summary for better accuracy
+        title_sentiment = self.analyze_text(article["title"])
+        summary_sentiment = self.analyze_text(article["summary"]) if article["summary"] else None
+        return self.combine_sentiments(title_sentiment, summary_sentiment)
+
+    def _uses_content(self, article: Dict[str, str]) -> bool:
+        """Whether the article body should be scored with token windows"""
+        return self.content_mode == "windows" and bool(article.get("content"))
+
+    def analyze_batch(self, articles: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Analyze sentiment for many articles with batched inference.
+        
+        Every title and summary in the list goes through the model together,
+        giving the same results as calling analyze_article on each article.
+        
+        Args:
+            articles (List[Dict]): Article dictionaries containing title and summary
+            
+        Returns:
+            List of overall sentiment dicts, one per article
+        """
+        texts = []
+        documents = []
+        for article in articles:
+            texts.append(article["title"])
+            if self._uses_content(article):
+                documents.append(article["content"])
+            elif article["summary"]:
+                texts.append(article["summary"])
+        
+        sentiments = iter(self.analyze_texts(texts))
+        document_sentiments = iter(self.analyze_documents(documents) if documents else [])
+        results = []
+        for article in articles:
+            title_sentiment = next(sentiments)
+            if self._uses_content(article):
+                content_sentiment = next(document_sentiments)
+                results.append(self.combine_sentiments(title_sentiment, content_sentiment, "content_sentiment"))
+            else:
+                summary_sentiment = next(sentiments) if article["summary"] else None
+                results.append(self.combine_sentiments(title_sentiment, summary_sentiment))
+        return results
+
+def check_parity(analyzer: SentimentAnalyzer, reference: SentimentAnalyzer,
+                 texts: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Compare an analyzer's predictions against a reference backend.
+    
+    Args:
+        analyzer (SentimentAnalyzer): Analyzer under test
+        reference (SentimentAnalyzer): Reference analyzer, normally the torch backend
+        texts (Optional[List[str]]): Texts to compare; defaults to PARITY_SAMPLES
+        
+    Returns:
+        Dict with label agreement rate, maximum score difference and disagreements
+    """
+    texts = texts or PARITY_SAMPLES
+    # Bypass the caches so both backends actually run
+    candidate_results = [analyzer._infer_uncached(text) for text in texts]
+    reference_results = [reference._infer_uncached(text) for text in texts]
+    
+    disagreements = [
+        {"text": text, "label": result["label"], "reference_label": expected["label"]}
+        for text, result, expected in zip(texts, candidate_results, reference_results)
+        if result["label"] != expected["label"]
+    ]
+    max_score_diff = max(
+        abs(result["score"] - expected["score"])
+        for result, expected in zip(candidate_results, reference_results)
+    )
+    
+    report = {
+        "backend": analyzer.backend,
+        "reference_backend": reference.backend,
+        "samples": len(texts),
+        "agreement": 1 - len(disagreements) / len(texts),
+        "max_score_diff": max_score_diff,
+        "disagreements": disagreements
+    }
+    if disagreements:
+        print(f"✗ {analyzer.backend} backend disagrees with {reference.backend} on {len(disagreements)} of {len(texts)} samples")
+    else:
+        print(f"✓ {analyzer.backend} backend matches {reference.backend} (max score diff {max_score_diff:.4f})")
+    return report
+
+class ModelRegistry:
+    """Process-wide holder that loads the sentiment model once and shares it"""
+
+    def __init__(self):
+        """Initialize an empty registry"""
+        self._lock = threading.Lock()
+        self._analyzer: Optional[SentimentAnalyzer] = None
+        self.load_time: Optional[float] = None
+        self.loaded_at: Optional[float] = None
+        self.error: Optional[str] = None
+        self.parity: Optional[Dict[str, Any]] = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether the model has been loaded"""
+        return self._analyzer is not None
+
+    def load(self) -> SentimentAnalyzer:
+        """
+        Load the sentiment analyzer if needed and return it.
+        
+        Returns:
+            SentimentAnalyzer: The shared analyzer instance
+        """
+        if self._analyzer is not None:
+            return self._analyzer
+        
+        with self._lock:
+            # Another thread may have finished loading while we waited
+            if self._analyzer is None:
+                started = time.perf_counter()
+                try:
+                    self._analyzer = SentimentAnalyzer(cache=get_inference_cache())
+                except Exception as e:
+                    self.error = str(e)
+                    raise
+                self.load_time = time.perf_counter() - started
+                self.loaded_at = time.time()
+                self.error = None
+                
+                # Optionally verify a non-reference backend against torch
+                if self._analyzer.backend != "torch" and os.environ.get("SENTIMENT_PARITY_CHECK") == "1":
+                    self.parity = check_parity(self._analyzer, SentimentAnalyzer(backend="torch"))
+            return self._analyzer
+
+    def status(self) -> Dict[str, Any]:
+        """Return readiness and load timing information"""
+        return {
+            "ready": self.ready,
+            "backend": self._analyzer.backend if self._analyzer else DEFAULT_BACKEND,
+            "load_time_seconds": self.load_time,
+            "loaded_at": self.loaded_at,
+            "error": self.error,
+            "parity": self.parity
+        }
+
+# Shared registry used by the API and process_articles
+model_registry = ModelRegistry()
+
+def get_analyzer() -> SentimentAnalyzer:
+    """Return the process-wide sentiment analyzer, loading it on first use"""
+    return model_registry.load()
+
+def process_articles(articles: List[Dict[str, str]], analyzer: Optional[SentimentAnalyzer] = None) -> List[Dict]:
     """
     Process a list of articles and add sentiment analysis.
     
     Args:
         articles (List[Dict]): List of article dictionaries
+        analyzer (Optional[SentimentAnalyzer]): Analyzer to use; defaults to the shared one
         
     Returns:
         List of articles with sentiment analysis added
     """
-    analyzer = SentimentAnalyzer()
+    if analyzer is None:
+        analyzer = get_analyzer()
     
-    for article in articles:
-        print(f"\nAnalyzing sentiment for: {article['title'][:100]}...")
-        sentiment = analyzer.analyze_article(article)
+    print(f"\nAnalyzing sentiment for {len(articles)} articles...")
+    sentiments = analyzer.analyze_batch(articles)
+    
+    for article, sentiment in zip(articles, sentiments):
         article["sentiment"] = sentiment
-        print(f"✓ Sentiment: {sentiment['label']} (score: {sentiment['score']:.2f})")
-        time.sleep(0.1)  # Small delay to avoid overwhelming the model
+        print(f"✓ {article['title'][:100]}: {sentiment['label']} (score: {sentiment['score']:.2f})")
         
     return articles
 
+def process_article_stream(stream: Iterable[Tuple[int, Dict]], analyzer: Optional[SentimentAnalyzer] = None,
+                           batch_size: Optional[int] = None) -> Iterator[Tuple[int, Dict]]:
+    """
+    Add sentiment to articles as they arrive from a streaming scraper.
+    
+    A background thread drains the stream so downloads keep running while the
+    model works. Each micro-batch contains whatever has arrived since the last
+    one, up to batch_size articles.
+    
+    Args:
+        stream (Iterable[Tuple[int, Dict]]): (position, article) pairs, e.g. from iter_news_articles
+        analyzer (Optional[SentimentAnalyzer]): Analyzer to use; defaults to the shared one
+        batch_size (Optional[int]): Maximum articles per micro-batch; defaults to the analyzer's
+        
+    Yields:
+        Tuple[int, Dict]: Position and article with sentiment analysis added
+    """
+    if analyzer is None:
+        analyzer = get_analyzer()
+    batch_size = batch_size or analyzer.batch_size
+    
+    done = object()
+    pending: "queue.Queue" = queue.Queue()
+    
+    def feed():
+        try:
+            for item in stream:
+                pending.put(item)
+        except Exception as e:
+            pending.put(e)
+        pending.put(done)
+    
+    threading.Thread(target=bind(feed), name="article-stream", daemon=True).start()
+    
+    finished = False
+    while not finished:
+        # Wait for at least one article, then take whatever else is ready
+        batch = []
+        item = pending.get()
+        while True:
+            if item is done:
+                finished = True
+                break
+            if isinstance(item, Exception):
+                raise item
+            batch.append(item)
+            if len(batch) >= batch_size:
+                break
+            try:
+                item = pending.get_nowait()
+            except queue.Empty:
+                break
+        
+        if not batch:
+            continue
+        
+        sentiments = analyzer.analyze_batch([article for _, article in batch])
+        for (position, article), sentiment in zip(batch, sentiments):
+            article["sentiment"] = sentiment
+            print(f"✓ {article['title'][:100]}: {sentiment['label']} (score: {sentiment['score']:.2f})")
+            yield position, article
+
 if __name__ == "__main__":
     # Example usage
     from news_scraper import get_news_articles
@@ -0,0 +1,48 @@
+import time
+from concurrent.futures import Future
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api
+from api import parse_range
+from result_cache import ResultCache
+
+SIZE = 1000
+
+@pytest.mark.parametrize("header, expected", [
+    ("bytes=0-99", (0, 99)),
+    ("bytes=500-", (500, 999)),
+    ("bytes=0-5000", (0, 999)),
+    (" bytes = 10-19 ", (10, 19)),
+    # Suffix ranges count back from the end, clipped to the whole file
+    ("bytes=-100", (900, 999)),
+    ("bytes=-5000", (0, 999))
+])
+def test_parse_range(header, expected):
+    assert parse_range(header, SIZE) == expected
+
+@pytest.mark.parametrize("header", [
+    "bytes=1000-",
+    "bytes=200-100",
+    "bytes=-0",
+    "bytes=0-1,5-9",
+    "items=0-99",
+    "bytes=abc-",
+    "bytes="
+])
+def test_parse_range_unsatisfiable(header):
+    assert parse_range(header, SIZE) is None
+
+def test_analyze_answers_504_once_the_budget_runs_out(monkeypatch):
+    stalled: Future = Future()
+    monkeypatch.setattr(api, "analysis_cache", ResultCache())
+    monkeypatch.setattr(api.job_manager, "submit", lambda *args: SimpleNamespace(future=stalled))
+    started = time.monotonic()
+
+    response = TestClient(api.app).post("/analyze", json={"company": "Tesla", "latency_budget_ms": 200})
+    assert response.status_code == 504
+    assert time.monotonic() - started < 2.0
+    # The shared job keeps running for anyone else waiting on it
+    assert not stalled.cancelled()
@@ -0,0 +1,17 @@
+import urllib.parse
+
+from article_cache import normalize_url
+
+ARTICLE = "https://www.reuters.com/business/tesla-deliveries/?utm_source=bing"
+
+def apiclick(tid: str, c: str) -> str:
+    return (
+        f"http://www.bing.com/news/apiclick.aspx?ref=FexRss&aid=&tid={tid}"
+        f"&url={urllib.parse.quote(ARTICLE, safe='')}&c={c}&mkt=en-us"
+    )
+
+def test_redirects_from_different_feeds_share_a_key():
+    assert normalize_url(apiclick("68E1A2B3C4", "1182736455")) == normalize_url(apiclick("0F9D8C7B6A", "998877"))
+
+def test_redirect_matches_direct_link():
+    assert normalize_url(apiclick("68E1A2B3C4", "1182736455")) == "https://www.reuters.com/business/tesla-deliveries"
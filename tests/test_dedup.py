@@ -0,0 +1,86 @@
+import dedup
+from dedup import Deduplicator, simhash, unique_articles
+
+BASE = 0x9E3779B97F4A7C15
+
+STORY = (
+    "Tesla delivered more vehicles than analysts expected in the third quarter, helped by "
+    "price cuts in China and strong demand for the refreshed Model Y. The company said "
+    "production at its Berlin and Austin factories continued to ramp, while margins remained "
+    "under pressure from lower prices and higher spending on artificial intelligence projects. "
+    "Shares rose in premarket trading after the delivery figures were published."
+)
+
+def flip(fingerprint: int, bands, band_bits: int = 64 // (dedup.DEDUP_MAX_DISTANCE + 1)) -> int:
+    """Flip the lowest bit of each given band"""
+    for band in bands:
+        fingerprint ^= 1 << (band * band_bits)
+    return fingerprint
+
+def article(url: str, fingerprint: int):
+    return {"url": url, "fingerprint": fingerprint}
+
+def use_fingerprints(monkeypatch):
+    monkeypatch.setattr(dedup, "article_body", lambda article: article)
+    monkeypatch.setattr(dedup, "simhash", lambda article: article["fingerprint"])
+
+def test_articles_within_max_distance_share_a_band(monkeypatch):
+    use_fingerprints(monkeypatch)
+    deduplicator = Deduplicator(max_distance=8)
+    original = article("https://a.example/story", BASE)
+    # Eight differing bits, one in each of eight bands, leave the ninth band equal
+    copy = article("https://b.example/story", flip(BASE, range(8)))
+
+    assert deduplicator.add(original) is None
+    assert deduplicator.add(copy) is original
+    assert copy["duplicate_of"] == original["url"]
+    assert original["cluster_size"] == 2
+
+def test_articles_beyond_max_distance_stay_apart(monkeypatch):
+    use_fingerprints(monkeypatch)
+    deduplicator = Deduplicator(max_distance=8)
+    deduplicator.add(article("https://a.example/story", BASE))
+
+    other = article("https://b.example/story", flip(BASE, range(9)))
+    assert deduplicator.add(other) is None
+    assert "duplicate_of" not in other
+
+def test_syndicated_copy_is_a_near_duplicate():
+    assert simhash(STORY) is not None
+    deduplicator = Deduplicator()
+    original = {"url": "https://wire.example/tesla", "content": STORY}
+    syndicated = {"url": "https://paper.example/tesla", "content": STORY + " Reporting by a staff writer."}
+    unrelated = {"url": "https://other.example/cloud", "content": " ".join(reversed(STORY.split()))}
+
+    assert deduplicator.add(original) is None
+    assert deduplicator.add(syndicated) is original
+    assert deduplicator.add(unrelated) is None
+    assert unique_articles([original, syndicated, unrelated]) == [original, unrelated]
+
+def test_short_articles_are_never_duplicates():
+    deduplicator = Deduplicator()
+    first = {"url": "https://a.example/brief", "summary": "Tesla shares rose."}
+    second = {"url": "https://b.example/brief", "summary": "Tesla shares rose."}
+
+    assert deduplicator.add(first) is None
+    assert deduplicator.add(second) is None
+
+def test_resolve_copies_representative_sentiment(monkeypatch):
+    use_fingerprints(monkeypatch)
+    deduplicator = Deduplicator(max_distance=8)
+    stream = [
+        (0, article("https://a.example/story", BASE)),
+        (1, article("https://b.example/other", flip(BASE, range(9)))),
+        (2, article("https://c.example/story", flip(BASE, [3])))
+    ]
+
+    representatives = list(deduplicator.filter(stream))
+    assert [position for position, _ in representatives] == [0, 1]
+    for _, representative in representatives:
+        representative["sentiment"] = {"label": "POSITIVE", "score": 0.9}
+
+    resolved = deduplicator.resolve()
+    assert [(position, found["url"]) for position, found in resolved] == [(2, "https://c.example/story")]
+    assert resolved[0][1]["sentiment"] == {"label": "POSITIVE", "score": 0.9}
+    assert resolved[0][1]["sentiment"] is not representatives[0][1]["sentiment"]
+    assert deduplicator.resolve() == []
@@ -0,0 +1,56 @@
+import datetime
+
+from history_store import HistoryStore
+
+URL = "https://www.example.com/tesla-factory"
+TODAY = datetime.date(2026, 10, 18)
+
+def article(publish_date, label: str, score: float, url: str = URL, rss_only: bool = False):
+    return {
+        "url": url,
+        "title": "Tesla pauses expansion plans",
+        "publish_date": publish_date,
+        "rss_only": rss_only,
+        "sentiment": {"label": label, "score": score}
+    }
+
+def daily_counts(store: HistoryStore):
+    return [(day["day"], day["articles"], day["distribution"]) for day in store.daily("Tesla", days=30, today=TODAY)]
+
+def test_recording_the_same_article_again_changes_nothing(tmp_path):
+    store = HistoryStore(str(tmp_path / "history.sqlite3"))
+    assert store.record("Tesla", [article("2026-10-07 09:45:00+00:00", "NEGATIVE", 0.2)]) == 1
+    assert store.record("tesla ", [article("2026-10-07 09:45:00+00:00", "NEGATIVE", 0.2)]) == 0
+
+    assert daily_counts(store) == [("2026-10-07", 1, {"POSITIVE": 0, "NEUTRAL": 0, "NEGATIVE": 1})]
+
+def test_rerecorded_article_replaces_its_old_contribution(tmp_path):
+    store = HistoryStore(str(tmp_path / "history.sqlite3"))
+    store.record("Tesla", [
+        article("2026-10-07 09:45:00+00:00", "NEGATIVE", 0.2),
+        article("2026-10-07 12:00:00+00:00", "POSITIVE", 0.9, url="https://www.example.com/tesla-robotaxi")
+    ])
+    # A new label and a corrected publish date move the article, without counting it twice
+    assert store.record("Tesla", [article("2026-10-08 08:00:00+00:00", "POSITIVE", 0.7)]) == 1
+
+    assert daily_counts(store) == [
+        ("2026-10-07", 1, {"POSITIVE": 1, "NEUTRAL": 0, "NEGATIVE": 0}),
+        ("2026-10-08", 1, {"POSITIVE": 1, "NEUTRAL": 0, "NEGATIVE": 0})
+    ]
+    month = store.window("Tesla", days=30, today=TODAY)
+    assert month["articles"] == 2
+    assert round(month["average_score"], 6) == 0.8
+
+def test_rss_only_article_does_not_replace_stored_article(tmp_path):
+    store = HistoryStore(str(tmp_path / "history.sqlite3"))
+    assert store.record("Tesla", [article("2026-10-07 09:45:00+00:00", "NEGATIVE", 0.2)]) == 1
+    assert store.record("Tesla", [article(None, "NEUTRAL", 0.5, rss_only=True)]) == 0
+
+    assert daily_counts(store) == [("2026-10-07", 1, {"POSITIVE": 0, "NEUTRAL": 0, "NEGATIVE": 1})]
+
+def test_full_article_replaces_rss_only_article(tmp_path):
+    store = HistoryStore(str(tmp_path / "history.sqlite3"))
+    store.record("Tesla", [article("2026-10-07 09:45:00+00:00", "NEUTRAL", 0.5, rss_only=True)])
+    assert store.record("Tesla", [article("2026-10-07 09:45:00+00:00", "NEGATIVE", 0.2)]) == 1
+
+    assert daily_counts(store) == [("2026-10-07", 1, {"POSITIVE": 0, "NEUTRAL": 0, "NEGATIVE": 1})]
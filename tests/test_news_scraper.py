@@ -0,0 +1,96 @@
+import time
+import urllib.parse
+
+import pytest
+import requests
+
+import news_scraper
+from metrics import RSS_FALLBACKS
+from news_scraper import ArticleFetcher, clean_url, domain_limiter, get_domain
+
+ARTICLE = "https://www.reuters.com/business/autos/tesla-deliveries-2026-10-02/?a=1"
+APICLICK = (
+    "http://www.bing.com/news/apiclick.aspx?ref=FexRss&aid=&tid=68E1A2B3C4"
+    f"&url={urllib.parse.quote(ARTICLE, safe='')}&c=1182736455&mkt=en-us"
+)
+
+def test_get_domain_unwraps_bing_redirect():
+    assert get_domain(APICLICK) == "www.reuters.com"
+
+def test_get_domain_unwraps_cleaned_bing_redirect():
+    # fetch_rss_items unquotes links before they reach get_domain
+    assert get_domain(clean_url(APICLICK)) == "www.reuters.com"
+
+def test_get_domain_direct_link():
+    assert get_domain("https://WWW.Example.com/story") == "www.example.com"
+
+def test_fetchers_share_domain_limiter():
+    assert ArticleFetcher().limiter is domain_limiter
+    assert ArticleFetcher().limiter is ArticleFetcher().limiter
+
+def fake_fetch_article(item, *args, **kwargs):
+    time.sleep(item["delay"])
+    return {"title": item["title"]} if item["title"] else None
+
+def test_iter_completed_yields_articles_as_they_finish(monkeypatch):
+    monkeypatch.setattr(news_scraper, "fetch_article", fake_fetch_article)
+    items = [
+        {"title": "slow", "link": "https://a.example/1", "delay": 0.3},
+        {"title": "fast", "link": "https://b.example/2", "delay": 0.0},
+        {"title": "", "link": "https://c.example/3", "delay": 0.1}
+    ]
+    # Positions are RSS order; the item with no usable data is skipped
+    assert list(ArticleFetcher(max_workers=3).iter_completed(items)) == [(1, {"title": "fast"}), (0, {"title": "slow"})]
+
+def test_iter_completed_uses_rss_data_for_articles_past_the_deadline(monkeypatch):
+    monkeypatch.setattr(news_scraper, "fetch_article", fake_fetch_article)
+    items = [
+        {"title": "stalled", "url": "https://a.example/1", "description": "Stalled story", "delay": 2.0},
+        {"title": "fast", "url": "https://b.example/2", "description": "Fast story", "delay": 0.0},
+        {"title": "sparse", "url": "https://c.example/3", "description": "", "delay": 2.0}
+    ]
+    fallbacks = RSS_FALLBACKS.value(reason="deadline")
+    started = time.monotonic()
+
+    results = list(ArticleFetcher(max_workers=3).iter_completed(items, deadline=started + 0.3))
+    assert time.monotonic() - started < 1.0
+    assert [(position, article["title"]) for position, article in results] == [(1, "fast"), (0, "stalled")]
+    stalled = results[1][1]
+    assert stalled["partial"] and stalled["rss_only"] and stalled["summary"] == "Stalled story"
+    # The sparse item has no RSS description to fall back on
+    assert RSS_FALLBACKS.value(reason="deadline") == fallbacks + 1
+
+def test_failed_download_uses_rss_data_without_marking_partial(monkeypatch):
+    def fail(*args, **kwargs):
+        raise requests.HTTPError("404 Client Error")
+    monkeypatch.setattr(news_scraper, "extract_article", fail)
+    item = {"title": "gone", "url": "https://a.example/gone", "description": "Gone story"}
+
+    article = news_scraper.fetch_article(item)
+    assert article["rss_only"] and not article["partial"]
+
+def test_budget_running_out_during_rss_fetch_is_not_an_empty_feed(monkeypatch):
+    def stall(url, timeout):
+        raise requests.ReadTimeout(f"Read timed out after {timeout}s")
+    monkeypatch.setattr(requests, "get", stall)
+
+    with pytest.raises(news_scraper.DeadlineExceeded):
+        list(news_scraper.iter_news_articles("Tesla", deadline=time.monotonic() + 0.2))
+    with pytest.raises(news_scraper.DeadlineExceeded):
+        news_scraper.get_news_articles("Tesla", deadline=time.monotonic() - 1)
+    # Without a budget a slow feed is a fetch error
+    assert news_scraper.get_news_articles("Tesla") == []
+
+def test_circuit_breaker_keys_on_publisher_behind_redirect(monkeypatch):
+    breaker = news_scraper.CircuitBreaker(failure_threshold=3, reset_after=60)
+    monkeypatch.setattr(news_scraper, "circuit_breaker", breaker)
+    # Nothing listens on port 9, so every download fails with a connection error
+    redirect = "http://127.0.0.1:9/news/apiclick.aspx?ref=FexRss&url=https%3a%2f%2fslow.example%2fstory&c=1"
+    for _ in range(3):
+        with pytest.raises(requests.ConnectionError):
+            news_scraper.download_html(redirect)
+
+    assert breaker.open_domains() == ["slow.example"]
+    with pytest.raises(news_scraper.CircuitOpenError):
+        news_scraper.download_html(redirect)
+    assert breaker.allow("other.example")
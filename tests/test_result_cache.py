@@ -0,0 +1,127 @@
+from concurrent.futures import Future
+
+import result_cache
+from result_cache import COALESCED, HIT, MISS, STALE, ResultCache, normalize_company
+
+class Clock:
+    """Stand-in for the time module so entries age without sleeping"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self) -> float:
+        return self.now
+
+class Submitter:
+    """Records each computation started and hands back a future the test resolves"""
+
+    def __init__(self):
+        self.futures = []
+
+    def __call__(self) -> Future:
+        future: Future = Future()
+        self.futures.append(future)
+        return future
+
+def done(value) -> Future:
+    future: Future = Future()
+    future.set_result(value)
+    return future
+
+def test_concurrent_requests_share_one_computation():
+    cache, submit = ResultCache(), Submitter()
+    first, first_status = cache.get_or_submit("tesla", submit)
+    second, second_status = cache.get_or_submit("tesla", submit)
+    assert (first_status, second_status) == (MISS, COALESCED)
+    assert second is first
+    assert len(submit.futures) == 1
+
+    submit.futures[0].set_result("analysis")
+    future, status = cache.get_or_submit("tesla", submit)
+    assert (status, future.result()) == (HIT, "analysis")
+    assert len(submit.futures) == 1
+
+def test_stale_result_is_served_while_one_refresh_runs(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(result_cache, "time", clock)
+    cache, submit = ResultCache(ttl=10, stale_ttl=60), Submitter()
+    cache.get_or_submit("tesla", submit)
+    submit.futures[0].set_result("old")
+
+    clock.now += 30
+    for _ in range(2):
+        future, status = cache.get_or_submit("tesla", submit)
+        assert (status, future.result()) == (STALE, "old")
+    # Both stale lookups share the background refresh
+    assert len(submit.futures) == 2
+
+    submit.futures[1].set_result("new")
+    future, status = cache.get_or_submit("tesla", submit)
+    assert (status, future.result()) == (HIT, "new")
+
+def test_expired_result_is_recomputed(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(result_cache, "time", clock)
+    cache = ResultCache(ttl=10, stale_ttl=60)
+    cache.get_or_submit("tesla", lambda: done("old"))
+
+    clock.now += 71
+    future, status = cache.get_or_submit("tesla", lambda: done("new"))
+    assert (status, future.result()) == (MISS, "new")
+
+def test_failures_are_not_cached():
+    cache, submit = ResultCache(), Submitter()
+    cache.get_or_submit("tesla", submit)
+    submit.futures[0].set_exception(RuntimeError("feed unavailable"))
+
+    assert cache.get_or_submit("tesla", submit)[1] == MISS
+    assert cache.stats()["entries"] == 0
+
+def test_least_recently_used_result_is_dropped():
+    cache = ResultCache(max_entries=2)
+    cache.get_or_submit("tesla", lambda: done("tesla"))
+    cache.get_or_submit("microsoft", lambda: done("microsoft"))
+    assert cache.get_or_submit("tesla", lambda: done("unused"))[1] == HIT
+    cache.get_or_submit("nvidia", lambda: done("nvidia"))
+
+    assert cache.get_or_submit("microsoft", lambda: done("microsoft"))[1] == MISS
+    assert cache.get_or_submit("nvidia", lambda: done("unused"))[1] == HIT
+
+def test_normalize_company():
+    assert normalize_company("  Tesla   Motors ") == normalize_company("tesla motors")
+
+def test_uncacheable_result_is_shared_in_flight_but_not_stored():
+    cache = ResultCache(cacheable=lambda result: not result.get("partial"))
+    submit = Submitter()
+    cache.get_or_submit("tesla", submit)
+    joined, status = cache.get_or_submit("tesla", submit)
+    assert status == COALESCED
+
+    submit.futures[0].set_result({"partial": True})
+    assert joined.result() == {"partial": True}
+    assert cache.get_or_submit("tesla", lambda: done({"partial": False}))[1] == MISS
+    assert cache.get_or_submit("tesla", submit)[1] == HIT
+
+def test_uncacheable_refresh_keeps_serving_the_stale_result(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(result_cache, "time", clock)
+    cache = ResultCache(ttl=10, stale_ttl=60, cacheable=lambda result: not result.get("partial"))
+    cache.get_or_submit("tesla", lambda: done({"partial": False, "run": 1}))
+
+    clock.now += 30
+    future, status = cache.get_or_submit("tesla", lambda: done({"partial": True, "run": 2}))
+    assert (status, future.result()) == (STALE, {"partial": False, "run": 1})
+    future, status = cache.get_or_submit("tesla", lambda: done({"partial": True, "run": 3}))
+    assert (status, future.result()) == (STALE, {"partial": False, "run": 1})
+
+def test_variants_share_stored_results_but_not_runs_in_flight():
+    cache, submit = ResultCache(), Submitter()
+    unbounded, _ = cache.get_or_submit("tesla", submit)
+    bounded, status = cache.get_or_submit("tesla", submit, variant=500)
+    assert status == MISS and bounded is not unbounded
+    assert cache.get_or_submit("tesla", submit, variant=500) == (bounded, COALESCED)
+
+    submit.futures[0].set_result("complete")
+    future, status = cache.get_or_submit("tesla", submit, variant=2000)
+    assert (status, future.result()) == (HIT, "complete")
+    assert len(submit.futures) == 2
@@ -1,30 +1,265 @@
-from gtts import gTTS
 import os
-from typing import Optional
+from typing import Optional, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+import io
+import re
 import tempfile
+import threading
+import time
 import hashlib
 
+from metrics import TTS_FAILURES, span
+
+# Audio store limits; least recently used files are evicted first
+AUDIO_DIR = "audio_files"
+AUDIO_STORE_MAX_BYTES = int(os.environ.get("AUDIO_STORE_MAX_BYTES", 200 * 1024 * 1024))
+AUDIO_STORE_MAX_AGE = float(os.environ.get("AUDIO_STORE_MAX_AGE", 7 * 24 * 60 * 60))  # Seconds since last use
+
+# Synthesis backend ("gtts" or "offline") and segmentation settings
+TTS_BACKEND = os.environ.get("TTS_BACKEND", "gtts")
+TTS_SEGMENT_CHARS = int(os.environ.get("TTS_SEGMENT_CHARS", 200))  # Target characters per segment
+TTS_MAX_WORKERS = int(os.environ.get("TTS_MAX_WORKERS", 4))        # Segments synthesized at once
+
+# Sentence ends, including the Devanagari danda used in Hindi text
+SENTENCE_END = re.compile(r"(?<=[.!?\u0964])\s+")
+
+class GTTSBackend:
+    """Synthesize speech with Google Translate's TTS service"""
+    name = "gtts"
+
+    def synthesize(self, text: str, language: str) -> bytes:
+        """Return mp3 bytes for the text"""
+        from gtts import gTTS
+        buffer = io.BytesIO()
+        gTTS(text=text, lang=language, slow=False).write_to_fp(buffer)
+        return buffer.getvalue()
+
+class OfflineBackend:
+    """
+    Local stand-in that produces silent mp3 audio without network access.
+    
+    Duration grows with text length, so it can be used to benchmark and test
+    the TTS stage.
+    """
+    name = "offline"
+    
+    # One MPEG-1 Layer III frame (128 kbps, 44.1 kHz, mono) of silence, about 26 ms
+    SILENT_FRAME = bytes([0xFF, 0xFB, 0x90, 0xC0]) + bytes(413)
+    
+    # Approximate speaking rate used to size the output
+    FRAMES_PER_CHAR = 3
+
+    def synthesize(self, text: str, language: str) -> bytes:
+        """Return silent mp3 bytes sized to the text"""
+        return self.SILENT_FRAME * max(1, len(text) * self.FRAMES_PER_CHAR)
+
+BACKENDS = {
+    "gtts": GTTSBackend,
+    "offline": OfflineBackend
+}
+
+def get_backend(name: str = TTS_BACKEND):
+    """Create the synthesis backend with the given name"""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown TTS backend: {name}")
+    return BACKENDS[name]()
+
+def split_sentences(text: str, max_chars: int = TTS_SEGMENT_CHARS) -> List[str]:
+    """
+    Split text at sentence boundaries into segments of about max_chars.
+    
+    Short sentences are merged; sentences longer than max_chars are split at spaces.
+    
+    Args:
+        text (str): Text to split
+        max_chars (int): Target maximum segment length
+        
+    Returns:
+        List[str]: Segments in reading order
+    """
+    segments: List[str] = []
+    current = ""
+    for sentence in SENTENCE_END.split(text.strip()):
+        pieces = [sentence]
+        if len(sentence) > max_chars:
+            # Break an overlong sentence at word boundaries
+            pieces, piece = [], ""
+            for word in sentence.split():
+                if piece and len(piece) + len(word) + 1 > max_chars:
+                    pieces.append(piece)
+                    piece = word
+                else:
+                    piece = f"{piece} {word}" if piece else word
+            if piece:
+                pieces.append(piece)
+        
+        for piece in pieces:
+            if current and len(current) + len(piece) + 1 > max_chars:
+                segments.append(current)
+                current = piece
+            else:
+                current = f"{current} {piece}" if current else piece
+    if current:
+        segments.append(current)
+    return segments
+
+def strip_id3(data: bytes) -> bytes:
+    """Remove a leading ID3v2 tag so mp3 segments can be concatenated"""
+    if len(data) >= 10 and data[:3] == b"ID3":
+        # Tag size is a 28-bit "syncsafe" integer after the 10-byte header
+        size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        return data[10 + size:]
+    return data
+
+class AudioStore:
+    """Content-addressed directory of mp3 files bounded by total size and age"""
+
+    def __init__(self, directory: str = AUDIO_DIR, max_bytes: int = AUDIO_STORE_MAX_BYTES,
+                 max_age: float = AUDIO_STORE_MAX_AGE):
+        """
+        Initialize the store.
+        
+        Args:
+            directory (str): Directory holding the audio files
+            max_bytes (int): Maximum total size of the store
+            max_age (float): Seconds since last use before a file is evicted
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        
+        # Create output directory if it doesn't exist
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path(self, filename: str) -> str:
+        """Return the path of a file in the store"""
+        return os.path.join(self.directory, filename)
+
+    def lookup(self, filename: str) -> Optional[str]:
+        """
+        Return the path of a stored file and mark it as recently used.
+        
+        Args:
+            filename (str): Name of the audio file
+            
+        Returns:
+            Optional[str]: Path to the file, or None if it is not stored
+        """
+        path = self.path(filename)
+        try:
+            if os.path.getsize(path) == 0:
+                return None
+            # The modification time doubles as the last-used time for eviction
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        """
+        Remove files unused for longer than max_age, then the least recently
+        used ones until the store fits in max_bytes.
+        
+        Args:
+            keep (Optional[str]): Path that must not be removed, e.g. a file just written
+            
+        Returns:
+            int: Number of files removed
+        """
+        with self._lock:
+            entries = []
+            for name in os.listdir(self.directory):
+                path = self.path(name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if os.path.isfile(path) and name.endswith(".mp3"):
+                    entries.append((stat.st_mtime, stat.st_size, path))
+            
+            entries.sort()
+            total = sum(size for _, size, _ in entries)
+            now = time.time()
+            removed = 0
+            for mtime, size, path in entries:
+                if now - mtime <= self.max_age and total <= self.max_bytes:
+                    break
+                if keep and os.path.abspath(path) == os.path.abspath(keep):
+                    continue
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+            return removed
+
+    def clear(self) -> int:
+        """Remove every stored audio file and return how many were removed"""
+        with self._lock:
+            removed = 0
+            for name in os.listdir(self.directory):
+                if name.endswith(".mp3"):
+                    try:
+                        os.remove(self.path(name))
+                        removed += 1
+                    except OSError:
+                        continue
+            return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the number of files and total bytes stored"""
+        sizes = [
+            os.path.getsize(self.path(name))
+            for name in os.listdir(self.directory)
+            if name.endswith(".mp3")
+        ]
+        return {"files": len(sizes), "bytes": sum(sizes), "max_bytes": self.max_bytes}
+
 class TextToSpeech:
-    def __init__(self, language: str = 'hi'):
+    def __init__(self, language: str = 'hi', backend=None):
         """
         Initialize TTS with specified language.
         
         Args:
             language (str): Language code ('hi' for Hindi)
+            backend: Synthesis backend; defaults to the one named by TTS_BACKEND
         """
         self.language = language
-        self.output_dir = "audio_files"
-        
-        # Create output directory if it doesn't exist
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+        self.backend = backend or get_backend()
+        self.store = AudioStore()
+        self.output_dir = self.store.directory
 
     def generate_filename(self, text: str) -> str:
         """Generate a unique filename based on the text content"""
-        # Create a hash of the text to use as filename
-        text_hash = hashlib.md5(text.encode()).hexdigest()[:10]
+        # Create a hash of the text, language and backend to use as filename
+        key = f"{self.backend.name}:{self.language}:{text}"
+        text_hash = hashlib.md5(key.encode()).hexdigest()[:10]
         return f"{text_hash}.mp3"
 
+    def synthesize(self, text: str) -> bytes:
+        """
+        Synthesize text to mp3 bytes, running sentence segments in parallel.
+        
+        Args:
+            text (str): Text to convert to speech
+            
+        Returns:
+            bytes: The joined mp3 audio
+        """
+        segments = split_sentences(text)
+        if len(segments) <= 1:
+            with span("tts_synthesis"):
+                return self.backend.synthesize(text, self.language)
+        
+        workers = min(TTS_MAX_WORKERS, len(segments))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tts") as pool, span("tts_synthesis"):
+            parts = list(pool.map(lambda segment: self.backend.synthesize(segment, self.language), segments))
+        
+        # Keep the first segment's tag and join the rest as raw frames, in order
+        return parts[0] + b"".join(strip_id3(part) for part in parts[1:])
+
     def text_to_speech(self, text: str, output_file: Optional[str] = None) -> str:
         """
         Convert text to speech and save as audio file.
@@ -37,34 +272,50 @@ class TextToSpeech:
             str: Path to the generated audio file
         """
         try:
-            print(f"\nConverting text to Hindi speech...")
-            
-            # Generate output filename if not provided
-            if output_file is None:
-                output_file = os.path.join(self.output_dir, self.generate_filename(text))
+            # Generate output filename if not provided, reusing audio already synthesized for this text
+            content_addressed = output_file is None
+            if content_addressed:
+                filename = self.generate_filename(text)
+                existing = self.store.lookup(filename)
+                if existing:
+                    print(f"✓ Reusing audio file: {existing}")
+                    return existing
+                output_file = self.store.path(filename)
             
-            # Create gTTS object
-            tts = gTTS(text=text, lang=self.language, slow=False)
+            print(f"\nConverting text to Hindi speech ({self.backend.name})...")
+            audio = self.synthesize(text)
             
-            # Save to file
-            tts.save(output_file)
+            # Save to a temporary file first so readers never see a partial mp3
+            directory = os.path.dirname(output_file) or "."
+            fd, temp_path = tempfile.mkstemp(suffix=".part", dir=directory)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(audio)
+                os.replace(temp_path, output_file)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
             print(f"✓ Successfully generated audio file: {output_file}")
             
+            if content_addressed:
+                self.store.evict(keep=output_file)
+            
             return output_file
             
         except Exception as e:
             print(f"✗ Error generating speech: {str(e)}")
+            TTS_FAILURES.inc()
             return ""
 
-    def generate_summary_audio(self, analysis_result: dict) -> str:
+    def summary_text(self, analysis_result: dict) -> str:
         """
-        Generate audio for analysis summary.
+        Build the Hindi text spoken for an analysis summary.
         
         Args:
             analysis_result (dict): Analysis results containing summary
             
         Returns:
-            str: Path to the generated audio file
+            str: Summary with English terms replaced by Hindi equivalents
         """
         # Get the summary text
         summary = analysis_result.get('summary', '')
@@ -86,7 +337,19 @@ class TextToSpeech:
         for eng, hin in translations.items():
             hindi_summary = hindi_summary.replace(eng.lower(), hin)
         
-        return self.text_to_speech(hindi_summary)
+        return hindi_summary
+
+    def generate_summary_audio(self, analysis_result: dict) -> str:
+        """
+        Generate audio for analysis summary.
+        
+        Args:
+            analysis_result (dict): Analysis results containing summary
+            
+        Returns:
+            str: Path to the generated audio file
+        """
+        return self.text_to_speech(self.summary_text(analysis_result))
 
 def process_text(text: str, output_file: Optional[str] = None) -> str:
     """
@@ -0,0 +1,118 @@
+from typing import Any, Dict, List, Optional
+import importlib
+import os
+import threading
+import time
+
+# Reference point for startup timings: when the process first imported this module
+PROCESS_START = time.perf_counter()
+
+# Heavy third-party modules imported during warm-up, in order
+HEAVY_MODULES = [
+    "torch",
+    "transformers",
+    "nltk",
+    "newspaper",
+    "bs4",
+    "matplotlib",
+    "gtts"
+]
+
+# "blocking" finishes warm-up before the server accepts requests;
+# "background" binds immediately and reports readiness on /health
+WARMUP_MODE = os.environ.get("WARMUP_MODE", "blocking")
+
+class StartupReport:
+    """Timings for each warm-up step, measured from process start"""
+
+    def __init__(self):
+        """Initialize an empty report"""
+        self._lock = threading.Lock()
+        self.steps: List[Dict[str, Any]] = []
+        self.ready_at: Optional[float] = None
+        self.error: Optional[str] = None
+
+    def record(self, name: str, seconds: float, ok: bool = True, detail: Optional[str] = None) -> None:
+        """Add a timed step"""
+        with self._lock:
+            self.steps.append({"step": name, "seconds": round(seconds, 4), "ok": ok, "detail": detail})
+
+    def timed(self, name: str, func, *args, **kwargs):
+        """Run func, recording how long it took; failures are recorded and re-raised"""
+        started = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            self.record(name, time.perf_counter() - started, ok=False, detail=str(e))
+            raise
+        self.record(name, time.perf_counter() - started)
+        return result
+
+    @property
+    def ready(self) -> bool:
+        """Whether warm-up has finished"""
+        return self.ready_at is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the report with the total time to readiness"""
+        with self._lock:
+            return {
+                "mode": WARMUP_MODE,
+                "ready": self.ready,
+                "seconds_to_ready": round(self.ready_at - PROCESS_START, 4) if self.ready else None,
+                "error": self.error,
+                "steps": list(self.steps)
+            }
+
+# Shared report for this process
+startup_report = StartupReport()
+
+def warm_up(load_model) -> Dict[str, Any]:
+    """
+    Import heavy dependencies, check NLTK data, start parse workers and load the sentiment model.
+
+    Each step is timed into startup_report. Optional modules that are not
+    installed are recorded as failed steps without stopping warm-up.
+
+    Args:
+        load_model: Callable that loads the sentiment model
+
+    Returns:
+        Dict: The startup report
+    """
+    from news_scraper import ensure_nltk_resources, get_parse_pool
+
+    try:
+        for module in HEAVY_MODULES:
+            try:
+                startup_report.timed(f"import {module}", importlib.import_module, module)
+            except ImportError:
+                pass
+        startup_report.timed("nltk data", ensure_nltk_resources)
+        parse_pool = get_parse_pool()
+        if parse_pool is not None:
+            startup_report.timed("parse workers", parse_pool.start)
+        startup_report.timed("sentiment model", load_model)
+    except Exception as e:
+        startup_report.error = str(e)
+        print(f"✗ Warm-up failed: {str(e)}")
+        raise
+
+    startup_report.ready_at = time.perf_counter()
+    print(f"✓ Warm-up finished {startup_report.ready_at - PROCESS_START:.2f}s after start")
+    return startup_report.to_dict()
+
+def start_warm_up(load_model) -> None:
+    """Run warm_up now or on a background thread, depending on WARMUP_MODE"""
+    if WARMUP_MODE != "background":
+        warm_up(load_model)
+        return
+
+    def run():
+        try:
+            warm_up(load_model)
+        except Exception:
+            # Already recorded in startup_report and reported by /health
+            pass
+
+    threading.Thread(target=run, name="warm-up", daemon=True).start()